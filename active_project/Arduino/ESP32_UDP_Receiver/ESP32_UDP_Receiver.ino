@@ -7,8 +7,20 @@ const char* password = "Star!testing";
 WiFiUDP udp;
 const int udpPort = 4210;
 
+// Client-Anzahl: sofort bei Änderung melden, sonst nur als Heartbeat ("Clients: N;hb=1")
+const unsigned long CLIENT_POLL_MS = 250;          // Rückfall, falls ein WLAN-Event fehlt
+const unsigned long CLIENT_HEARTBEAT_MS = 30000;   // Lebenszeichen für den Host (0 = aus)
+
+volatile bool stationsChanged = true;
+int reportedClients = -1;
+unsigned long lastClientReport = 0;
+
 char incomingPacket[255];
 
+void onStationEvent(WiFiEvent_t event, WiFiEventInfo_t info) {
+  stationsChanged = true;
+}
+
 void setup() {
   Serial.begin(115200);
 
@@ -17,34 +29,92 @@ void setup() {
   Serial.print("✅ ESP32 AP gestartet! IP: ");
   Serial.println(myIP);
 
+  // Station verbunden/getrennt - Anzahl im nächsten loop() melden
+  WiFi.onEvent(onStationEvent, ARDUINO_EVENT_WIFI_AP_STACONNECTED);
+  WiFi.onEvent(onStationEvent, ARDUINO_EVENT_WIFI_AP_STADISCONNECTED);
+
   udp.begin(udpPort);
   Serial.println("Warte auf UDP Nachrichten...");
 }
 
-void loop() {
-  // Anzahl verbundener Clients anzeigen (nur alle 5 Sekunden)
-  static unsigned long lastClientCheck = 0;
-  if (millis() - lastClientCheck > 5000) {
+void printClients(int numClients, bool heartbeat) {
+  Serial.print("Clients: ");
+  Serial.print(numClients);
+  if (heartbeat) {
+    Serial.print(";hb=1");
+  }
+  Serial.println();
+  lastClientReport = millis();
+}
+
+// Nur Änderungen melden - unveränderte Anzahl höchstens alle CLIENT_HEARTBEAT_MS
+void reportClients() {
+  static unsigned long lastClientPoll = 0;
+  if (stationsChanged || millis() - lastClientPoll >= CLIENT_POLL_MS) {
+    stationsChanged = false;
+    lastClientPoll = millis();
     int numClients = WiFi.softAPgetStationNum();
-    Serial.print("Clients: ");
-    Serial.println(numClients);
-    lastClientCheck = millis();
+    if (numClients != reportedClients) {
+      reportedClients = numClients;
+      printClients(numClients, false);
+      return;
+    }
   }
+  if (CLIENT_HEARTBEAT_MS > 0 && millis() - lastClientReport >= CLIENT_HEARTBEAT_MS) {
+    printClients(reportedClients, true);
+  }
+}
 
-  // UDP-Paket prüfen
-  int packetSize = udp.parsePacket();
-  if (packetSize) {
-    int len = udp.read(incomingPacket, sizeof(incomingPacket) - 1);
-    if (len > 0) incomingPacket[len] = '\0';
+// ACK an den Sender zurück: "ACK:<seq>;ts=<ts>" - ts unverändert, der GIGA misst damit die RTT
+void sendAck(const char* fields) {
+  const char* seqField = strstr(fields, ";seq=");
+  const char* tsField = strstr(fields, ";ts=");
+  if (!seqField) return;
 
-    // Empfangene Zahl parsen
-    int receivedNumber = atoi(incomingPacket);
+  char reply[64];
+  snprintf(reply, sizeof(reply), "ACK:%lu;ts=%lu",
+           strtoul(seqField + 5, NULL, 10), tsField ? strtoul(tsField + 4, NULL, 10) : 0UL);
+  udp.beginPacket(udp.remoteIP(), udp.remotePort());
+  udp.write((const uint8_t*)reply, strlen(reply));
+  udp.endPacket();
+}
+
+// Ein Paket an den Mini PC weiterleiten
+// Format: "SIGNAL:X[;seq=..;ts=..];rx=<micros>" - Felder des GIGA werden unverändert angehängt,
+// rx = Empfangszeit im ESP32 für die Latenzmessung am Host
+void forwardPacket(unsigned long rxMicros) {
+  int len = udp.read(incomingPacket, sizeof(incomingPacket) - 1);
+  incomingPacket[len > 0 ? len : 0] = '\0';
+  // Zeilenenden abschneiden, sonst zerreißt die Serial-Zeile
+  incomingPacket[strcspn(incomingPacket, "\r\n")] = '\0';
+
+  // Empfangene Zahl parsen
+  int receivedNumber = atoi(incomingPacket);
+  const char* fields = strchr(incomingPacket, ';');
+
+  // Erst quittieren, dann die (langsamere) Serial-Ausgabe
+  if (fields && strstr(fields, ";ack=1")) {
+    sendAck(fields);
+  }
+
+  Serial.print("SIGNAL:");
+  Serial.print(receivedNumber);
+  if (fields) {
+    Serial.print(fields);
+  }
+  Serial.print(";rx=");
+  Serial.println(rxMicros);
+}
+
+void loop() {
+  // Anzahl verbundener Clients (bei Änderung sofort, sonst Heartbeat)
+  reportClients();
 
-    // Direkte Weiterleitung an Mini PC (Python GUI)
-    // Format: "SIGNAL:X" für bessere Erkennung
-    Serial.print("SIGNAL:");
-    Serial.println(receivedNumber);
+  // Alle wartenden UDP-Pakete abarbeiten - nicht nur eins pro Durchlauf
+  while (udp.parsePacket() > 0) {
+    forwardPacket(micros());
   }
 
-  delay(50); // Schnellere Reaktion für GUI
+  // Kein delay(): loop() kehrt sofort zurück, der Arduino-Core bedient WLAN und Watchdog
+  // zwischen zwei Durchläufen
 }
@@ -7,9 +7,196 @@ const char* password = "Star!testing";      // ESP32 Passwort
 WiFiUDP udp;
 const char* esp32_ip = "192.168.4.1";   // IP des ESP32 SoftAP
 const int udpPort = 4210;
+const int localPort = 4211;             // Hier kommen die ACKs des ESP32 an
+
+// Betriebsart: fester Demo-Zyklus 1..10 (Standard) oder Eingänge (Taster/Sensoren am Stand).
+// MODE_INPUTS sendet erst bei einer Betätigung - bis dahin kein "Gesendet:" auf Serial.
+enum TriggerMode { MODE_INPUTS, MODE_CYCLE };
+const TriggerMode TRIGGER_MODE = MODE_CYCLE;
+
+// Demo-Zyklus: Seitenwechsel alle 2 Sekunden
+const unsigned long SEND_INTERVAL_MS = 2000;
+
+// Eingänge: gemeldet wird die Nummer des Eingangs, welche Seite das wird, entscheidet der Host
+// (--input-map). LEADING meldet sofort und sperrt danach (Taster), TRAILING wartet auf einen
+// stabilen Pegel (Sensoren mit Störimpulsen).
+enum DebounceMode { LEADING, TRAILING };
+struct InputConfig {
+  uint8_t id;
+  uint8_t pin;
+  bool activeLow;              // Taster gegen GND mit INPUT_PULLUP
+  unsigned long debounceMs;
+  DebounceMode debounce;
+  bool reportRelease;          // Loslassen/inaktiv ebenfalls melden
+};
+const InputConfig INPUTS[] = {
+  {1, 2, true, 20, LEADING, false},    // Taster "Start"
+  {2, 3, true, 20, LEADING, false},    // Taster "Weiter"
+  {3, 4, true, 20, LEADING, false},    // Taster "Zurück"
+  {4, 5, false, 150, TRAILING, true},  // Lichtschranke / Bewegungsmelder
+};
+const int NUM_INPUTS = sizeof(INPUTS) / sizeof(INPUTS[0]);
+const int MAX_INPUTS = 8;
+
+// Seiten, deren Wechsel nicht verloren gehen darf - werden bis zum ACK wiederholt
+const int CRITICAL_PAGES[] = {1};
+const unsigned long ACK_TIMEOUT_MS = 100;
+const int MAX_RETRIES = 3;
 
 int numberToSend = 1;
 
+// Paketformat: "<Seite>;seq=<n>;ts=<micros>[;ack=1][;retry=<n>][;rtt=<µs>]"
+// Event-Modus:  "<Eingang>;ev=<1|0>;age=<µs seit Flanke>;seq=..." (immer mit ACK)
+unsigned long seq = 0;
+unsigned long lastRttMicros = 0;        // RTT des letzten ACK, geht mit dem nächsten Paket raus
+
+// Wartet auf ein ACK (höchstens ein Paket gleichzeitig)
+struct PendingPacket {
+  bool active;
+  int number;
+  int ev;                              // -1 = Seite (Zyklus), sonst Flanke des Eingangs
+  unsigned long seq;
+  unsigned long ts;
+  int retries;
+  unsigned long sentAt;
+};
+PendingPacket pending = {false, 0, -1, 0, 0, 0, 0};
+
+// Zustand je Eingang - edgePending/edgeMicros setzt die Interrupt-Routine
+volatile bool edgePending[MAX_INPUTS];
+volatile unsigned long edgeMicros[MAX_INPUTS];
+bool reportedState[MAX_INPUTS];
+unsigned long lastChangeMs[MAX_INPUTS];
+unsigned long lastEdgeAt[MAX_INPUTS];   // micros() der letzten Flanke - für age im Paket
+
+bool isCritical(int number) {
+  for (unsigned int i = 0; i < sizeof(CRITICAL_PAGES) / sizeof(CRITICAL_PAGES[0]); i++) {
+    if (CRITICAL_PAGES[i] == number) return true;
+  }
+  return false;
+}
+
+void sendPacket(int number, int ev, unsigned long age, unsigned long packetSeq, unsigned long ts, bool ack, int retry) {
+  char msg[128];
+  int len = snprintf(msg, sizeof(msg), "%d", number);
+  if (ev >= 0) len += snprintf(msg + len, sizeof(msg) - len, ";ev=%d;age=%lu", ev, age);
+  len += snprintf(msg + len, sizeof(msg) - len, ";seq=%lu;ts=%lu", packetSeq, ts);
+  if (ack) len += snprintf(msg + len, sizeof(msg) - len, ";ack=1");
+  if (retry > 0) len += snprintf(msg + len, sizeof(msg) - len, ";retry=%d", retry);
+  if (lastRttMicros > 0) {
+    snprintf(msg + len, sizeof(msg) - len, ";rtt=%lu", lastRttMicros);
+    lastRttMicros = 0;
+  }
+
+  udp.beginPacket(esp32_ip, udpPort);
+  udp.write((const uint8_t*)msg, strlen(msg));
+  udp.endPacket();
+
+  Serial.print("Gesendet: ");
+  Serial.println(msg);
+}
+
+void sendPage(int number) {
+  seq++;
+  unsigned long ts = micros();
+  bool ack = isCritical(number);
+  sendPacket(number, -1, 0, seq, ts, ack, 0);
+  // Ein neuer Seitenwechsel ersetzt eine noch offene Wiederholung
+  pending = {ack, number, -1, seq, ts, 0, millis()};
+}
+
+// Eingangs-Event sofort senden - Besucher warten, also immer mit ACK/Wiederholung
+void sendInput(int inputId, bool active, unsigned long edgeAt) {
+  seq++;
+  unsigned long ts = micros();
+  int ev = active ? 1 : 0;
+  sendPacket(inputId, ev, ts - edgeAt, seq, ts, true, 0);
+  pending = {true, inputId, ev, seq, ts, 0, millis()};
+}
+
+// Eine Interrupt-Routine je Eingang (attachInterrupt übergibt keinen Parameter)
+template <int I>
+void onEdge() {
+  edgeMicros[I] = micros();
+  edgePending[I] = true;
+}
+void (*const EDGE_HANDLERS[MAX_INPUTS])() = {
+  onEdge<0>, onEdge<1>, onEdge<2>, onEdge<3>, onEdge<4>, onEdge<5>, onEdge<6>, onEdge<7>,
+};
+
+bool readActive(int i) {
+  return (digitalRead(INPUTS[i].pin) == HIGH) != INPUTS[i].activeLow;
+}
+
+void setupInputs() {
+  for (int i = 0; i < NUM_INPUTS && i < MAX_INPUTS; i++) {
+    pinMode(INPUTS[i].pin, INPUTS[i].activeLow ? INPUT_PULLUP : INPUT);
+    reportedState[i] = readActive(i);
+    lastChangeMs[i] = millis() - INPUTS[i].debounceMs;
+    lastEdgeAt[i] = micros();
+    edgePending[i] = false;
+    attachInterrupt(digitalPinToInterrupt(INPUTS[i].pin), EDGE_HANDLERS[i], CHANGE);
+  }
+}
+
+// Entprellen und nur Änderungen melden
+void pollInputs() {
+  unsigned long now = millis();
+  for (int i = 0; i < NUM_INPUTS && i < MAX_INPUTS; i++) {
+    const InputConfig& input = INPUTS[i];
+    noInterrupts();
+    bool edge = edgePending[i];
+    if (edge) lastEdgeAt[i] = edgeMicros[i];
+    edgePending[i] = false;
+    interrupts();
+
+    if (input.debounce == TRAILING && edge) {
+      // Pegel muss nach der letzten Flanke debounceMs lang stabil bleiben
+      lastChangeMs[i] = now;
+      continue;
+    }
+    // LEADING: Sperrzeit nach der gemeldeten Flanke, Prellen darin wird ignoriert
+    if (now - lastChangeMs[i] < input.debounceMs) continue;
+
+    bool active = readActive(i);
+    if (active == reportedState[i]) continue;
+    reportedState[i] = active;
+    lastChangeMs[i] = now;
+    if (active || input.reportRelease) {
+      sendInput(input.id, active, lastEdgeAt[i]);
+    }
+  }
+}
+
+// ACKs des ESP32 lesen: "ACK:<seq>;ts=<micros>"
+void readAcks() {
+  while (udp.parsePacket() > 0) {
+    char reply[64];
+    int len = udp.read(reply, sizeof(reply) - 1);
+    reply[len > 0 ? len : 0] = '\0';
+    if (strncmp(reply, "ACK:", 4) != 0) continue;
+
+    unsigned long ackSeq = strtoul(reply + 4, NULL, 10);
+    const char* tsField = strstr(reply, ";ts=");
+    if (tsField) lastRttMicros = micros() - strtoul(tsField + 4, NULL, 10);
+    if (pending.active && ackSeq == pending.seq) pending.active = false;
+  }
+}
+
+void retransmit() {
+  if (!pending.active || millis() - pending.sentAt < ACK_TIMEOUT_MS) return;
+  if (pending.retries >= MAX_RETRIES) {
+    Serial.print("⚠️ Kein ACK für seq ");
+    Serial.println(pending.seq);
+    pending.active = false;
+    return;
+  }
+  // Gleiche seq und ts - der Empfänger erkennt Duplikate daran
+  pending.retries++;
+  pending.sentAt = millis();
+  sendPacket(pending.number, pending.ev, 0, pending.seq, pending.ts, true, pending.retries);
+}
+
 void setup() {
   Serial.begin(115200);
   WiFi.begin(ssid, password);
@@ -25,21 +212,28 @@ void setup() {
 
   Serial.print("Verbunden mit SSID: ");
   Serial.println(WiFi.SSID());
-}
 
-void loop() {
-  char msg[5];
-  sprintf(msg, "%d", numberToSend);
-
-  udp.beginPacket(esp32_ip, udpPort);
-  udp.write(msg);
-  udp.endPacket();
+  udp.begin(localPort);
 
-  Serial.print("Gesendet: ");
-  Serial.println(msg);
+  if (TRIGGER_MODE == MODE_INPUTS) {
+    setupInputs();
+  }
+}
 
-  numberToSend++;
-  if (numberToSend > 10) numberToSend = 1;
+void loop() {
+  if (TRIGGER_MODE == MODE_INPUTS) {
+    pollInputs();
+  } else {
+    static unsigned long lastSend = 0;
+    if (lastSend == 0 || millis() - lastSend >= SEND_INTERVAL_MS) {
+      sendPage(numberToSend);
+      numberToSend++;
+      if (numberToSend > 10) numberToSend = 1;
+      lastSend = millis();
+    }
+  }
 
-  delay(2000);
+  // Ohne delay(), damit ACKs und Wiederholungen rechtzeitig bearbeitet werden
+  readAcks();
+  retransmit();
 }
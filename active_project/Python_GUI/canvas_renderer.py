@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Canvas Renderer
+Zeichnet eine Multimedia-Seite auf ein einziges tk.Canvas mit festen Item-IDs -
+ein Seitenwechsel ändert nur Inhalte/Koordinaten statt Widget-Bäume neu aufzubauen
+"""
+
+import os
+import tkinter as tk
+from collections import OrderedDict
+
+from PIL import Image, ImageTk
+
+from page_content import HEADER_HEIGHT, VIDEO_TEXT_HEIGHT, content_area, find_page_image, plain_text
+
+VIDEO_PLACEHOLDER_TEXT = ("🎬 VIDEO BEREICH\n\nVideo-Unterstützung wird implementiert\n\n"
+                          "Unterstützte Formate:\n• MP4\n• AVI\n• MOV")
+
+# Anzahl skalierter Bilder im Cache
+IMAGE_CACHE_SIZE = 20
+
+
+class CanvasPageRenderer:
+    def __init__(self, parent, colors, fonts):
+        self.colors = colors
+        self.fonts = fonts
+        self.canvas = tk.Canvas(parent, bg=colors['background_tertiary'], highlightthickness=0, borderwidth=0)
+        self.canvas.pack(fill='both', expand=True)
+
+        self.config = None
+        self.page_dir = None
+        self._size = (0, 0)
+        self._applied = {}
+        self._photos = OrderedDict()
+        self.stats = {'renders': 0, 'item_updates': 0, 'item_skips': 0}
+
+        # Feste Items - werden nur einmal erzeugt und danach nur noch verändert
+        c = self.canvas
+        self.items = {
+            'header': c.create_rectangle(0, 0, 0, 0, fill=colors['background_secondary'], width=0),
+            'title': c.create_text(0, 0, anchor='n', font=fonts['display'], fill=colors['text_primary']),
+            'subtitle': c.create_text(0, 0, anchor='n', font=fonts['subtitle'], fill=colors['accent_primary']),
+            'body_bg': c.create_rectangle(0, 0, 0, 0, fill=colors['background_secondary'], width=0),
+            'body': c.create_text(0, 0, anchor='nw', font=fonts['label'], fill=colors['text_primary']),
+            'video_box': c.create_rectangle(0, 0, 0, 0, fill=colors['background_secondary'],
+                                            outline=colors['text_secondary'], width=2),
+            'video_text': c.create_text(0, 0, anchor='center', font=fonts['subtitle'],
+                                        fill=colors['text_secondary'], justify='center',
+                                        text=VIDEO_PLACEHOLDER_TEXT),
+            'image': c.create_image(0, 0, anchor='center'),
+            'image_text': c.create_text(0, 0, anchor='center', font=fonts['label'], justify='center'),
+        }
+
+        self.canvas.bind('<Configure>', self._on_configure)
+
+    def _on_configure(self, event):
+        if (event.width, event.height) != self._size and self.config is not None:
+            self.render(self.config, self.page_dir)
+
+    # --- Item-Updates (nur bei Änderung) -----------------------------------
+
+    def _set(self, name, coords=None, **options):
+        """Item nur anfassen, wenn sich Koordinaten oder Optionen wirklich ändern"""
+        item = self.items[name]
+        applied = self._applied.setdefault(name, {})
+        touched = False
+        if coords is not None and applied.get('coords') != coords:
+            self.canvas.coords(item, *coords)
+            applied['coords'] = coords
+            touched = True
+        changed = {key: value for key, value in options.items() if applied.get(key) != value}
+        if changed:
+            self.canvas.itemconfigure(item, **changed)
+            applied.update(changed)
+            touched = True
+        self.stats['item_updates' if touched else 'item_skips'] += 1
+
+    def _hide(self, *names):
+        for name in names:
+            self._set(name, state='hidden')
+
+    # --- Layout --------------------------------------------------------------
+
+    def render(self, config, page_dir):
+        """Seite darstellen - nur Inhalte und Positionen der festen Items werden aktualisiert.
+
+        Gibt True zurück (der Canvas kann jedes Layout darstellen).
+        """
+        self.config = config
+        self.page_dir = page_dir
+        self.stats['renders'] += 1
+
+        width = max(self.canvas.winfo_width(), 1)
+        height = max(self.canvas.winfo_height(), 1)
+        self._size = (width, height)
+
+        # Header mit Titel/Untertitel
+        self._set('header', (0, 0, width, HEADER_HEIGHT))
+        self._set('title', (width // 2, 12), text=config.get('title', 'Titel'), state='normal')
+        if config.get('subtitle'):
+            self._set('subtitle', (width // 2, 52), text=config['subtitle'], state='normal')
+        else:
+            self._hide('subtitle')
+
+        area = content_area(width, height)
+        left, top, right, bottom = area
+
+        layout = config.get('layout', 'text_only')
+        if layout == 'image_text':
+            middle = (left + right) // 2
+            self._layout_image((left, top, middle - 10, bottom))
+            self._layout_text((middle + 10, top, right, bottom))
+            self._hide('video_box', 'video_text')
+        elif layout == 'video_text':
+            split = max(top, bottom - VIDEO_TEXT_HEIGHT - 20)
+            self._layout_video((left, top, right, split))
+            self._layout_text((left, split + 20, right, bottom))
+            self._hide('image', 'image_text')
+        elif layout == 'fullscreen_image':
+            self._layout_image(area)
+            self._hide('body_bg', 'body', 'video_box', 'video_text')
+        elif layout == 'fullscreen_video':
+            self._layout_video(area)
+            self._hide('body_bg', 'body', 'image', 'image_text')
+        else:
+            self._layout_text(area)
+            self._hide('image', 'image_text', 'video_box', 'video_text')
+        return True
+
+    def _layout_text(self, box):
+        left, top, right, bottom = box
+        # Rand wie im Widget-Renderer: Frame (15) + Text-Innenabstand (15)
+        self._set('body_bg', (left + 15, top + 15, right - 15, bottom - 15), state='normal')
+        self._set('body', (left + 30, top + 30),
+                  text=plain_text(self.config),
+                  width=max(1, right - left - 60), state='normal')
+
+    def _layout_video(self, box):
+        left, top, right, bottom = box
+        self._set('video_box', box, state='normal')
+        self._set('video_text', ((left + right) // 2, (top + bottom) // 2), state='normal')
+
+    def _layout_image(self, box):
+        left, top, right, bottom = box
+        center = ((left + right) // 2, (top + bottom) // 2)
+        image_path = find_page_image(self.config, self.page_dir)
+
+        if image_path:
+            try:
+                photo = self._photo(image_path, max(1, right - left), max(1, bottom - top))
+                self._set('image', center, image=photo, state='normal')
+                self._hide('image_text')
+                return
+            except Exception as e:
+                message, color = f"🖼️ Bild konnte nicht geladen werden\n{e}", self.colors['accent_tertiary']
+        else:
+            message = "🖼️ Kein Bild verfügbar\n\nFügen Sie Bilder in den Ordner hinzu:\n" + self.page_dir
+            color = self.colors['text_secondary']
+
+        self._hide('image')
+        self._set('image_text', center, text=message, fill=color, width=max(1, right - left), state='normal')
+
+    def _photo(self, image_path, max_width, max_height):
+        """Skaliertes PhotoImage aus dem Cache (Schlüssel: Pfad, Änderungszeit, Zielgröße)"""
+        key = (image_path, os.path.getmtime(image_path), max_width, max_height)
+        photo = self._photos.get(key)
+        if photo is not None:
+            self._photos.move_to_end(key)
+            return photo
+
+        with Image.open(image_path) as image:
+            image.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+            photo = ImageTk.PhotoImage(image)
+        self._photos[key] = photo
+        while len(self._photos) > IMAGE_CACHE_SIZE:
+            self._photos.popitem(last=False)
+        return photo
+
+    def destroy(self):
+        self.canvas.destroy()
+        self._photos.clear()
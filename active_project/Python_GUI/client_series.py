@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Client-Verlauf
+Das ESP32 meldet "Clients: N" nur noch bei Änderungen und sonst als Heartbeat ("Clients: N;hb=1").
+Hier landen die Änderungen als Zeitreihe - Statuspanel, Statistik und /api/metrics zeigen daraus
+Trend und Auslastung, ohne zusätzliche Serial-Zeilen oder Tk-Updates.
+"""
+
+import threading
+import time
+from collections import deque
+
+import metrics
+
+# Wie CLIENT_HEARTBEAT_MS im ESP32-Sketch (--client-heartbeat, 0 = Sketch sendet keinen Heartbeat)
+HEARTBEAT_SECONDS = 30.0
+# Ohne Meldung nach so vielen Heartbeat-Intervallen gilt der Wert als veraltet
+STALE_FACTOR = 2.5
+# Änderungen im Speicher (reicht bei Messebetrieb für Stunden)
+SERIES_CAPACITY = 2048
+TREND_WINDOW = 600.0
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+class ClientSeries:
+    """Änderungspunkte (Zeit, Anzahl) in einem Ringpuffer - thread-sicher"""
+
+    def __init__(self, capacity=SERIES_CAPACITY, heartbeat_seconds=HEARTBEAT_SECONDS):
+        # 0/None: kein Heartbeat erwartet - Ruhe heißt dann nur "keine Änderung", nie "veraltet"
+        self.heartbeat_seconds = heartbeat_seconds
+        self.points = deque(maxlen=capacity)
+        self.stats = {'reports': 0, 'changes': 0, 'heartbeats': 0}
+        self.last_seen = None
+        self._lock = threading.Lock()
+        self._reports = {kind: metrics.counter('bertrandt_client_reports_total', 'Client-Meldungen des ESP32',
+                                               kind=kind)
+                         for kind in ('change', 'repeat')}
+        metrics.gauge('bertrandt_clients', 'Verbundene Stationen am ESP32').set_function(lambda: self.current)
+
+    @property
+    def current(self):
+        with self._lock:
+            return self.points[-1][1] if self.points else None
+
+    def record(self, count, now=None, heartbeat=False):
+        """Meldung übernehmen; True nur bei geänderter Anzahl (dann lohnt ein UI-Update)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self.stats['reports'] += 1
+            if heartbeat:
+                self.stats['heartbeats'] += 1
+            self.last_seen = now
+            if self.points and self.points[-1][1] == count:
+                self._reports['repeat'].inc()
+                return False
+            self.points.append((now, count))
+            self.stats['changes'] += 1
+        self._reports['change'].inc()
+        return True
+
+    def stale(self, now=None):
+        """Länger keine Meldung als erwartet (ESP32 weg oder Serial hängt)"""
+        if not self.heartbeat_seconds:
+            return False
+        now = time.time() if now is None else now
+        return self.last_seen is not None and now - self.last_seen > self.heartbeat_seconds * STALE_FACTOR
+
+    def buckets(self, window=TREND_WINDOW, count=20, now=None):
+        """Höchstwert je Zeitabschnitt über window Sekunden (None vor der ersten Meldung)"""
+        now = time.time() if now is None else now
+        start = now - window
+        step = window / count
+        with self._lock:
+            points = list(self.points)
+        values = []
+        index = 0
+        value = None
+        for bucket in range(count):
+            bucket_start = start + bucket * step
+            bucket_end = bucket_start + step
+            # Stand am Anfang des Abschnitts, dann alle Änderungen darin
+            while index < len(points) and points[index][0] <= bucket_start:
+                value = points[index][1]
+                index += 1
+            peak = value
+            while index < len(points) and points[index][0] < bucket_end:
+                value = points[index][1]
+                peak = value if peak is None else max(peak, value)
+                index += 1
+            values.append(peak)
+        return values
+
+    def trend(self, window=TREND_WINDOW, now=None):
+        """Min/Max/zeitgewichteter Mittelwert und Änderung über window Sekunden"""
+        now = time.time() if now is None else now
+        start = now - window
+        with self._lock:
+            points = list(self.points)
+        if not points:
+            return None
+        # Stand zu Beginn des Fensters und alle Änderungen danach
+        before = [p for p in points if p[0] <= start]
+        inside = [p for p in points if p[0] > start]
+        segments = ([(start, before[-1][1])] if before else []) + inside
+        weighted = 0.0
+        for (t, value), (t_next, _) in zip(segments, segments[1:] + [(now, None)]):
+            weighted += value * (t_next - t)
+        covered = now - segments[0][0]
+        values = [value for _, value in segments]
+        return {'current': points[-1][1], 'min': min(values), 'max': max(values),
+                'avg': round(weighted / covered, 2) if covered > 0 else float(points[-1][1]),
+                'delta': points[-1][1] - segments[0][1], 'changes': len(inside), 'window': window}
+
+    def sparkline(self, window=TREND_WINDOW, width=20, now=None):
+        values = self.buckets(window, width, now)
+        known = [value for value in values if value is not None]
+        if not known:
+            return ""
+        top = max(max(known), 1)
+        return "".join(" " if value is None else SPARK_CHARS[min(len(SPARK_CHARS) - 1,
+                                                                  value * (len(SPARK_CHARS) - 1) // top)]
+                       for value in values)
+
+    def summary(self, window=TREND_WINDOW):
+        with self._lock:
+            stats = dict(self.stats)
+            last_seen = self.last_seen
+        return dict(stats, trend=self.trend(window), stale=self.stale(),
+                    last_seen_ago=round(time.time() - last_seen, 1) if last_seen else None)
+
+
+def add_arguments(parser):
+    """--client-heartbeat für GUI und CLI"""
+    parser.add_argument('--client-heartbeat', type=float, default=HEARTBEAT_SECONDS,
+                        help='Sekunden zwischen "Clients: N;hb=1" wie CLIENT_HEARTBEAT_MS im ESP32-Sketch '
+                             '(0 = kein Heartbeat, keine "veraltet"-Warnung)')
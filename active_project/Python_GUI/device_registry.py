@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Device Registry
+Live-Liste der angeschlossenen USB-Serial Geräte mit Hotplug-Erkennung
+"""
+
+import os
+import select
+import sys
+import threading
+import time
+
+# USB VID/PID der unterstützten Boards
+USB_IDS = {
+    # USB-UART Bridges der gängigen ESP32 DevKits (CP210x, CH340, CH9102, FTDI, nativ)
+    'ESP32': [(0x10C4, 0xEA60), (0x1A86, 0x7523), (0x1A86, 0x55D4),
+              (0x0403, 0x6001), (0x303A, 0x1001)],
+    # Arduino GIGA R1 WiFi (Sketch-Modus und Bootloader)
+    'GIGA': [(0x2341, 0x0266), (0x2341, 0x0366)],
+}
+
+# inotify Konstanten (linux/inotify.h)
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+
+
+def identify_board(vid, pid):
+    """Board-Typ anhand USB VID/PID bestimmen (None falls unbekannt)"""
+    for kind, ids in USB_IDS.items():
+        if (vid, pid) in ids:
+            return kind
+    return None
+
+
+def guess_board_from_name(device):
+    """Fallback für unbekannte VID/PID: typische Gerätenamen"""
+    if '/dev/ttyACM' in device or '/dev/cu.usbmodem' in device:
+        return 'GIGA'
+    if '/dev/ttyUSB' in device or '/dev/cu.usbserial' in device:
+        return 'ESP32'
+    return None
+
+
+class DeviceRegistry:
+    def __init__(self, poll_interval=1.0):
+        self.poll_interval = poll_interval
+        self.running = False
+        self.monitor_mode = None
+        self._devices = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+        self._monitor_thread = None
+        self._udev_observer = None
+        self.refresh()
+
+    def refresh(self):
+        """Einmalige Enumeration über list_ports und Änderungen melden"""
+        # pyserial erst hier - der Import der GUI/CLI bleibt schlank
+        from serial.tools import list_ports
+
+        found = {}
+        for port in list_ports.comports():
+            # Nur USB-Geräte (entspricht den früheren ttyUSB*/ttyACM*/cu.* Mustern)
+            if port.vid is None:
+                continue
+            found[port.device] = {
+                'port': port.device,
+                'kind': identify_board(port.vid, port.pid),
+                'vid': f"{port.vid:04X}",
+                'pid': f"{port.pid:04X}",
+                'serial_number': port.serial_number,
+                'description': port.description,
+            }
+
+        with self._lock:
+            added = [info for device, info in found.items() if device not in self._devices]
+            removed = [info for device, info in self._devices.items() if device not in found]
+            self._devices = found
+            listeners = list(self._listeners)
+
+        for event, infos in (('remove', removed), ('add', added)):
+            for info in infos:
+                for callback in listeners:
+                    callback(event, info)
+
+        return bool(added or removed)
+
+    def devices(self, kind=None):
+        """Aktuelle Geräte (optional nach Typ gefiltert), sortiert nach Port"""
+        with self._lock:
+            infos = list(self._devices.values())
+        if kind:
+            infos = [info for info in infos if info['kind'] == kind]
+        return sorted(infos, key=lambda info: info['port'])
+
+    def ports(self):
+        return [info['port'] for info in self.devices()]
+
+    def get(self, port):
+        with self._lock:
+            return self._devices.get(port)
+
+    def find(self, kind, guess=True):
+        """Ersten Port eines Board-Typs finden, ggf. per Gerätename raten"""
+        devices = self.devices(kind)
+        if devices:
+            return devices[0]['port']
+        if guess:
+            for info in self.devices():
+                if info['kind'] is None and guess_board_from_name(info['port']) == kind:
+                    return info['port']
+        return None
+
+    def add_listener(self, callback):
+        """callback(event, info) mit event 'add'/'remove' - läuft im Monitor-Thread"""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def start(self):
+        """Hotplug-Überwachung starten (udev > inotify > /dev Polling)"""
+        if self.running:
+            return
+        self.running = True
+
+        # Optional: udev-Events direkt vom Kernel (pip install pyudev)
+        try:
+            import pyudev
+        except ImportError:
+            pyudev = None
+        if pyudev is not None:
+            try:
+                context = pyudev.Context()
+                monitor = pyudev.Monitor.from_netlink(context)
+                monitor.filter_by(subsystem='tty')
+                self._udev_observer = pyudev.MonitorObserver(monitor, callback=self._on_udev_event,
+                                                             name='device-registry-udev')
+                self._udev_observer.daemon = True
+                self._udev_observer.start()
+                self.monitor_mode = 'udev'
+                return
+            except Exception:
+                self._udev_observer = None
+
+        self._monitor_thread = threading.Thread(target=self._watch_devices,
+                                                name='device-registry',
+                                                daemon=True)
+        self._monitor_thread.start()
+
+    def stop(self):
+        self.running = False
+        if self._udev_observer:
+            self._udev_observer.stop()
+            self._udev_observer = None
+
+    def _on_udev_event(self, device):
+        # udev meldet den Knoten bevor list_ports alle Attribute sieht - kurz bündeln
+        time.sleep(0.2)
+        self.refresh()
+
+    def _watch_devices(self):
+        if sys.platform.startswith('linux') and self._watch_inotify():
+            return
+        self._watch_dev_mtime()
+
+    def _watch_inotify(self):
+        """Linux: /dev per inotify beobachten, nur bei Änderungen neu enumerieren"""
+        import ctypes
+        import ctypes.util
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return False
+        if fd < 0:
+            return False
+        if libc.inotify_add_watch(fd, b'/dev', IN_CREATE | IN_DELETE) < 0:
+            os.close(fd)
+            return False
+
+        self.monitor_mode = 'inotify'
+        try:
+            while self.running:
+                ready, _, _ = select.select([fd], [], [], 1.0)
+                if not ready:
+                    continue
+                os.read(fd, 4096)
+                # Mehrere Events (Knoten, Symlinks, Rechte) zu einem Refresh bündeln
+                time.sleep(0.2)
+                while select.select([fd], [], [], 0)[0]:
+                    os.read(fd, 4096)
+                self.refresh()
+        finally:
+            os.close(fd)
+        return True
+
+    def _watch_dev_mtime(self):
+        """Fallback: Änderungszeit von /dev prüfen statt ständig neu zu scannen"""
+        self.monitor_mode = 'poll'
+        last_mtime = None
+        while self.running:
+            try:
+                mtime = os.stat('/dev').st_mtime_ns
+            except OSError:
+                mtime = None  # z.B. Windows: regelmäßig enumerieren
+            if mtime is None or mtime != last_mtime:
+                last_mtime = mtime
+                self.refresh()
+            time.sleep(self.poll_interval)
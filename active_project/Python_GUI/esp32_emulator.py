@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Bertrandt ESP32 Emulator
+Pseudo-Terminal, das sich wie ESP32_UDP_Receiver.ino verhält: Boot-Banner, UDP-Pakete des GIGA
+als 'SIGNAL:X;rx=<micros>' weiterleiten (Felder wie seq/ts unverändert, ack=1 wird quittiert),
+'Clients: N' bei Änderung und sonst alle 30 s als Heartbeat ('Clients: N;hb=1'). Mit legacy=True wie die alte
+Firmware (delay(50), ein Paket je loop(), ohne Zeitstempel, 'Clients: N' fest alle 5 s). GUI und CLI lesen es über
+--esp32-port wie ein echtes Board - damit laufen read_serial_data, setup_serial und monitor_signals ohne Hardware.
+"""
+
+import argparse
+import os
+import select
+import socket
+import threading
+import time
+
+from load_generator import PtySink
+from log_setup import get_logger
+from signal_protocol import ack_packet, parse_line
+
+UDP_PORT = 4210
+AP_IP = "192.168.4.1"
+# Alte Firmware: delay(50) pro loop(), höchstens ein Paket je Durchlauf
+LEGACY_LOOP_DELAY_MS = 50
+LEGACY_CLIENT_INTERVAL = 5.0
+# Wie CLIENT_HEARTBEAT_MS und CLIENT_POLL_MS im Sketch
+CLIENT_HEARTBEAT = 30.0
+CLIENT_POLL = 0.25
+# UART 8N1: 10 Bit je Byte
+BITS_PER_BYTE = 10
+
+logger = get_logger('emulator')
+
+
+def atoi(text):
+    """C-atoi wie im Sketch: führende Leerzeichen, Vorzeichen, Ziffern - sonst 0"""
+    text = text.lstrip(' \t\n\r\v\f')
+    sign = 1
+    if text[:1] in ('+', '-'):
+        sign = -1 if text[0] == '-' else 1
+        text = text[1:]
+    digits = ''
+    for char in text:
+        if not '0' <= char <= '9':
+            break
+        digits += char
+    return sign * int(digits) if digits else 0
+
+
+class ESP32Emulator:
+    """Firmware-Schleife in einem Thread; Ausgabe über einen pty, Eingang per UDP"""
+
+    def __init__(self, udp_port=UDP_PORT, udp_host='127.0.0.1', clients=0, client_interval=None,
+                 legacy=False, baud=None, link=None):
+        self.udp_address = (udp_host, udp_port)
+        self.clients = clients
+        # Heartbeat bzw. (legacy) festes Meldeintervall der Client-Anzahl
+        self.client_interval = client_interval or (LEGACY_CLIENT_INTERVAL if legacy else CLIENT_HEARTBEAT)
+        self._reported_clients = None
+        self.legacy = legacy
+        # Mit baud (z.B. 115200) dauert jede Zeile so lange wie auf der echten Leitung
+        self.baud = baud
+        self.link = link
+        self.pty = None
+        self.sock = None
+        self.port = None
+        self.running = False
+        self._thread = None
+        self.stats = {'packets': 0, 'lines': 0, 'bytes': 0, 'acks': 0}
+        self._boot_time = time.perf_counter()
+
+    def start(self):
+        """pty und UDP-Socket öffnen, Banner ausgeben, loop() starten; gibt den Port zurück"""
+        self.pty = PtySink()
+        self.port = self.pty.port
+        if self.link:
+            # Fester Pfad für Skripte (z.B. /tmp/ttyESP32), der pty-Name wechselt bei jedem Start
+            if os.path.islink(self.link):
+                os.unlink(self.link)
+            os.symlink(self.port, self.link)
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(self.udp_address)
+        self.sock.setblocking(False)
+        self.udp_address = self.sock.getsockname()
+
+        self.boot()
+        self.running = True
+        self._thread = threading.Thread(target=self._loop, name='esp32-emulator', daemon=True)
+        self._thread.start()
+        logger.info("📟 ESP32-Emulator: %s, UDP %s:%s", self.port, *self.udp_address)
+        return self.port
+
+    def stop(self):
+        self.running = False
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self.sock:
+            self.sock.close()
+        if self.pty:
+            self.pty.close()
+        if self.link and os.path.islink(self.link):
+            os.unlink(self.link)
+
+    def boot(self):
+        """setup() des Sketches - auch wie ein Reset erneut aufrufbar (pyserial leert beim Öffnen den Puffer)"""
+        self.println(f"✅ ESP32 AP gestartet! IP: {AP_IP}")
+        self.println("Warte auf UDP Nachrichten...")
+
+    def micros(self):
+        """32-Bit µs-Zähler seit dem Start wie micros() im ESP32"""
+        return int((time.perf_counter() - self._boot_time) * 1_000_000) & 0xFFFFFFFF
+
+    def set_clients(self, count):
+        """Anzahl verbundener Stationen - wie ein WLAN-Event sofort gemeldet (legacy: beim nächsten Intervall)"""
+        self.clients = count
+
+    def println(self, text):
+        """Serial.println - liest der Host nicht mit, gehen Zeilen wie beim USB-UART verloren"""
+        self.pty.send(text)
+        self.stats['lines'] += 1
+        size = len(text.encode('utf-8')) + 2
+        self.stats['bytes'] += size
+        if self.baud:
+            time.sleep(size * BITS_PER_BYTE / self.baud)
+
+    def _report_clients(self, last_report):
+        """reportClients() des Sketches; gibt den Zeitpunkt der letzten Meldung zurück"""
+        now = time.monotonic()
+        if self.legacy:
+            if now - last_report >= self.client_interval:
+                self.println(f"Clients: {self.clients}")
+                return now
+        elif self.clients != self._reported_clients:
+            self._reported_clients = self.clients
+            self.println(f"Clients: {self.clients}")
+            return now
+        elif now - last_report >= self.client_interval:
+            self.println(f"Clients: {self.clients};hb=1")
+            return now
+        return last_report
+
+    def _loop(self):
+        last_client_check = time.monotonic()
+        while self.running:
+            last_client_check = self._report_clients(last_client_check)
+
+            if self.legacy:
+                # Höchstens ein UDP-Paket je Durchlauf, Rest bleibt im Socket-Puffer
+                self._forward_packet(legacy=True)
+                time.sleep(LEGACY_LOOP_DELAY_MS / 1000)
+                continue
+
+            # Die Firmware dreht loop() ohne Pause - hier wartet select() bis zum nächsten Paket
+            # bzw. zur nächsten Client-Meldung, das Ergebnis ist dasselbe
+            # Höchstens CLIENT_POLL_MS warten, damit set_clients() zeitnah gemeldet wird
+            timeout = max(0.0, last_client_check + self.client_interval - time.monotonic())
+            try:
+                readable, _, _ = select.select([self.sock], [], [], min(timeout, CLIENT_POLL))
+            except (OSError, ValueError):
+                break
+            # Alle wartenden Pakete abarbeiten
+            while readable and self._forward_packet():
+                pass
+
+    def _forward_packet(self, legacy=False):
+        """Ein Paket lesen und weiterleiten; False, wenn keins wartet"""
+        try:
+            packet, sender = self.sock.recvfrom(254)
+        except BlockingIOError:
+            return False
+        except OSError:
+            self.running = False
+            return False
+        rx = self.micros()
+        self.stats['packets'] += 1
+        text = packet.decode('latin-1').split('\r')[0].split('\n')[0]
+        number = atoi(text)
+        if legacy:
+            self.println(f"SIGNAL:{number}")
+            return True
+
+        fields = text[text.index(';'):] if ';' in text else ''
+        if ';ack=1' in fields:
+            event = parse_line(text)
+            if event['type'] == 'signal' and 'seq' in event:
+                self.stats['acks'] += 1
+                self.sock.sendto(ack_packet(event), sender)
+        self.println(f"SIGNAL:{number}{fields};rx={rx}")
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ESP32_UDP_Receiver als Pseudo-Terminal (ohne Hardware)')
+    parser.add_argument('--udp-port', type=int, default=UDP_PORT, help='UDP-Port wie im Sketch (0 = frei wählen)')
+    parser.add_argument('--udp-host', default='127.0.0.1', help='0.0.0.0 = auch Pakete aus dem Netz annehmen')
+    parser.add_argument('--clients', type=int, default=0, help='Gemeldete Client-Anzahl')
+    parser.add_argument('--heartbeat', type=float, default=None,
+                        help='Sekunden zwischen Heartbeats (legacy: festes Intervall, Standard 30 bzw. 5)')
+    parser.add_argument('--legacy', action='store_true', help='Alte Firmware: delay(50), ein Paket je loop()')
+    parser.add_argument('--baud', type=int, default=None, help='Ausgabe auf echte UART-Zeit drosseln, z.B. 115200')
+    parser.add_argument('--link', default=None, help='Symlink auf den pty, z.B. /tmp/ttyESP32')
+    args = parser.parse_args()
+
+    import log_setup
+    log_setup.setup_logging(log_file=None)
+
+    emulator = ESP32Emulator(args.udp_port, args.udp_host, args.clients, args.heartbeat,
+                             legacy=args.legacy, baud=args.baud, link=args.link)
+    port = emulator.start()
+    logger.info("➡️  python3 Bertrandt_GUI.py --esp32-port %s", args.link or port)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        emulator.stop()
+        logger.info("📟 Emulator beendet: %s Pakete, %s Zeilen", emulator.stats['packets'], emulator.stats['lines'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Flash Runner
+Führt arduino-cli aus und streamt die Ausgabe zeilenweise (mit Fortschritt und Abbruch)
+"""
+
+import collections
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import metrics
+
+# esptool: "Writing at 0x00010000... (12 %)" / dfu-util: "Download [=====   ]  36%"
+PROGRESS_PATTERN = re.compile(r'(\d{1,3})(?:\.\d+)?\s*%')
+LINE_SEPARATORS = re.compile(rb'[\r\n]')
+
+# Sehr lange Zeilen ohne Umbruch werden hier abgeschnitten (konstanter Speicher)
+MAX_PARTIAL_LINE = 64 * 1024
+
+# arduino-cli startet esptool/dfu-util als Kindprozess - eigene Prozessgruppe, damit Abbruch alle trifft
+PROCESS_GROUPS = sys.platform != "win32"
+
+# FQBN, Arduino-Core und Sketch-Ordner (unter Arduino/) der Messe-Boards
+BOARDS = {
+    'ESP32': {'fqbn': 'esp32:esp32:esp32', 'core': 'esp32:esp32', 'sketch': 'ESP32_UDP_Receiver'},
+    'GIGA': {'fqbn': 'arduino:mbed_giga:giga', 'core': 'arduino:mbed_giga', 'sketch': 'GIGA_UDP_Sender'},
+}
+
+ARDUINO_CLI_INSTALL_URL = "https://raw.githubusercontent.com/arduino/arduino-cli/master/install.sh"
+
+
+def compile_command(kind, sketch_path, output_dir=None):
+    """arduino-cli compile für einen Board-Typ"""
+    cmd = ['arduino-cli', 'compile', '--fqbn', BOARDS[kind]['fqbn']]
+    if output_dir:
+        cmd += ['--output-dir', output_dir]
+    return cmd + [sketch_path]
+
+
+def upload_command(kind, port, sketch_path, input_dir=None):
+    """arduino-cli upload für einen Board-Typ"""
+    cmd = ['arduino-cli', 'upload', '-p', port, '--fqbn', BOARDS[kind]['fqbn']]
+    if input_dir:
+        cmd += ['--input-dir', input_dir]
+    return cmd + [sketch_path]
+
+
+def board_of_command(cmd):
+    """Board-Typ (ESP32/GIGA) eines arduino-cli Kommandos anhand der FQBN"""
+    if '--fqbn' in cmd[:-1]:
+        fqbn = cmd[cmd.index('--fqbn') + 1]
+        for kind, board in BOARDS.items():
+            if board['fqbn'] == fqbn:
+                return kind
+    return 'unknown'
+
+
+def arduino_cli_available():
+    """Prüft ob arduino-cli aufrufbar ist"""
+    try:
+        return subprocess.run(['arduino-cli', 'version'], capture_output=True, timeout=10).returncode == 0
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+
+
+def install_arduino_cli():
+    """arduino-cli und die Cores aller Boards installieren (CalledProcessError bei Fehler)"""
+    subprocess.run(f"curl -fsSL {ARDUINO_CLI_INSTALL_URL} | sh", shell=True, check=True)
+    subprocess.run(['arduino-cli', 'core', 'update-index'], check=True)
+    for board in BOARDS.values():
+        subprocess.run(['arduino-cli', 'core', 'install', board['core']], check=True)
+
+
+class FlashCancelled(Exception):
+    """Flash-Vorgang wurde vom Benutzer abgebrochen"""
+
+
+class FlashProcess:
+    def __init__(self, cmd, on_line=None, on_progress=None, max_lines=200):
+        self.cmd = cmd
+        self.on_line = on_line
+        self.on_progress = on_progress
+        # Nur die letzten Zeilen behalten - auch bei sehr langen Verbose-Logs
+        self.tail = collections.deque(maxlen=max_lines)
+        self.process = None
+        self.returncode = None
+        self.cancelled = False
+        self.timed_out = False
+        self._lock = threading.Lock()
+
+    def run(self, timeout=None):
+        """Prozess starten und blockierend bis zum Ende lesen (im Worker-Thread aufrufen)"""
+        started = time.perf_counter()
+        result = 'error'
+        try:
+            returncode = self._run(timeout)
+            result = 'ok' if returncode == 0 else 'error'
+            return returncode
+        except FlashCancelled:
+            result = 'cancelled'
+            raise
+        except subprocess.TimeoutExpired:
+            result = 'timeout'
+            raise
+        finally:
+            self._observe(result, started)
+
+    def _observe(self, result, started):
+        """Dauer je Board, Schritt (compile/upload) und Ergebnis"""
+        if metrics.REGISTRY.enabled:
+            metrics.histogram('bertrandt_flash_seconds', 'Dauer von arduino-cli compile/upload',
+                              board=board_of_command(self.cmd), step=self.cmd[1] if len(self.cmd) > 1 else '',
+                              result=result).observe(time.perf_counter() - started)
+
+    def _run(self, timeout):
+        with self._lock:
+            if self.cancelled:
+                raise FlashCancelled()
+            self.process = subprocess.Popen(self.cmd,
+                                            stdout=subprocess.PIPE,
+                                            stderr=subprocess.STDOUT,
+                                            bufsize=0,
+                                            start_new_session=PROCESS_GROUPS)
+
+        timer = None
+        if timeout:
+            timer = threading.Timer(timeout, self._on_timeout)
+            timer.daemon = True
+            timer.start()
+
+        try:
+            self._read_output()
+            self.returncode = self.process.wait()
+        finally:
+            if timer:
+                timer.cancel()
+
+        if self.cancelled:
+            raise FlashCancelled()
+        if self.timed_out:
+            raise subprocess.TimeoutExpired(self.cmd, timeout)
+        return self.returncode
+
+    def _read_output(self):
+        """stdout in Blöcken lesen und an \\r bzw. \\n in Zeilen teilen"""
+        partial = b''
+        stream = self.process.stdout
+        while True:
+            chunk = stream.read(4096)
+            if not chunk:
+                break
+            parts = LINE_SEPARATORS.split(partial + chunk)
+            partial = parts.pop()
+            if len(partial) > MAX_PARTIAL_LINE:
+                parts.append(partial)
+                partial = b''
+            for raw in parts:
+                self._handle_line(raw)
+        if partial:
+            self._handle_line(partial)
+
+    def _handle_line(self, raw):
+        line = raw.decode('utf-8', errors='replace').strip()
+        if not line:
+            return
+        self.tail.append(line)
+        if self.on_line:
+            self.on_line(line)
+        if self.on_progress:
+            match = PROGRESS_PATTERN.search(line)
+            if match:
+                self.on_progress(min(100, int(match.group(1))))
+
+    def _on_timeout(self):
+        self.timed_out = True
+        self._terminate()
+
+    def cancel(self):
+        """Laufenden Flash-Vorgang abbrechen (thread-sicher)"""
+        with self._lock:
+            self.cancelled = True
+            if self.process:
+                self._terminate()
+
+    def _terminate(self):
+        if not self.process:
+            return
+        # Auch wenn arduino-cli schon weg ist: esptool/dfu-util hält sonst stdout offen
+        if self._signal(hard=False):
+            # Hängende Uploads (z.B. esptool wartet auf Boot-Button) notfalls hart beenden
+            killer = threading.Timer(3, self._kill)
+            killer.daemon = True
+            killer.start()
+
+    def _kill(self):
+        if self.process:
+            self._signal(hard=True)
+
+    def _signal(self, hard):
+        """SIGTERM/SIGKILL an die ganze Prozessgruppe (False, wenn nichts mehr läuft)"""
+        if PROCESS_GROUPS:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL if hard else signal.SIGTERM)
+                return True
+            except (ProcessLookupError, PermissionError):
+                return False
+        if self.process.poll() is not None:
+            return False
+        if hard:
+            self.process.kill()
+        else:
+            self.process.terminate()
+        return True
+
+    def error_tail(self, lines=15):
+        """Letzte Ausgabezeilen für Fehlermeldungen"""
+        return "\n".join(list(self.tail)[-lines:])
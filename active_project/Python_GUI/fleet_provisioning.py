@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Fleet Provisioning
+Flasht und prüft viele Messe-Kits (ESP32 + Arduino GIGA) von einem Host aus
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import serial
+
+from device_registry import DeviceRegistry
+from flash_runner import BOARDS, FlashProcess, compile_command, upload_command
+from log_setup import level_logger
+
+# Board-Definitionen (FQBN, Sketch-Ordner) plus erwartete Boot-Ausgaben
+BOARD_TYPES = {
+    'ESP32': dict(BOARDS['ESP32'], smoke_patterns=['ESP32 AP gestartet', 'Warte auf UDP', 'Clients:']),
+    'GIGA': dict(BOARDS['GIGA'], smoke_patterns=['Verbinde mit WiFi', 'WiFi verbunden', 'Gesendet:']),
+}
+
+
+def discover_boards(registry=None):
+    """Alle angeschlossenen ESP32/GIGA Boards (Erkennung über USB VID/PID)"""
+    registry = registry or DeviceRegistry()
+    return [info for info in registry.devices() if info['kind'] in BOARD_TYPES]
+
+
+class FleetProvisioner:
+    def __init__(self, arduino_dir, max_workers=4, smoke_timeout=15, log=None):
+        self.arduino_dir = arduino_dir
+        self.max_workers = max(1, max_workers)
+        self.smoke_timeout = smoke_timeout
+        self.log = log or level_logger('fleet')
+        self.build_dirs = {}
+        self._log_lock = threading.Lock()
+
+    def _log(self, message, level="INFO"):
+        # Worker-Threads loggen parallel - Ausgabe serialisieren
+        with self._log_lock:
+            self.log(message, level)
+
+    def compile_all(self, kinds):
+        """Jeden Sketch genau einmal kompilieren - alle Boards eines Typs teilen das Build"""
+        for kind in sorted(kinds):
+            board = BOARD_TYPES[kind]
+            build_dir = tempfile.mkdtemp(prefix=f"bertrandt_{kind.lower()}_")
+            # Sofort eintragen, damit cleanup() das Verzeichnis auch nach einem Fehler entfernt
+            self.build_dirs[kind] = build_dir
+            self._log(f"Kompiliere {kind} Code ({board['fqbn']})...", "INFO")
+            process = FlashProcess(compile_command(kind, os.path.join(self.arduino_dir, board['sketch']),
+                                                   output_dir=build_dir))
+
+            try:
+                returncode = process.run(timeout=300)
+            except subprocess.TimeoutExpired:
+                self._log(f"{kind} Kompilier-Timeout (300 s)", "ERROR")
+                return False
+            except OSError as e:
+                # z.B. FileNotFoundError: arduino-cli nicht installiert
+                self._log(f"{kind} Kompilierung nicht möglich: {e}", "ERROR")
+                return False
+            if returncode != 0:
+                self._log(f"{kind} Kompilier-Fehler:\n{process.error_tail()}", "ERROR")
+                return False
+        return True
+
+    def cleanup(self):
+        """Temporäre Build-Verzeichnisse entfernen"""
+        for build_dir in self.build_dirs.values():
+            shutil.rmtree(build_dir, ignore_errors=True)
+        self.build_dirs.clear()
+
+    def provision_board(self, board):
+        """Ein Board flashen und anschließend per Serial prüfen"""
+        kind = board['kind']
+        port = board['port']
+        result = dict(board, flashed=False, smoke_test=False, error=None)
+        start = time.time()
+
+        try:
+            self._log(f"🔥 {kind} auf {port}: Upload...", "INFO")
+            upload = FlashProcess(upload_command(kind, port, os.path.join(self.arduino_dir, BOARD_TYPES[kind]['sketch']),
+                                                 input_dir=self.build_dirs[kind]), max_lines=20)
+
+            returncode = upload.run(timeout=120)
+            result['flash_seconds'] = round(time.time() - start, 1)
+            if returncode != 0:
+                result['error'] = upload.error_tail(5)
+                self._log(f"{kind} auf {port}: Upload fehlgeschlagen", "ERROR")
+                return result
+            result['flashed'] = True
+
+            ok, lines = self.smoke_test(port, kind)
+            result['smoke_test'] = ok
+            result['smoke_output'] = lines
+            if ok:
+                self._log(f"{kind} auf {port}: Flash + Smoke-Test OK 🎉", "SUCCESS")
+            else:
+                result['error'] = "Keine erwartete Boot-Ausgabe empfangen"
+                self._log(f"{kind} auf {port}: Smoke-Test fehlgeschlagen", "WARNING")
+
+        except subprocess.TimeoutExpired:
+            result['error'] = "Upload Timeout"
+            self._log(f"{kind} auf {port}: Upload Timeout", "ERROR")
+        except Exception as e:
+            result['error'] = str(e)
+            self._log(f"{kind} auf {port}: Fehler: {e}", "ERROR")
+        finally:
+            result['total_seconds'] = round(time.time() - start, 1)
+
+        return result
+
+    def smoke_test(self, port, kind):
+        """Nach dem Flash Serial-Ausgabe lesen und auf erwartete Meldungen prüfen"""
+        patterns = BOARD_TYPES[kind]['smoke_patterns']
+        deadline = time.time() + self.smoke_timeout
+        lines = []
+
+        # Nach dem Upload meldet sich das Board u.U. kurz neu am USB an
+        connection = None
+        while connection is None and time.time() < deadline:
+            try:
+                connection = serial.Serial(port, 115200, timeout=0.5)
+            except serial.SerialException:
+                time.sleep(0.5)
+        if connection is None:
+            return False, lines
+
+        try:
+            while time.time() < deadline:
+                line = connection.readline().decode('utf-8', errors='replace').strip()
+                if not line:
+                    continue
+                lines.append(line)
+                if any(pattern in line for pattern in patterns):
+                    return True, lines[-5:]
+        finally:
+            connection.close()
+
+        return False, lines[-5:]
+
+    def run(self, boards=None):
+        """Alle Boards parallel (begrenzter Worker-Pool) provisionieren"""
+        boards = discover_boards() if boards is None else boards
+        if not boards:
+            self._log("Keine ESP32/GIGA Boards gefunden", "WARNING")
+            return []
+
+        self._log(f"Gefundene Boards: {len(boards)} "
+                  f"({', '.join(b['kind'] + '@' + b['port'] for b in boards)})", "SUCCESS")
+
+        try:
+            if not self.compile_all({b['kind'] for b in boards}):
+                return [dict(b, flashed=False, smoke_test=False, error="Kompilierung fehlgeschlagen")
+                        for b in boards]
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(self.provision_board, boards))
+        finally:
+            self.cleanup()
+
+        ok_count = sum(1 for r in results if r['flashed'] and r['smoke_test'])
+        level = "SUCCESS" if ok_count == len(results) else "WARNING"
+        self._log(f"Provisionierung abgeschlossen: {ok_count}/{len(results)} Boards OK", level)
+        return results
+
+    def write_report(self, results, path=None):
+        """Provisionierungs-Report als JSON schreiben"""
+        if path is None:
+            path = f"provisioning_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+        report = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'boards_total': len(results),
+            'boards_ok': sum(1 for r in results if r['flashed'] and r['smoke_test']),
+            'boards': results,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+        self._log(f"Report geschrieben: {path}", "SUCCESS")
+        return path
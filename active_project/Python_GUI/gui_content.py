@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+"""
+Bertrandt GUI - Content
+Content Creator, Content Manager und Ordnerstruktur der Seiten
+"""
+
+import json
+import os
+import sys
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from page_content import page_directory, load_page_config
+
+
+class ContentEditorMixin:
+    """Seiteninhalte anlegen, bearbeiten und im Dateimanager öffnen"""
+
+    def show_content_creator(self):
+        """Content Creator anzeigen - Erweiterte Content-Erstellung im Hauptfenster"""
+        # Multimedia-Display temporär ausblenden
+        if hasattr(self, 'content_frame'):
+            self.content_frame.pack_forget()
+
+        # Content Creator Frame erstellen
+        self.creator_frame = tk.Frame(self.content_frame.master, bg=self.colors['background_tertiary'], relief='flat', borderwidth=2)
+        self.creator_frame.pack(fill='both', expand=True, pady=(0, 10))
+
+        # Header
+        header_frame = tk.Frame(self.creator_frame, bg=self.colors['background_secondary'], height=60)
+        header_frame.pack(fill='x')
+        header_frame.pack_propagate(False)
+
+        header_label = tk.Label(header_frame,
+                               text="✨ CONTENT CREATOR",
+                               font=self.fonts['title'],
+                               fg=self.colors['accent_primary'],
+                               bg=self.colors['background_secondary'])
+        header_label.pack(pady=15)
+
+        # Zurück Button
+        back_btn = tk.Button(header_frame,
+                            text="← Zurück",
+                            font=self.fonts['button'],
+                            bg=self.colors['background_tertiary'],
+                            fg=self.colors['text_primary'],
+                            relief='flat',
+                            borderwidth=0,
+                            padx=15,
+                            pady=5,
+                            activebackground=self.colors['accent_primary'],
+                            activeforeground=self.colors['text_primary'],
+                            command=self.hide_content_creator)
+        back_btn.place(x=20, y=15)
+
+        # Main Content Frame
+        main_frame = tk.Frame(self.creator_frame, bg=self.colors['background_tertiary'])
+        main_frame.pack(fill='both', expand=True, padx=20, pady=10)
+
+        # Left Panel - Seiten-Auswahl
+        left_panel = tk.Frame(main_frame, bg=self.colors['background_secondary'], width=200)
+        left_panel.pack(side='left', fill='y', padx=(0, 10))
+        left_panel.pack_propagate(False)
+
+        # Seiten-Liste
+        pages_label = tk.Label(left_panel,
+                              text="📄 SEITEN",
+                              font=self.fonts['button'],
+                              fg=self.colors['text_primary'],
+                              bg=self.colors['background_secondary'])
+        pages_label.pack(pady=10)
+
+        # Seiten-Buttons
+        self.creator_selected_page = tk.IntVar(value=1)
+        for signal_id, signal_info in self.signal_definitions.items():
+            page_btn = tk.Radiobutton(left_panel,
+                                     text=f"{signal_info['icon']} {signal_id}. {signal_info['name']}",
+                                     variable=self.creator_selected_page,
+                                     value=signal_id,
+                                     font=self.fonts['label'],
+                                     bg=self.colors['background_secondary'],
+                                     fg=self.colors['text_primary'],
+                                     selectcolor=signal_info['color'],
+                                     activebackground=self.colors['background_secondary'],
+                                     command=lambda: self.update_creator_content())
+            page_btn.pack(fill='x', padx=10, pady=2)
+
+        # Right Panel - Content Editor
+        right_panel = tk.Frame(main_frame, bg=self.colors['background_secondary'])
+        right_panel.pack(side='right', fill='both', expand=True)
+
+        # Editor Header
+        editor_header = tk.Frame(right_panel, bg=self.colors['accent_primary'], height=40)
+        editor_header.pack(fill='x')
+        editor_header.pack_propagate(False)
+
+        self.creator_page_title = tk.Label(editor_header,
+                                          text="Seite 1 - Willkommen",
+                                          font=self.fonts['button'],
+                                          fg=self.colors['text_primary'],
+                                          bg=self.colors['accent_primary'])
+        self.creator_page_title.pack(pady=10)
+
+        # Editor Content
+        editor_content = tk.Frame(right_panel, bg=self.colors['background_secondary'])
+        editor_content.pack(fill='both', expand=True, padx=15, pady=15)
+
+        # Titel Editor
+        tk.Label(editor_content,
+                text="📝 Titel:",
+                font=self.fonts['label'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['background_secondary']).pack(anchor='w')
+
+        self.creator_title_entry = tk.Entry(editor_content,
+                                           font=self.fonts['body'],
+                                           bg=self.colors['background_tertiary'],
+                                           fg=self.colors['text_primary'],
+                                           insertbackground=self.colors['text_primary'])
+        self.creator_title_entry.pack(fill='x', pady=(5, 15))
+
+        # Untertitel Editor
+        tk.Label(editor_content,
+                text="📄 Untertitel:",
+                font=self.fonts['label'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['background_secondary']).pack(anchor='w')
+
+        self.creator_subtitle_entry = tk.Entry(editor_content,
+                                              font=self.fonts['body'],
+                                              bg=self.colors['background_tertiary'],
+                                              fg=self.colors['text_primary'],
+                                              insertbackground=self.colors['text_primary'])
+        self.creator_subtitle_entry.pack(fill='x', pady=(5, 15))
+
+        # Layout Auswahl
+        tk.Label(editor_content,
+                text="🎨 Layout:",
+                font=self.fonts['label'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['background_secondary']).pack(anchor='w')
+
+        self.creator_layout_var = tk.StringVar(value="text_only")
+        layout_frame = tk.Frame(editor_content, bg=self.colors['background_secondary'])
+        layout_frame.pack(fill='x', pady=(5, 15))
+
+        layouts = [
+            ("📝 Nur Text", "text_only"),
+            ("🖼️ Bild + Text", "image_text"),
+            ("🎬 Video + Text", "video_text"),
+            ("🖼️ Vollbild Bild", "fullscreen_image"),
+            ("🎬 Vollbild Video", "fullscreen_video")
+        ]
+
+        for i, (text, value) in enumerate(layouts):
+            tk.Radiobutton(layout_frame,
+                          text=text,
+                          variable=self.creator_layout_var,
+                          value=value,
+                          font=self.fonts['label'],
+                          bg=self.colors['background_secondary'],
+                          fg=self.colors['text_primary'],
+                          selectcolor=self.colors['background_tertiary'],
+                          activebackground=self.colors['background_secondary']).pack(anchor='w')
+
+        # Text Editor
+        tk.Label(editor_content,
+                text="📝 Inhalt:",
+                font=self.fonts['label'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['background_secondary']).pack(anchor='w')
+
+        text_frame = tk.Frame(editor_content, bg=self.colors['background_secondary'])
+        text_frame.pack(fill='both', expand=True, pady=(5, 15))
+
+        self.creator_text_widget = tk.Text(text_frame,
+                                          font=self.fonts['body'],
+                                          bg=self.colors['background_tertiary'],
+                                          fg=self.colors['text_primary'],
+                                          insertbackground=self.colors['text_primary'],
+                                          wrap=tk.WORD,
+                                          height=10)
+
+        text_scrollbar = tk.Scrollbar(text_frame, orient='vertical', command=self.creator_text_widget.yview)
+        self.creator_text_widget.configure(yscrollcommand=text_scrollbar.set)
+
+        self.creator_text_widget.pack(side='left', fill='both', expand=True)
+        text_scrollbar.pack(side='right', fill='y')
+
+        # Buttons
+        button_frame = tk.Frame(self.creator_frame, bg=self.colors['background_tertiary'])
+        button_frame.pack(fill='x', padx=20, pady=20)
+
+        ttk.Button(button_frame,
+                  text="💾 SPEICHERN",
+                  style='Success.TButton',
+                  command=self.save_creator_content).pack(side='left', padx=(0, 10))
+
+        ttk.Button(button_frame,
+                  text="👁️ VORSCHAU",
+                  style='Primary.TButton',
+                  command=self.preview_creator_content).pack(side='left', padx=(0, 10))
+
+        ttk.Button(button_frame,
+                  text="📁 ORDNER ÖFFNEN",
+                  style='Secondary.TButton',
+                  command=self.open_creator_folder).pack(side='left', padx=(0, 10))
+
+        ttk.Button(button_frame,
+                  text="🏠 HAUPTANSICHT",
+                  style='Warning.TButton',
+                  command=self.hide_content_creator).pack(side='right')
+
+        # Erste Seite laden
+        self.creator_active = True
+        self.update_creator_content()
+
+    def hide_content_creator(self):
+        """Content Creator ausblenden und zur Hauptansicht zurückkehren"""
+        if hasattr(self, 'creator_frame'):
+            self.creator_frame.destroy()
+
+        # Multimedia-Display wieder anzeigen
+        if hasattr(self, 'content_frame'):
+            self.content_frame.pack(fill='both', expand=True, pady=(0, 10))
+
+        self.creator_active = False
+        # Aktuelle Seite neu laden
+        self.load_content_page(self.current_page)
+
+    def update_creator_content(self):
+        """Content Creator Inhalt aktualisieren"""
+        if not hasattr(self, 'creator_active') or not self.creator_active:
+            return
+
+        page_id = self.creator_selected_page.get()
+        signal_info = self.signal_definitions[page_id]
+
+        # Header aktualisieren
+        self.creator_page_title.config(text=f"Seite {page_id} - {signal_info['name']}")
+
+        # Content laden
+        content_type = signal_info['content_type']
+        page_dir = page_directory(self.content_dir, page_id, content_type)
+        config = load_page_config(page_dir, {
+            "title": signal_info['name'],
+            "subtitle": f"Seite {page_id} - {signal_info['name']}",
+            "text_content": f"Inhalt für Seite {page_id}",
+            "layout": "text_only"
+        })
+
+        # Felder füllen
+        self.creator_title_entry.delete(0, tk.END)
+        self.creator_title_entry.insert(0, config.get('title', ''))
+
+        self.creator_subtitle_entry.delete(0, tk.END)
+        self.creator_subtitle_entry.insert(0, config.get('subtitle', ''))
+
+        self.creator_layout_var.set(config.get('layout', 'text_only'))
+
+        self.creator_text_widget.delete('1.0', tk.END)
+        self.creator_text_widget.insert('1.0', config.get('text_content', ''))
+
+    def save_creator_content(self):
+        """Content Creator Inhalt speichern"""
+        page_id = self.creator_selected_page.get()
+        signal_info = self.signal_definitions[page_id]
+        content_type = signal_info['content_type']
+        page_dir = page_directory(self.content_dir, page_id, content_type)
+
+        if not os.path.exists(page_dir):
+            os.makedirs(page_dir)
+
+        # Markup-Einstellung aus der bestehenden config.json übernehmen
+        text_format = load_page_config(page_dir, {}).get('text_format')
+
+        config = {
+            "title": self.creator_title_entry.get(),
+            "subtitle": self.creator_subtitle_entry.get(),
+            "layout": self.creator_layout_var.get(),
+            "text_content": self.creator_text_widget.get('1.0', tk.END).strip(),
+            "background_image": "",
+            "video": "",
+            "images": []
+        }
+        if text_format:
+            config['text_format'] = text_format
+
+        config_path = os.path.join(page_dir, "config.json")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, indent=2, ensure_ascii=False)
+
+        messagebox.showinfo("Erfolg", f"Seite {page_id} wurde gespeichert!")
+
+    def preview_creator_content(self):
+        """Content Creator Vorschau anzeigen"""
+        page_id = self.creator_selected_page.get()
+        # Zur Hauptansicht wechseln und Seite anzeigen
+        self.hide_content_creator()
+        self.load_content_page(page_id)
+
+    def open_creator_folder(self):
+        """Content Creator Ordner öffnen"""
+        page_id = self.creator_selected_page.get()
+        signal_info = self.signal_definitions[page_id]
+        content_type = signal_info['content_type']
+        page_dir = page_directory(self.content_dir, page_id, content_type)
+
+        if not os.path.exists(page_dir):
+            os.makedirs(page_dir)
+
+        self.open_page_folder(page_dir)
+
+    def ensure_content_structure(self):
+        """Content-Ordnerstruktur erstellen"""
+        if not os.path.exists(self.content_dir):
+            os.makedirs(self.content_dir)
+
+        # Unterordner für jeden Content-Typ erstellen
+        for signal_id, signal_info in self.signal_definitions.items():
+            content_type = signal_info['content_type']
+            page_dir = page_directory(self.content_dir, signal_id, content_type)
+            if not os.path.exists(page_dir):
+                os.makedirs(page_dir)
+
+                # Beispiel-Konfiguration erstellen
+                config = {
+                    "title": signal_info['name'],
+                    "subtitle": f"Seite {signal_id} - {signal_info['name']}",
+                    "background_image": "",
+                    "video": "",
+                    "text_content": f"Willkommen auf Seite {signal_id}: {signal_info['name']}\n\nHier können Sie Inhalte hinzufügen:\n• Bilder\n• Videos\n• Texte\n\nBearbeiten Sie die config.json in:\n{page_dir}",
+                    "images": [],
+                    "layout": "text_only"  # text_only, image_text, video_text, fullscreen_image, fullscreen_video
+                }
+
+                config_path = os.path.join(page_dir, "config.json")
+                with open(config_path, 'w', encoding='utf-8') as f:
+                    json.dump(config, f, indent=2, ensure_ascii=False)
+
+    def show_content_manager(self):
+        """Content Manager anzeigen"""
+        content_window = tk.Toplevel(self.root)
+        content_window.title("Content Manager")
+        content_window.geometry("800x600")
+        content_window.configure(bg=self.colors['background_primary'])
+
+        # Header
+        header_label = tk.Label(content_window,
+                               text="🎬 CONTENT MANAGER",
+                               font=self.fonts['title'],
+                               fg=self.colors['text_primary'],
+                               bg=self.colors['background_primary'])
+        header_label.pack(pady=20)
+
+        # Info
+        info_label = tk.Label(content_window,
+                             text="Verwalten Sie Multimedia-Inhalte für alle 10 Seiten",
+                             font=self.fonts['subtitle'],
+                             fg=self.colors['accent_primary'],
+                             bg=self.colors['background_primary'])
+        info_label.pack(pady=(0, 20))
+
+        # Content-Ordner anzeigen
+        content_frame = tk.Frame(content_window, bg=self.colors['background_tertiary'])
+        content_frame.pack(fill='both', expand=True, padx=20, pady=20)
+
+        # Scrollbare Liste
+        canvas = tk.Canvas(content_frame, bg=self.colors['background_tertiary'])
+        scrollbar = ttk.Scrollbar(content_frame, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.colors['background_tertiary'])
+
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Content für jede Seite anzeigen
+        for signal_id, signal_info in self.signal_definitions.items():
+            self.create_content_item(scrollable_frame, signal_id, signal_info)
+
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        # Buttons
+        button_frame = tk.Frame(content_window, bg=self.colors['background_primary'])
+        button_frame.pack(fill='x', padx=20, pady=20)
+
+        ttk.Button(button_frame,
+                  text="📁 CONTENT-ORDNER ÖFFNEN",
+                  style='Primary.TButton',
+                  command=self.open_content_folder).pack(side='left', padx=(0, 10))
+
+        ttk.Button(button_frame,
+                  text="🔄 CONTENT NEULADEN",
+                  style='Success.TButton',
+                  command=lambda: self.load_content_page(self.current_page)).pack(side='left', padx=(0, 10))
+
+        ttk.Button(button_frame,
+                  text="❌ SCHLIESSEN",
+                  style='Warning.TButton',
+                  command=content_window.destroy).pack(side='right')
+
+    def create_content_item(self, parent, signal_id, signal_info):
+        """Content-Item für eine Seite erstellen"""
+        item_frame = tk.Frame(parent, bg=self.colors['background_secondary'], relief='solid', borderwidth=1)
+        item_frame.pack(fill='x', pady=5, padx=10)
+
+        # Header
+        header_frame = tk.Frame(item_frame, bg=signal_info['color'], height=30)
+        header_frame.pack(fill='x')
+        header_frame.pack_propagate(False)
+
+        header_label = tk.Label(header_frame,
+                               text=f"{signal_info['icon']} Seite {signal_id}: {signal_info['name']}",
+                               font=self.fonts['button'],
+                               fg=self.colors['text_primary'],
+                               bg=signal_info['color'])
+        header_label.pack(pady=5)
+
+        # Content Info
+        content_frame = tk.Frame(item_frame, bg=self.colors['background_secondary'])
+        content_frame.pack(fill='x', padx=10, pady=10)
+
+        # Ordner-Pfad
+        content_type = signal_info['content_type']
+        page_dir = page_directory(self.content_dir, signal_id, content_type)
+
+        path_label = tk.Label(content_frame,
+                             text=f"📁 {page_dir}",
+                             font=self.fonts['label'],
+                             fg=self.colors['text_secondary'],
+                             bg=self.colors['background_secondary'],
+                             anchor='w')
+        path_label.pack(fill='x')
+
+        # Dateien auflisten
+        if os.path.exists(page_dir):
+            files = os.listdir(page_dir)
+            if files:
+                files_text = "📄 Dateien: " + ", ".join(files[:3])
+                if len(files) > 3:
+                    files_text += f" ... (+{len(files)-3} weitere)"
+            else:
+                files_text = "📄 Keine Dateien"
+        else:
+            files_text = "📄 Ordner nicht gefunden"
+
+        files_label = tk.Label(content_frame,
+                              text=files_text,
+                              font=self.fonts['label'],
+                              fg=self.colors['text_primary'],
+                              bg=self.colors['background_secondary'],
+                              anchor='w')
+        files_label.pack(fill='x')
+
+        # Buttons
+        btn_frame = tk.Frame(content_frame, bg=self.colors['background_secondary'])
+        btn_frame.pack(fill='x', pady=(5, 0))
+
+        ttk.Button(btn_frame,
+                  text="📁 ÖFFNEN",
+                  command=lambda: self.open_page_folder(page_dir)).pack(side='left', padx=(0, 5))
+
+        ttk.Button(btn_frame,
+                  text="👁️ VORSCHAU",
+                  command=lambda: self.load_content_page(signal_id)).pack(side='left')
+
+    def open_content_folder(self):
+        """Haupt-Content-Ordner öffnen"""
+        self.open_page_folder(self.content_dir)
+
+    def open_page_folder(self, page_dir):
+        """Spezifischen Seiten-Ordner im Dateimanager öffnen"""
+        import subprocess
+
+        if not os.path.exists(page_dir):
+            os.makedirs(page_dir)
+
+        if sys.platform == "darwin":  # macOS
+            subprocess.run(["open", page_dir])
+        elif sys.platform == "win32":  # Windows
+            subprocess.run(["explorer", page_dir])
+        else:  # Linux
+            subprocess.run(["xdg-open", page_dir])
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Bertrandt GUI - Dev Mode
+Simulierte Signale und automatische Demo, wenn keine Hardware angeschlossen ist
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from log_setup import get_logger
+
+logger = get_logger('devmode')
+
+
+class DevModeMixin:
+    """Demo-Betrieb ohne ESP32"""
+
+    def start_dev_mode(self):
+        """Dev Mode starten - Simuliert Arduino-Signale"""
+        logger.info("🔧 Dev Mode gestartet - Simuliere Arduino-Signale...")
+
+        # Dev Mode Info anzeigen
+        self.show_dev_mode_info()
+
+        # Automatische Demo starten (optional) - aber erst nach GUI-Initialisierung
+        self.scheduler.after(1000, self.start_auto_demo)
+
+    def show_dev_mode_info(self):
+        """Dev Mode Information anzeigen"""
+        dev_info = tk.Toplevel(self.root)
+        dev_info.title("🔧 Dev Mode")
+        dev_info.geometry("500x400")
+        dev_info.configure(bg=self.colors['background_primary'])
+
+        # Header
+        header_label = tk.Label(dev_info,
+                               text="🔧 ENTWICKLERMODUS AKTIV",
+                               font=self.fonts['title'],
+                               fg=self.colors['accent_warning'],
+                               bg=self.colors['background_primary'])
+        header_label.pack(pady=20)
+
+        # Info Text
+        info_text = """
+Keine Arduino/ESP32 Hardware gefunden!
+
+Der Dev Mode ist aktiviert mit folgenden Features:
+
+🎮 GUI-STEUERUNG:
+• Klicken Sie auf die Seiten-Buttons (1-10)
+• Nutzen Sie die Navigations-Karten
+• Verwenden Sie die Schnellzugriff-Buttons
+
+🤖 AUTO-DEMO:
+• Automatischer Seitenwechsel alle 5 Sekunden
+• Zeigt alle Multimedia-Inhalte
+• Perfekt zum Testen und Präsentationen
+
+🛠️ ENTWICKLUNG:
+• Alle Multimedia-Features verfügbar
+• Content Manager funktioniert normal
+• Kein Arduino/ESP32 erforderlich
+• Vollständig buttonbasierte Bedienung
+
+Schließen Sie Hardware an und starten Sie neu
+für den normalen Betrieb mit Arduino-Steuerung.
+        """
+
+        info_label = tk.Label(dev_info,
+                             text=info_text,
+                             font=self.fonts['label'],
+                             fg=self.colors['text_primary'],
+                             bg=self.colors['background_primary'],
+                             justify='left')
+        info_label.pack(padx=20, pady=10)
+
+        # Buttons
+        button_frame = tk.Frame(dev_info, bg=self.colors['background_primary'])
+        button_frame.pack(fill='x', padx=20, pady=20)
+
+        ttk.Button(button_frame,
+                  text="🤖 AUTO-DEMO STARTEN",
+                  style='Success.TButton',
+                  command=lambda: [self.start_auto_demo(), dev_info.destroy()]).pack(side='left', padx=(0, 10))
+
+        ttk.Button(button_frame,
+                  text="⏹️ AUTO-DEMO STOPPEN",
+                  style='Warning.TButton',
+                  command=self.stop_auto_demo).pack(side='left', padx=(0, 10))
+
+        ttk.Button(button_frame,
+                  text="✅ OK",
+                  style='Primary.TButton',
+                  command=dev_info.destroy).pack(side='right')
+
+    def start_auto_demo(self):
+        """Automatische Demo starten"""
+        if self.dev_mode and not (self.load_generator and self.load_generator.running):
+            self.stop_auto_demo()  # Vorherige Demo stoppen
+            self.auto_demo_page = 1
+            self.dev_timer = self.scheduler.every(5000, self.schedule_next_demo_page, initial_delay_ms=0)
+            logger.info("🤖 Auto-Demo gestartet")
+
+    def stop_auto_demo(self):
+        """Automatische Demo stoppen"""
+        if hasattr(self, 'dev_timer') and self.dev_timer:
+            self.dev_timer.cancel()
+            self.dev_timer = None
+            logger.info("⏹️ Auto-Demo gestoppt")
+
+    def start_load_generator(self, pattern='random', rate=100, duration=None):
+        """Synthetische Last direkt in die data_queue - gleicher Weg wie Serial-Signale"""
+        from load_generator import LoadGenerator, QueueSink
+
+        self.stop_load_generator()
+        self.stop_auto_demo()
+        self.load_generator = LoadGenerator(QueueSink(self.data_queue), pattern, rate, duration)
+        # Im Dev Mode läuft der Queue-Pump sonst nicht
+        if not self.serial_pump:
+            self.serial_pump = self.scheduler.every(50, self.process_serial_data, initial_delay_ms=0)
+        self.load_generator.start()
+
+    def stop_load_generator(self):
+        """Lastgenerator anhalten (Statistik bleibt erhalten)"""
+        if self.load_generator and self.load_generator.running:
+            self.load_generator.stop()
+
+    def schedule_next_demo_page(self):
+        """Nächste Demo-Seite planen"""
+        if self.dev_mode:
+            # Aktuelle Seite laden
+            self.simulate_signal(self.auto_demo_page)
+
+            # Nächste Seite vorbereiten
+            self.auto_demo_page += 1
+            if self.auto_demo_page > 10:
+                self.auto_demo_page = 1
+
+    def simulate_signal(self, signal_id):
+        """Arduino-Signal simulieren"""
+        if self.dev_mode:
+            logger.debug("🎮 Dev Mode: Simuliere Signal %s", signal_id)
+            self.update_signal(signal_id)
+
+            # Client Count simulieren
+            import random
+            client_count = random.randint(0, 3)
+            self.update_client_count(client_count)
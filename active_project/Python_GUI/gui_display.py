@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Bertrandt GUI - Anzeige
+Multimedia-Bereich, Seiten-Layouts und Navigation; PIL und die alternativen
+Renderer werden erst geladen, wenn sie gebraucht werden
+"""
+
+import os
+import time
+import tkinter as tk
+
+import metrics
+from log_setup import get_logger
+from page_content import find_page_image, load_page
+from tracing import TRACER
+
+logger = get_logger('display')
+
+
+class PageDisplayMixin:
+    """Seiten anzeigen (Widgets, Canvas oder Bitmap) und Navigation hervorheben"""
+
+    def create_multimedia_display(self, parent):
+        """Multimedia-Anzeige für Messestand"""
+        # Header
+        panel_header = tk.Frame(parent, bg=self.colors['background_secondary'], height=50)
+        panel_header.pack(fill='x')
+        panel_header.pack_propagate(False)
+
+        title_label = tk.Label(panel_header,
+                              text="🎬 MULTIMEDIA PRÄSENTATION",
+                              font=self.fonts['title'],
+                              fg=self.colors['text_primary'],
+                              bg=self.colors['background_secondary'])
+        title_label.pack(pady=15)
+
+        # Hauptcontainer für Content
+        content_container = tk.Frame(parent, bg=self.colors['background_primary'])
+        content_container.pack(fill='both', expand=True, padx=20, pady=10)
+
+        # Multimedia Content Area (Hauptbereich)
+        self.content_frame = tk.Frame(content_container, bg=self.colors['background_tertiary'], relief='flat', borderwidth=2)
+        self.content_frame.pack(fill='both', expand=True, pady=(0, 10))
+
+        self.page_switch_time = metrics.histogram('bertrandt_page_switch_seconds', 'Dauer eines Seitenwechsels',
+                                                  renderer=self.renderer)
+
+        # Nur den gewählten Renderer laden (Bitmap-Renderer zieht PIL nach)
+        if self.renderer == 'canvas':
+            from canvas_renderer import CanvasPageRenderer
+            self.page_renderer = CanvasPageRenderer(self.content_frame, self.colors, self.fonts)
+        elif self.renderer == 'bitmap':
+            from page_bitmaps import BitmapPageView
+            self.page_renderer = BitmapPageView(self.content_frame, self.colors, self.fonts,
+                                                self.scheduler, self.all_page_configs,
+                                                transition_ms=self.transition_ms)
+
+        # Navigation Panel (unten) - responsive Höhe
+        nav_height = max(80, self.layout.height // 12)
+        nav_panel = tk.Frame(content_container, bg=self.colors['background_secondary'], height=nav_height)
+        nav_panel.pack(fill='x')
+        nav_panel.pack_propagate(False)
+        self.nav_panel = nav_panel
+
+        # Navigation Header
+        nav_header = tk.Label(nav_panel,
+                             text="📱 SEITEN-NAVIGATION",
+                             font=self.fonts['subtitle'],
+                             fg=self.colors['text_primary'],
+                             bg=self.colors['background_secondary'])
+        nav_header.pack(pady=(8, 5))
+
+        # Navigation Grid
+        self.nav_grid = tk.Frame(nav_panel, bg=self.colors['background_secondary'])
+        self.nav_grid.pack(fill='x', padx=20, pady=(0, 10))
+
+        # Navigation Cards erstellen
+        self.nav_cards = {}
+        for i, (signal_id, signal_info) in enumerate(self.signal_definitions.items()):
+            col = i % 10  # 10 Karten in einer Reihe
+
+            card = self.create_nav_card(self.nav_grid, signal_id, signal_info)
+            card.grid(row=0, column=col, padx=2, pady=2, sticky='ew')
+            self.nav_cards[signal_id] = card
+
+            # GUI-Button Klick-Handler für alle Modi
+            card.bind("<Button-1>", lambda e, sid=signal_id: self.on_manual_page_select(sid))
+            card.icon_label.bind("<Button-1>", lambda e, sid=signal_id: self.on_manual_page_select(sid))
+            card.number_label.bind("<Button-1>", lambda e, sid=signal_id: self.on_manual_page_select(sid))
+
+        # Grid konfigurieren
+        for i in range(10):
+            self.nav_grid.columnconfigure(i, weight=1)
+
+        # Nach Resize/F11: Navigation und Widget-Seiten einmal neu bemessen
+        self.layout.register('navigation', self.relayout_navigation)
+        self.layout.register('content_page', self.relayout_content_page)
+
+        # Initialen Content laden
+        self.load_content_page(1)
+
+    def relayout_navigation(self, width, height):
+        """Navigationsleiste und Karten an die neue Fenstergröße anpassen"""
+        self.nav_panel.config(height=max(80, height // 12))
+        card_width, card_height, icon_size = self.nav_card_metrics(width, height)
+        for card in self.nav_cards.values():
+            card.config(width=card_width, height=card_height)
+            card.icon_label.config(font=('Helvetica Neue', icon_size))
+
+    def relayout_content_page(self, width, height):
+        """Aus Widgets aufgebaute Seite neu aufbauen (Abstände, Bildgrößen) - Renderer passen sich selbst an"""
+        if self.page_uses_widgets:
+            self.load_content_page(self.current_page)
+
+    def get_page_config(self, page_id):
+        """Konfiguration und Ordner einer Seite"""
+        return load_page(self.content_dir, page_id)
+
+    def all_page_configs(self):
+        """(Konfiguration, Ordner) aller Seiten - z.B. zum Vorab-Rendern"""
+        return [self.get_page_config(page_id) for page_id in self.signal_definitions]
+
+    def load_content_page(self, page_id):
+        """Multimedia-Seite laden und anzeigen"""
+        with TRACER.span('load_content_page', page=page_id, renderer=self.renderer):
+            self._load_content_page(page_id)
+
+        # Letzter Span: bis Tk nach dem Neuzeichnen wieder idle ist
+        trace_id = TRACER.current
+        if trace_id:
+            self.root.after_idle(TRACER.record, 'paint', trace_id, time.perf_counter())
+
+    def _load_content_page(self, page_id):
+        started = time.perf_counter()
+        self.current_page = page_id
+        config, page_dir = self.get_page_config(page_id)
+
+        # Live-Widgets der vorherigen Seite löschen (Renderer-Canvas und Text-Widget bleiben erhalten)
+        renderer_canvas = self.page_renderer.canvas if self.page_renderer else None
+        text_frame = self.text_view.frame if self.text_view else None
+        if self.text_view:
+            self.text_view.hide()
+        for widget in self.content_frame.winfo_children():
+            if widget is not renderer_canvas and widget is not text_frame:
+                widget.destroy()
+
+        with TRACER.span('render'):
+            self.page_uses_widgets = not (self.page_renderer and self.page_renderer.render(config, page_dir))
+        if not self.page_uses_widgets:
+            if not renderer_canvas.winfo_manager():
+                renderer_canvas.pack(fill='both', expand=True)
+        else:
+            # Layout aus Widgets aufbauen (Standard bzw. Seiten mit Live-Elementen)
+            if renderer_canvas:
+                renderer_canvas.pack_forget()
+            with TRACER.span('create_content_layout', layout=config.get('layout', 'text_only')):
+                self.create_content_layout(config, page_dir)
+
+        # Navigation aktualisieren
+        self.update_navigation(page_id)
+        self.page_switch_time.observe(time.perf_counter() - started)
+
+    def create_content_layout(self, config, page_dir):
+        """Content-Layout basierend auf Konfiguration erstellen"""
+        layout = config.get('layout', 'text_only')
+
+        # Header mit Titel
+        header_frame = tk.Frame(self.content_frame, bg=self.colors['background_secondary'], height=80)
+        header_frame.pack(fill='x')
+        header_frame.pack_propagate(False)
+
+        # Titel - responsive
+        title_label = tk.Label(header_frame,
+                              text=config.get('title', 'Titel'),
+                              font=self.fonts['display'],
+                              fg=self.colors['text_primary'],
+                              bg=self.colors['background_secondary'])
+        title_label.pack(pady=15)
+
+        # Untertitel
+        if config.get('subtitle'):
+            subtitle_label = tk.Label(header_frame,
+                                     text=config.get('subtitle'),
+                                     font=self.fonts['subtitle'],
+                                     fg=self.colors['accent_primary'],
+                                     bg=self.colors['background_secondary'])
+            subtitle_label.pack()
+
+        # Content Area - responsive Padding
+        padding_x = max(10, self.layout.width // 80)
+        padding_y = max(10, self.layout.height // 60)
+        content_area = tk.Frame(self.content_frame, bg=self.colors['background_tertiary'])
+        content_area.pack(fill='both', expand=True, padx=padding_x, pady=padding_y)
+
+        # Layout-spezifische Inhalte
+        if layout == 'text_only':
+            self.create_text_layout(content_area, config)
+        elif layout == 'image_text':
+            self.create_image_text_layout(content_area, config, page_dir)
+        elif layout == 'video_text':
+            self.create_video_text_layout(content_area, config, page_dir)
+        elif layout == 'fullscreen_image':
+            self.create_fullscreen_image_layout(content_area, config, page_dir)
+        elif layout == 'fullscreen_video':
+            self.create_fullscreen_video_layout(content_area, config, page_dir)
+        else:
+            self.create_text_layout(content_area, config)
+
+    def create_text_layout(self, parent, config, slot='text_only'):
+        """Text-Bereich - ein gemeinsames Text-Widget, umbrochene Layouts kommen aus dem Cache"""
+        if self.text_view is None:
+            from text_layout import TextPageView
+            self.text_view = TextPageView(self.content_frame, self.colors, self.fonts, self.scheduler)
+        self.text_view.show(parent, config, slot)
+
+    def create_image_text_layout(self, parent, config, page_dir):
+        """Bild + Text Layout"""
+        # Horizontal aufteilen
+        left_frame = tk.Frame(parent, bg=self.colors['background_tertiary'])
+        left_frame.pack(side='left', fill='both', expand=True, padx=(0, 10))
+
+        right_frame = tk.Frame(parent, bg=self.colors['background_tertiary'])
+        right_frame.pack(side='right', fill='both', expand=True, padx=(10, 0))
+
+        # Bild laden
+        self.load_image_to_frame(left_frame, config, page_dir)
+
+        # Text
+        self.create_text_layout(right_frame, config, 'image_text')
+
+    def create_video_text_layout(self, parent, config, page_dir):
+        """Video + Text Layout"""
+        # Vertikal aufteilen
+        top_frame = tk.Frame(parent, bg=self.colors['background_tertiary'])
+        top_frame.pack(fill='both', expand=True, pady=(0, 10))
+
+        bottom_frame = tk.Frame(parent, bg=self.colors['background_tertiary'], height=200)
+        bottom_frame.pack(fill='x', pady=(10, 0))
+        bottom_frame.pack_propagate(False)
+
+        # Video-Platzhalter
+        self.create_video_placeholder(top_frame, config, page_dir)
+
+        # Text
+        self.create_text_layout(bottom_frame, config, 'video_text')
+
+    def create_fullscreen_image_layout(self, parent, config, page_dir):
+        """Vollbild-Bild Layout"""
+        self.load_image_to_frame(parent, config, page_dir, fullscreen=True)
+
+    def create_fullscreen_video_layout(self, parent, config, page_dir):
+        """Vollbild-Video Layout"""
+        self.create_video_placeholder(parent, config, page_dir, fullscreen=True)
+
+    def load_image_to_frame(self, parent, config, page_dir, fullscreen=False):
+        """Bild in Frame laden"""
+        image_path = find_page_image(config, page_dir)
+
+        if image_path:
+            try:
+                # PIL erst bei der ersten Bild-Seite laden
+                from PIL import ImageTk
+
+                if fullscreen:
+                    # Vollbild-Größe - responsive
+                    max_width = self.layout.width - 100
+                    max_height = self.layout.height - 200
+                else:
+                    # Halbe Größe - responsive
+                    max_width = (self.layout.width - 400) // 2
+                    max_height = (self.layout.height - 300) // 2
+
+                # Proportional skalieren - aus dem Cache statt die Datei erneut zu dekodieren
+                with TRACER.span('image_load', path=os.path.basename(image_path)):
+                    image = self.image_cache.get(image_path, (max(1, max_width), max(1, max_height)))
+                    photo = ImageTk.PhotoImage(image)
+
+                # Label für Bild
+                image_label = tk.Label(parent, image=photo, bg=self.colors['background_tertiary'])
+                image_label.image = photo  # Referenz behalten
+                image_label.pack(expand=True)
+
+            except Exception as e:
+                # Fehler-Platzhalter
+                error_label = tk.Label(parent,
+                                      text=f"🖼️ Bild konnte nicht geladen werden\n{str(e)}",
+                                      font=self.fonts['label'],
+                                      fg=self.colors['accent_tertiary'],
+                                      bg=self.colors['background_tertiary'])
+                error_label.pack(expand=True)
+        else:
+            # Kein Bild gefunden
+            placeholder_label = tk.Label(parent,
+                                        text="🖼️ Kein Bild verfügbar\n\nFügen Sie Bilder in den Ordner hinzu:\n" + page_dir,
+                                        font=self.fonts['label'],
+                                        fg=self.colors['text_secondary'],
+                                        bg=self.colors['background_tertiary'],
+                                        justify='center')
+            placeholder_label.pack(expand=True)
+
+    def create_video_placeholder(self, parent, config, page_dir, fullscreen=False):
+        """Video-Platzhalter erstellen"""
+        # Video-Unterstützung würde hier implementiert werden
+        # Für jetzt: Platzhalter
+        video_frame = tk.Frame(parent, bg=self.colors['background_secondary'], relief='solid', borderwidth=2)
+        video_frame.pack(fill='both', expand=True)
+
+        placeholder_label = tk.Label(video_frame,
+                                    text="🎬 VIDEO BEREICH\n\nVideo-Unterstützung wird implementiert\n\nUnterstützte Formate:\n• MP4\n• AVI\n• MOV",
+                                    font=self.fonts['subtitle'],
+                                    fg=self.colors['text_secondary'],
+                                    bg=self.colors['background_secondary'],
+                                    justify='center')
+        placeholder_label.pack(expand=True)
+
+    def safe_page_select(self, page_id):
+        """Sichere Seitenauswahl mit Cleanup"""
+        try:
+            # Vorherige Seite cleanup
+            if hasattr(self, 'current_page_id') and self.current_page_id != page_id:
+                self.cleanup_current_page()
+
+            # Neue Seite laden (aktualisiert auch die Navigation)
+            self.on_manual_page_select(page_id)
+            self.current_page_id = page_id
+
+            logger.debug("🎯 Seite %s erfolgreich geladen", page_id)
+        except Exception as e:
+            logger.error("❌ Fehler beim Seitenwechsel: %s", e)
+
+    def cleanup_current_page(self):
+        """Aktuelle Seite ordnungsgemäß schließen"""
+        try:
+            # Multimedia cleanup
+            if hasattr(self, 'multimedia_frame'):
+                for widget in self.multimedia_frame.winfo_children():
+                    widget.destroy()
+
+            # Timer cleanup falls vorhanden
+            if hasattr(self, 'auto_demo_timer') and self.auto_demo_timer:
+                self.auto_demo_timer.cancel()
+                self.auto_demo_timer = None
+
+        except Exception as e:
+            logger.warning("⚠️ Cleanup Warnung: %s", e)
+
+    def update_navigation(self, active_page):
+        """Navigation aktualisieren - Header und Sidebar, nur die geänderten Einträge"""
+        if active_page == self.nav_active_page:
+            # Mehrfachaufruf für denselben Seitenwechsel - nichts zu tun
+            self.nav_stats['coalesced'] += 1
+            return
+
+        previous = self.nav_active_page
+        self.nav_active_page = active_page
+        self.nav_stats['switches'] += 1
+
+        if previous is None:
+            # Erster Aufruf: alle Einträge in einen definierten Zustand bringen
+            pages = set(getattr(self, 'nav_buttons', {})) | set(getattr(self, 'nav_cards', {}))
+        else:
+            # Nur alte aktive Seite -> inaktiv und neue Seite -> aktiv
+            pages = {previous, active_page}
+
+        for page_id in pages:
+            self.style_nav_entry(page_id, page_id == active_page)
+
+    def style_nav_entry(self, page_id, active):
+        """Header-Button und Sidebar-Karte einer Seite (in)aktiv darstellen"""
+        button = getattr(self, 'nav_buttons', {}).get(page_id)
+        if button:
+            if active:
+                button.config(bg=self.colors['accent_primary'], 
+                            fg=self.colors['text_primary'])
+            else:
+                button.config(bg=self.colors['background_primary'], 
+                            fg=self.colors['text_secondary'])
+            self.nav_stats['configure_calls'] += 1
+
+        card = getattr(self, 'nav_cards', {}).get(page_id)
+        if card:
+            if active:
+                # Aktive Seite hervorheben
+                card.config(bg=self.colors['background_secondary'], relief='solid', borderwidth=2)
+                card.card_header.config(bg=self.colors['accent_primary'])
+            else:
+                # Seite zurücksetzen
+                card.config(bg=self.colors['background_tertiary'], relief='flat', borderwidth=1)
+                card.card_header.config(bg=card.signal_info['color'])
+            self.nav_stats['configure_calls'] += 2
+
+    def nav_card_metrics(self, width, height):
+        """(Kartenbreite, Kartenhöhe, Icon-Größe) für die Fenstergröße"""
+        return max(35, width // 50), max(25, height // 30), max(8, width // 120)
+
+    def create_nav_card(self, parent, signal_id, signal_info):
+        """Minimale Navigation-Karte für sehr schmale Sidebar (1/10)"""
+        # Sehr kompakte Kartengröße für 1/10 Breite
+        card_width, card_height, icon_size = self.nav_card_metrics(self.layout.width, self.layout.height)
+
+        card = tk.Frame(parent,
+                       bg=self.colors['background_tertiary'],
+                       relief='flat',
+                       borderwidth=1,
+                       width=card_width,
+                       height=card_height)
+
+        # Minimaler Card Header
+        card_header = tk.Frame(card, bg=signal_info['color'], height=2)
+        card_header.pack(fill='x')
+        card_header.pack_propagate(False)
+
+        # Minimaler Card Content
+        card_content = tk.Frame(card, bg=self.colors['background_tertiary'])
+        card_content.pack(fill='both', expand=True, padx=2, pady=1)
+
+        # Kleines Icon
+        icon_label = tk.Label(card_content,
+                             text=signal_info['icon'],
+                             font=('Helvetica Neue', icon_size),
+                             bg=self.colors['background_tertiary'])
+        icon_label.pack()
+
+        # Kleine Nummer
+        number_label = tk.Label(card_content,
+                               text=str(signal_id),
+                               font=('Helvetica Neue', 8, 'bold'),
+                               fg=signal_info['color'],
+                               bg=self.colors['background_tertiary'])
+        number_label.pack()
+
+        # Referenzen speichern
+        card.icon_label = icon_label
+        card.number_label = number_label
+        card.signal_info = signal_info
+        card.card_header = card_header
+
+        return card
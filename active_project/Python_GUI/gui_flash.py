@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+"""
+Bertrandt GUI - Flash-Tool
+ESP32/GIGA aus der GUI flashen; arduino-cli-Anbindung (flash_runner) wird erst beim ersten Flashen geladen
+"""
+
+import os
+import queue
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+# Maximale Zeilen in der Flash-Log-Ansicht (ältere Zeilen werden verworfen)
+FLASH_LOG_MAX_LINES = 300
+
+
+class FlashToolMixin:
+    """Flash-Bereich im Status-Panel, Port-Auswahl und Flash-Worker"""
+
+    def create_flash_section(self, parent):
+        """Dark Theme Arduino Flash-Sektion"""
+        # Flash Card
+        flash_card = tk.Frame(parent, bg=self.colors['background_tertiary'], relief='flat', borderwidth=1)
+        flash_card.pack(fill='x', padx=20, pady=15)
+
+        # Card Header
+        flash_header = tk.Frame(flash_card, bg=self.colors['accent_warning'], height=35)
+        flash_header.pack(fill='x')
+        flash_header.pack_propagate(False)
+
+        tk.Label(flash_header,
+                text="🔧 ARDUINO FLASH-TOOL",
+                font=self.fonts['button'],
+                fg=self.colors['background_primary'],
+                bg=self.colors['accent_warning']).pack(pady=8)
+
+        # Flash Content
+        flash_content = tk.Frame(flash_card, bg=self.colors['background_tertiary'])
+        flash_content.pack(fill='x', padx=15, pady=15)
+
+        # Flash Status
+        self.flash_status = tk.Label(flash_content,
+                                    text="Bereit zum Flashen",
+                                    font=self.fonts['label'],
+                                    fg=self.colors['text_secondary'],
+                                    bg=self.colors['background_tertiary'])
+        self.flash_status.pack(anchor='w', pady=(0, 10))
+
+        # Geräte-Auswahl Tabs
+        device_frame = tk.Frame(flash_content, bg=self.colors['background_tertiary'])
+        device_frame.pack(fill='x', pady=5)
+
+        self.device_var = tk.StringVar(value="ESP32")
+
+        tk.Radiobutton(device_frame,
+                      text="📱 ESP32",
+                      variable=self.device_var,
+                      value="ESP32",
+                      font=self.fonts['label'],
+                      bg=self.colors['background_tertiary'],
+                      fg=self.colors['text_primary'],
+                      selectcolor=self.colors['background_secondary'],
+                      activebackground=self.colors['background_tertiary'],
+                      command=self.on_device_change).pack(side='left', padx=(0, 20))
+
+        tk.Radiobutton(device_frame,
+                      text="🔧 Arduino GIGA",
+                      variable=self.device_var,
+                      value="GIGA",
+                      font=self.fonts['label'],
+                      bg=self.colors['background_tertiary'],
+                      fg=self.colors['text_primary'],
+                      selectcolor=self.colors['background_secondary'],
+                      activebackground=self.colors['background_tertiary'],
+                      command=self.on_device_change).pack(side='left')
+
+        # Port Auswahl
+        port_frame = tk.Frame(flash_content, bg=self.colors['background_tertiary'])
+        port_frame.pack(fill='x', pady=5)
+
+        tk.Label(port_frame,
+                text="Port:",
+                font=self.fonts['label'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['background_tertiary']).pack(side='left')
+
+        self.flash_port_var = tk.StringVar()
+        self.flash_port_combo = ttk.Combobox(port_frame, 
+                                           textvariable=self.flash_port_var,
+                                           width=15,
+                                           state='readonly')
+        self.flash_port_combo.pack(side='left', padx=(5, 0))
+
+        ttk.Button(port_frame,
+                  text="🔍",
+                  width=3,
+                  command=self.scan_ports).pack(side='left', padx=(5, 0))
+
+        # Flash Buttons
+        flash_btn_frame = tk.Frame(flash_content, bg=self.colors['background_tertiary'])
+        flash_btn_frame.pack(fill='x', pady=10)
+
+        self.flash_btn = ttk.Button(flash_btn_frame,
+                                   text="📱 ESP32 FLASHEN",
+                                   style='Primary.TButton',
+                                   command=self.flash_device)
+        self.flash_btn.pack(fill='x', pady=2)
+
+        ttk.Button(flash_btn_frame,
+                  text="📁 SKETCH AUSWÄHLEN",
+                  style='Success.TButton',
+                  command=self.select_sketch).pack(fill='x', pady=2)
+
+        ttk.Button(flash_btn_frame,
+                  text="🚀 BEIDE GERÄTE FLASHEN",
+                  style='Warning.TButton',
+                  command=self.flash_both_devices).pack(fill='x', pady=2)
+
+        self.flash_cancel_btn = ttk.Button(flash_btn_frame,
+                                          text="⛔ FLASH ABBRECHEN",
+                                          style='Secondary.TButton',
+                                          state='disabled',
+                                          command=self.cancel_flash)
+        self.flash_cancel_btn.pack(fill='x', pady=2)
+
+        # Upload-Fortschritt (aus esptool/dfu-util Ausgabe)
+        self.flash_progress = ttk.Progressbar(flash_content, mode='determinate', maximum=100)
+        self.flash_progress.pack(fill='x', pady=(5, 0))
+
+        # Live-Ausgabe von arduino-cli (begrenzt auf FLASH_LOG_MAX_LINES)
+        self.flash_log = tk.Text(flash_content,
+                                height=6,
+                                font=('Courier', 8),
+                                bg=self.colors['background_secondary'],
+                                fg=self.colors['text_secondary'],
+                                relief='flat',
+                                wrap='none',
+                                state='disabled')
+        self.flash_log.pack(fill='x', pady=(5, 0))
+
+        self.flash_process = None
+        self.flash_drain_task = None
+        self.flash_running = False
+        self.flash_cancel_requested = False
+        self.flash_output_queue = queue.Queue()
+
+        # Boot Button Hinweis
+        self.hint_frame = tk.Frame(flash_content, 
+                             bg=self.colors['accent_tertiary'],
+                             relief='flat',
+                             borderwidth=1)
+        self.hint_frame.pack(fill='x', pady=10)
+
+        self.hint_title = tk.Label(self.hint_frame,
+                text="💡 ESP32 WICHTIG:",
+                font=self.fonts['button'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['accent_tertiary'])
+        self.hint_title.pack(pady=(5, 0))
+
+        self.hint_text = tk.Label(self.hint_frame,
+                text="Boot-Button drücken wenn\n'Connecting...' erscheint!",
+                font=self.fonts['label'],
+                fg=self.colors['text_primary'],
+                bg=self.colors['accent_tertiary'],
+                justify='center')
+        self.hint_text.pack(pady=(0, 5))
+
+        # Sketch Pfade
+        self.esp32_sketch_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
+                                             "Arduino", "ESP32_UDP_Receiver")
+        self.giga_sketch_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
+                                            "Arduino", "GIGA_UDP_Sender")
+        self.current_sketch_path = self.esp32_sketch_path
+
+        # Ports aus der Device Registry übernehmen
+        self.update_port_list()
+
+    def scan_ports(self):
+        """Device Registry manuell abgleichen (🔍 Button)"""
+        self.device_registry.refresh()
+        self.update_port_list()
+
+    def update_port_list(self):
+        """Flash-Port Combobox aus der Device Registry füllen"""
+        devices = self.device_registry.devices()
+        ports = [info['port'] for info in devices]
+
+        # Combobox aktualisieren
+        self.flash_port_combo['values'] = ports
+        if ports:
+            if self.flash_port_var.get() not in ports:
+                # Passenden Port zum gewählten Gerät vorauswählen
+                preferred = self.device_registry.find(self.device_var.get())
+                self.flash_port_combo.set(preferred or ports[0])
+            boards = ", ".join(f"{info['kind'] or '?'}@{os.path.basename(info['port'])}" for info in devices)
+            self.flash_status.config(text=f"Gefunden: {len(ports)} Port(s) ({boards})")
+        else:
+            self.flash_port_combo.set('')
+            self.flash_status.config(text="Keine Ports gefunden")
+
+    def on_device_change(self):
+        """Geräte-Auswahl geändert"""
+        device = self.device_var.get()
+        if device == "ESP32":
+            self.flash_btn.config(text="📱 ESP32 FLASHEN")
+            self.current_sketch_path = self.esp32_sketch_path
+            self.hint_title.config(text="💡 ESP32 WICHTIG:")
+            self.hint_text.config(text="Boot-Button drücken wenn\n'Connecting...' erscheint!")
+            self.hint_frame.config(bg=self.colors['accent_tertiary'])
+            self.hint_title.config(bg=self.colors['accent_tertiary'])
+            self.hint_text.config(bg=self.colors['accent_tertiary'])
+        else:  # GIGA
+            self.flash_btn.config(text="🔧 GIGA FLASHEN")
+            self.current_sketch_path = self.giga_sketch_path
+            self.hint_title.config(text="💡 GIGA INFO:")
+            self.hint_text.config(text="Automatisches Flashen\nkein Button nötig!")
+            self.hint_frame.config(bg=self.colors['accent_secondary'])
+            self.hint_title.config(bg=self.colors['accent_secondary'])
+            self.hint_text.config(bg=self.colors['accent_secondary'])
+
+        # Port des gewählten Board-Typs vorauswählen
+        port = self.device_registry.find(device)
+        if port:
+            self.flash_port_combo.set(port)
+
+        sketch_name = os.path.basename(self.current_sketch_path)
+        self.flash_status.config(text=f"Gerät: {device}, Sketch: {sketch_name}")
+
+    def select_sketch(self):
+        """Arduino Sketch auswählen"""
+        initial_dir = os.path.dirname(self.current_sketch_path)
+        sketch_dir = filedialog.askdirectory(
+            title="Arduino Sketch Ordner auswählen",
+            initialdir=initial_dir
+        )
+        if sketch_dir:
+            self.current_sketch_path = sketch_dir
+            sketch_name = os.path.basename(sketch_dir)
+            device = self.device_var.get()
+            self.flash_status.config(text=f"Gerät: {device}, Sketch: {sketch_name}")
+
+    def check_arduino_cli(self):
+        """Arduino CLI verfügbarkeit prüfen"""
+        from flash_runner import arduino_cli_available
+        return arduino_cli_available()
+
+    def install_arduino_cli(self):
+        """Arduino CLI installieren (inkl. ESP32- und GIGA-Core)"""
+        from flash_runner import install_arduino_cli
+
+        self.flash_status.config(text="Installiere Arduino CLI...")
+        try:
+            install_arduino_cli()
+            return True
+        except Exception as e:
+            self.flash_status.config(text=f"Installation fehlgeschlagen: {e}")
+            return False
+
+    def flash_device(self):
+        """Aktuell ausgewähltes Gerät flashen"""
+        device = self.device_var.get()
+        if device == "ESP32":
+            self.flash_esp32()
+        else:
+            self.flash_giga()
+
+    def flash_esp32(self):
+        """ESP32 flashen"""
+        if not self.flash_port_var.get():
+            messagebox.showerror("Fehler", "Bitte wählen Sie einen Port aus!")
+            return
+
+        if not os.path.exists(self.current_sketch_path):
+            messagebox.showerror("Fehler", "ESP32 Sketch-Pfad nicht gefunden!")
+            return
+
+        # Arduino CLI prüfen
+        if not self.check_arduino_cli():
+            response = messagebox.askyesno(
+                "Arduino CLI nicht gefunden",
+                "Arduino CLI ist nicht installiert. Soll es automatisch installiert werden?"
+            )
+            if response:
+                if not self.install_arduino_cli():
+                    return
+            else:
+                return
+
+        # Flash-Thread starten
+        self.flash_btn.config(state='disabled', text="⏳ Flashe ESP32...")
+        self._start_flash_thread(self._flash_esp32_worker)
+
+    def flash_giga(self):
+        """Arduino GIGA flashen"""
+        if not self.flash_port_var.get():
+            messagebox.showerror("Fehler", "Bitte wählen Sie einen Port aus!")
+            return
+
+        if not os.path.exists(self.current_sketch_path):
+            messagebox.showerror("Fehler", "GIGA Sketch-Pfad nicht gefunden!")
+            return
+
+        # Arduino CLI prüfen
+        if not self.check_arduino_cli():
+            response = messagebox.askyesno(
+                "Arduino CLI nicht gefunden",
+                "Arduino CLI ist nicht installiert. Soll es automatisch installiert werden?"
+            )
+            if response:
+                if not self.install_arduino_cli():
+                    return
+            else:
+                return
+
+        # Flash-Thread starten
+        self.flash_btn.config(state='disabled', text="⏳ Flashe GIGA...")
+        self._start_flash_thread(self._flash_giga_worker)
+
+    def flash_both_devices(self):
+        """Beide Geräte nacheinander flashen"""
+        response = messagebox.askyesno(
+            "Beide Geräte flashen",
+            "Sollen ESP32 und Arduino GIGA nacheinander geflasht werden?\n\n" +
+            "1. Zuerst wird Arduino GIGA geflasht\n" +
+            "2. Dann ESP32 (Boot-Button bereithalten!)"
+        )
+        if response:
+            self.flash_btn.config(state='disabled', text="⏳ Flashe beide...")
+            self._start_flash_thread(self._flash_both_worker)
+
+    def _start_flash_thread(self, target):
+        """Flash-Worker starten und Live-Ausgabe vorbereiten (GUI-Thread)"""
+        self.flash_cancel_requested = False
+        self.flash_running = True
+        self.flash_progress['value'] = 0
+        self.flash_log.config(state='normal')
+        self.flash_log.delete('1.0', tk.END)
+        self.flash_log.config(state='disabled')
+        self.flash_cancel_btn.config(state='normal')
+
+        self.scheduler.submit(target)
+
+        if self.flash_drain_task:
+            self.flash_drain_task.cancel()
+        self.flash_drain_task = self.scheduler.every(100, self._drain_flash_output, initial_delay_ms=0)
+
+    def _finish_flash_thread(self):
+        """Flash-Worker beendet (Worker-Thread)"""
+        self.flash_running = False
+        self.flash_process = None
+        self.scheduler.call_soon(lambda: self.flash_cancel_btn.config(state='disabled'), key='flash_cancel_btn')
+
+    def _run_flash_step(self, cmd, timeout, show_progress=False):
+        """arduino-cli Befehl ausführen und Ausgabe live streamen (Worker-Thread)"""
+        from flash_runner import FlashCancelled, FlashProcess
+
+        if self.flash_cancel_requested:
+            raise FlashCancelled()
+
+        self.flash_output_queue.put(('line', '$ ' + ' '.join(cmd)))
+        self.flash_output_queue.put(('progress', 0))
+        on_progress = None
+        if show_progress:
+            on_progress = lambda percent: self.flash_output_queue.put(('progress', percent))
+
+        self.flash_process = FlashProcess(cmd,
+                                          on_line=lambda line: self.flash_output_queue.put(('line', line)),
+                                          on_progress=on_progress)
+        if self.flash_cancel_requested:
+            raise FlashCancelled()
+        return self.flash_process.run(timeout=timeout)
+
+    def _drain_flash_output(self):
+        """Gesammelte Flash-Ausgabe gebündelt in die Log-Ansicht übernehmen (GUI-Thread)"""
+        lines = []
+        progress = None
+        try:
+            while True:
+                kind, value = self.flash_output_queue.get_nowait()
+                if kind == 'line':
+                    lines.append(value)
+                else:
+                    progress = value
+        except queue.Empty:
+            pass
+
+        if lines:
+            self.flash_log.config(state='normal')
+            self.flash_log.insert(tk.END, "\n".join(lines[-FLASH_LOG_MAX_LINES:]) + "\n")
+            excess = int(self.flash_log.index('end-1c').split('.')[0]) - FLASH_LOG_MAX_LINES
+            if excess > 0:
+                self.flash_log.delete('1.0', f'{excess + 1}.0')
+            self.flash_log.see(tk.END)
+            self.flash_log.config(state='disabled')
+
+        if progress is not None:
+            self.flash_progress['value'] = progress
+
+        if not self.flash_running and self.flash_output_queue.empty():
+            self.flash_drain_task.cancel()
+
+    def cancel_flash(self):
+        """Laufenden Flash-Vorgang abbrechen"""
+        self.flash_cancel_requested = True
+        if self.flash_process:
+            self.flash_process.cancel()
+        self.flash_status.config(text="⛔ Flash wird abgebrochen...")
+
+    def _flash_esp32_worker(self):
+        """ESP32 Flash-Prozess in separatem Thread"""
+        # Flash-Tooling erst beim ersten Flashen laden
+        import subprocess
+        from flash_runner import FlashCancelled, compile_command, upload_command
+
+        try:
+            port = self.flash_port_var.get()
+
+            # Status Updates im GUI-Thread
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="Kompiliere ESP32 Sketch..."), key='flash_status')
+
+            # Kompilieren
+            compile_cmd = compile_command('ESP32', self.esp32_sketch_path)
+
+            returncode = self._run_flash_step(compile_cmd, 120)
+            if returncode != 0:
+                error_text = self.flash_process.error_tail()
+                self.scheduler.call_soon(lambda: self.flash_status.config(text="ESP32 Kompilierung fehlgeschlagen"), key='flash_status')
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", f"ESP32 Kompilierung fehlgeschlagen:\n{error_text}"))
+                return
+
+            # Upload
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="ESP32 Upload... BOOT-BUTTON DRÜCKEN!"), key='flash_status')
+
+            upload_cmd = upload_command('ESP32', port, self.esp32_sketch_path)
+
+            returncode = self._run_flash_step(upload_cmd, 60, show_progress=True)
+
+            if returncode == 0:
+                self.scheduler.call_soon(lambda: self.flash_status.config(text="✅ ESP32 Flash erfolgreich!"), key='flash_status')
+                self.scheduler.call_soon(lambda: messagebox.showinfo("Erfolg", "ESP32 erfolgreich geflasht!"))
+
+                # Verbindung neu starten nach kurzer Pause
+                self.scheduler.after(3000, self.restart_connection)
+            else:
+                error_text = self.flash_process.error_tail()
+                self.scheduler.call_soon(lambda: self.flash_status.config(text="❌ ESP32 Flash fehlgeschlagen"), key='flash_status')
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", f"ESP32 Upload fehlgeschlagen:\n{error_text}"))
+
+        except FlashCancelled:
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="⛔ ESP32 Flash abgebrochen"), key='flash_status')
+        except subprocess.TimeoutExpired:
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="❌ ESP32 Timeout"), key='flash_status')
+            self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", "ESP32 Flash-Prozess Timeout. Boot-Button gedrückt?"))
+        except Exception as e:
+            self.scheduler.call_soon(lambda e=e: self.flash_status.config(text=f"❌ ESP32 Fehler: {e}"), key='flash_status')
+            self.scheduler.call_soon(lambda e=e: messagebox.showerror("Fehler", f"ESP32 Flash-Fehler:\n{e}"))
+        finally:
+            self._finish_flash_thread()
+            self.scheduler.call_soon(lambda: self.flash_btn.config(state='normal', text="📱 ESP32 FLASHEN"), key='flash_btn')
+
+    def _flash_giga_worker(self):
+        """Arduino GIGA Flash-Prozess in separatem Thread"""
+        # Flash-Tooling erst beim ersten Flashen laden
+        import subprocess
+        from flash_runner import FlashCancelled, compile_command, upload_command
+
+        try:
+            port = self.flash_port_var.get()
+
+            # Status Updates im GUI-Thread
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="Kompiliere GIGA Sketch..."), key='flash_status')
+
+            # Kompilieren
+            compile_cmd = compile_command('GIGA', self.giga_sketch_path)
+
+            returncode = self._run_flash_step(compile_cmd, 120)
+            if returncode != 0:
+                error_text = self.flash_process.error_tail()
+                self.scheduler.call_soon(lambda: self.flash_status.config(text="GIGA Kompilierung fehlgeschlagen"), key='flash_status')
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", f"GIGA Kompilierung fehlgeschlagen:\n{error_text}"))
+                return
+
+            # Upload
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="GIGA Upload läuft..."), key='flash_status')
+
+            upload_cmd = upload_command('GIGA', port, self.giga_sketch_path)
+
+            returncode = self._run_flash_step(upload_cmd, 60, show_progress=True)
+
+            if returncode == 0:
+                self.scheduler.call_soon(lambda: self.flash_status.config(text="✅ GIGA Flash erfolgreich!"), key='flash_status')
+                self.scheduler.call_soon(lambda: messagebox.showinfo("Erfolg", "Arduino GIGA erfolgreich geflasht!"))
+            else:
+                error_text = self.flash_process.error_tail()
+                self.scheduler.call_soon(lambda: self.flash_status.config(text="❌ GIGA Flash fehlgeschlagen"), key='flash_status')
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", f"GIGA Upload fehlgeschlagen:\n{error_text}"))
+
+        except FlashCancelled:
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="⛔ GIGA Flash abgebrochen"), key='flash_status')
+        except subprocess.TimeoutExpired:
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="❌ GIGA Timeout"), key='flash_status')
+            self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", "GIGA Flash-Prozess Timeout"))
+        except Exception as e:
+            self.scheduler.call_soon(lambda e=e: self.flash_status.config(text=f"❌ GIGA Fehler: {e}"), key='flash_status')
+            self.scheduler.call_soon(lambda e=e: messagebox.showerror("Fehler", f"GIGA Flash-Fehler:\n{e}"))
+        finally:
+            self._finish_flash_thread()
+            self.scheduler.call_soon(lambda: self.flash_btn.config(state='normal', text="🔧 GIGA FLASHEN"), key='flash_btn')
+
+    def _flash_both_worker(self):
+        """Beide Geräte nacheinander flashen"""
+        # Flash-Tooling erst beim ersten Flashen laden
+        import subprocess
+        from flash_runner import FlashCancelled, compile_command, upload_command
+
+        try:
+            # Boards über USB VID/PID aus der Device Registry zuordnen
+            giga_port = self.device_registry.find('GIGA')
+            esp32_port = self.device_registry.find('ESP32')
+
+            if not giga_port or not esp32_port:
+                ports = ", ".join(self.device_registry.ports()) or "keine"
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", 
+                    f"ESP32 und Arduino GIGA nicht beide gefunden!\nGefundene Ports: {ports}\n" +
+                    "Bitte beide Geräte anschließen."))
+                return
+
+            # 1. Arduino GIGA flashen
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="1/2: Flashe Arduino GIGA..."), key='flash_status')
+
+            # GIGA kompilieren
+            compile_cmd = compile_command('GIGA', self.giga_sketch_path)
+
+            returncode = self._run_flash_step(compile_cmd, 120)
+            if returncode != 0:
+                error_text = self.flash_process.error_tail()
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", f"GIGA Kompilierung fehlgeschlagen:\n{error_text}"))
+                return
+
+            # GIGA uploaden
+            upload_cmd = upload_command('GIGA', giga_port, self.giga_sketch_path)
+
+            returncode = self._run_flash_step(upload_cmd, 60, show_progress=True)
+            if returncode != 0:
+                error_text = self.flash_process.error_tail()
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", f"GIGA Upload fehlgeschlagen:\n{error_text}"))
+                return
+
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="✅ GIGA fertig! Warte 3 Sekunden..."), key='flash_status')
+            time.sleep(3)
+
+            # 2. ESP32 flashen
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="2/2: Flashe ESP32..."), key='flash_status')
+
+            # ESP32 kompilieren
+            compile_cmd = compile_command('ESP32', self.esp32_sketch_path)
+
+            returncode = self._run_flash_step(compile_cmd, 120)
+            if returncode != 0:
+                error_text = self.flash_process.error_tail()
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", f"ESP32 Kompilierung fehlgeschlagen:\n{error_text}"))
+                return
+
+            # ESP32 uploaden
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="ESP32 Upload... BOOT-BUTTON DRÜCKEN!"), key='flash_status')
+
+            upload_cmd = upload_command('ESP32', esp32_port, self.esp32_sketch_path)
+
+            returncode = self._run_flash_step(upload_cmd, 60, show_progress=True)
+
+            if returncode == 0:
+                self.scheduler.call_soon(lambda: self.flash_status.config(text="✅ Beide Geräte erfolgreich geflasht!"), key='flash_status')
+                self.scheduler.call_soon(lambda: messagebox.showinfo("Erfolg", 
+                    f"Beide Geräte erfolgreich geflasht!\n\n" +
+                    f"GIGA Port: {giga_port}\n" +
+                    f"ESP32 Port: {esp32_port}"))
+
+                # ESP32 Verbindung neu starten
+                self.esp32_port = esp32_port
+                self.scheduler.after(3000, self.restart_connection)
+            else:
+                error_text = self.flash_process.error_tail()
+                self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", f"ESP32 Upload fehlgeschlagen:\n{error_text}"))
+
+        except FlashCancelled:
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="⛔ Flash abgebrochen"), key='flash_status')
+        except subprocess.TimeoutExpired:
+            self.scheduler.call_soon(lambda: self.flash_status.config(text="❌ Timeout"), key='flash_status')
+            self.scheduler.call_soon(lambda: messagebox.showerror("Fehler", "Flash-Prozess Timeout. ESP32 Boot-Button gedrückt?"))
+        except Exception as e:
+            self.scheduler.call_soon(lambda e=e: self.flash_status.config(text=f"❌ Fehler: {e}"), key='flash_status')
+            self.scheduler.call_soon(lambda e=e: messagebox.showerror("Fehler", f"Flash-Fehler:\n{e}"))
+        finally:
+            self._finish_flash_thread()
+            self.scheduler.call_soon(lambda: self.flash_btn.config(state='normal', text="🚀 BEIDE GERÄTE FLASHEN"), key='flash_btn')
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Bertrandt GUI - Signal-Eingang
+ESP32 per Serial, Signal-Broker, Hotplug und Status-Server; pyserial, Broker-Client
+und asyncio-Server werden erst beim Verbinden geladen
+"""
+
+import os
+import queue
+import threading
+import time
+
+import metrics
+from log_setup import get_logger
+from signal_protocol import parse_line
+from tracing import TRACER
+
+logger = get_logger('ingest')
+
+SERIAL_RECONNECTS = metrics.counter('bertrandt_reconnects_total', 'Neu aufgebaute Verbindungen', link='serial')
+# "Clients: N;hb=1" - gleiche Anzahl, aber als Heartbeat in die data_queue
+CLIENTS_HEARTBEAT = 'clients_hb'
+
+
+def queue_type(event):
+    """Typ für die data_queue (Client-Heartbeats getrennt, damit ClientSeries sie zählt)"""
+    if event['type'] == 'clients' and event.get('hb'):
+        return CLIENTS_HEARTBEAT
+    return event['type']
+
+
+class SignalIngestMixin:
+    """Signale empfangen und im GUI-Thread verarbeiten"""
+
+    def resolve_esp32_port(self):
+        """Konfigurierten ESP32-Port verwenden oder über die Device Registry finden"""
+        if self.device_registry.get(self.esp32_port) or os.path.exists(self.esp32_port):
+            return self.esp32_port
+        return self.device_registry.find('ESP32') or self.esp32_port
+
+    def setup_serial(self):
+        """Serial-Verbindung im Worker aufbauen, danach Lesen oder Dev Mode im GUI-Thread starten"""
+        if self.broker_path:
+            self.setup_broker()
+            return
+        if self.serial_connect_pending():
+            return
+        generation = self.serial_connect_generation = self.serial_generation
+        self.esp32_port = self.resolve_esp32_port()
+        self.set_connection_status("● Verbinde...", self.colors['accent_warning'])
+        self.scheduler.submit(self._open_serial, self.esp32_port, name='serial_connect',
+                              on_done=lambda connection: self._on_serial_opened(connection, generation),
+                              on_error=lambda error: self._on_serial_failed(error, generation))
+
+    def serial_connect_pending(self):
+        """Läuft ein noch gültiger Verbindungsaufbau?"""
+        return self.serial_connect_generation == self.serial_generation
+
+    @staticmethod
+    def _open_serial(port):
+        """Port öffnen und warten, bis das ESP32 nach dem Reset bereit ist (Worker-Thread)"""
+        import serial
+
+        connection = serial.Serial(port, 115200, timeout=1)
+        time.sleep(2)
+        return connection
+
+    def _on_serial_opened(self, connection, generation):
+        """Verbindung steht (GUI-Thread)"""
+        if generation != self.serial_generation:
+            # Inzwischen getrennt (Gerät entfernt, Neustart, Beenden) - Verbindung verwerfen
+            connection.close()
+            return
+        self.serial_connect_generation = None
+        self.serial_connection = connection
+        self.set_connection_status("● Online", self.colors['accent_secondary'])
+        self.dev_mode = False
+        self.start_serial_reading()
+
+    def _on_serial_failed(self, error, generation):
+        """Kein ESP32 erreichbar - Dev Mode aktivieren (GUI-Thread)"""
+        if generation != self.serial_generation:
+            return
+        self.serial_connect_generation = None
+        self.dev_mode = True
+        self.set_connection_status("● Dev Mode", self.colors['accent_warning'])
+        self.start_dev_mode()
+        logger.warning("🔧 Dev Mode aktiviert - Keine Hardware gefunden: %s", error)
+
+    def set_connection_status(self, text, color):
+        """Verbindungsstatus im Header anzeigen und an den Status-Server melden"""
+        self.connection_status.config(text=text, fg=color)
+        if self.status_server:
+            self.status_server.update(connection=text.lstrip('● '))
+
+    def setup_broker(self):
+        """Als Anzeige mit dem Signal-Broker verbinden (verbindet bei Abbruch neu)"""
+        from signal_broker import BrokerClient
+
+        self.dev_mode = False
+        self.set_connection_status("● Broker...", self.colors['accent_warning'])
+        self.broker_client = BrokerClient(self.broker_path,
+                                          on_event=self.on_broker_event,
+                                          on_status=self.on_broker_status)
+        self.broker_client.start()
+        self.running = True
+        if not self.serial_pump:
+            self.serial_pump = self.scheduler.every(50, self.process_serial_data, initial_delay_ms=0)
+
+    def on_broker_event(self, event):
+        """Event vom Broker (Client-Thread) in die Daten-Queue legen"""
+        if event['type'] in ('signal', 'clients'):
+            self.data_queue.put((queue_type(event), event['value'], TRACER.enqueue(TRACER.new_trace())))
+
+    def on_broker_status(self, connected):
+        """Verbindungsstatus zum Broker anzeigen (Client-Thread)"""
+        if connected:
+            status = ("● Broker", self.colors['accent_secondary'])
+        else:
+            status = ("● Broker offline", self.colors['accent_tertiary'])
+        self.scheduler.call_soon(self.set_connection_status, *status, key='connection_status')
+
+    def setup_status_server(self):
+        """HTTP/WebSocket-Status starten (nur mit --http-port)"""
+        if not self.http_port:
+            return
+        from status_server import StatusServer
+
+        pages = {page_id: info['name'] for page_id, info in self.signal_definitions.items()}
+        server = StatusServer(self.http_port, self.http_host, pages=pages,
+                              on_page_select=self.on_remote_page_select,
+                              metrics=self.collect_metrics, token=self.http_token)
+        try:
+            server.start()
+        except OSError as e:
+            logger.warning("⚠️ Status-Server konnte nicht starten (Port %s): %s", self.http_port, e)
+            return
+        self.status_server = server
+        logger.info("🌐 Status-Server: %s", server.url)
+
+    def on_remote_page_select(self, page_id):
+        """Seitenwahl aus dem Browser (Server-Thread) - gleicher Weg wie der GUI-Button"""
+        self.scheduler.call_soon(self.on_manual_page_select, page_id, key='remote_page_select')
+
+    def setup_metrics(self):
+        """Queue-Tiefen als Gauges - werden erst beim Export abgefragt"""
+        metrics.gauge('bertrandt_data_queue_depth', 'Wartende Events (Serial/Broker -> GUI)').set_function(
+            self.data_queue.qsize)
+        metrics.gauge('bertrandt_ui_queue_depth', 'Wartende Callbacks im Tk-Scheduler').set_function(
+            lambda: self.scheduler.stats()['queue_depth'])
+
+    def collect_metrics(self):
+        """Messwerte für /api/metrics (wird im Server-Thread aufgerufen)"""
+        metrics = {
+            'scheduler': self.scheduler.stats(),
+            'navigation': dict(self.nav_stats),
+            'ui_stalls': self.ui_watchdog.histogram(),
+            'layout': dict(self.layout.stats, width=self.layout.width, height=self.layout.height),
+            'images': dict(self.image_cache.stats),
+        }
+        if TRACER.enabled:
+            metrics['tracing'] = TRACER.summary()
+        broker_client = self.broker_client
+        if broker_client:
+            metrics['broker'] = broker_client.summary()
+        if self.link_stats.active:
+            metrics['link'] = self.link_stats.summary()
+        if self.input_map.stats['inputs']:
+            metrics['inputs'] = self.input_map.summary()
+        if self.client_series.stats['reports']:
+            metrics['clients'] = self.client_series.summary()
+        if self.text_view:
+            metrics['text_layout'] = self.text_view.summary()
+        transitions = getattr(self.page_renderer, 'transitions', None)
+        if transitions:
+            metrics['transitions'] = dict(transitions.stats, enabled=transitions.enabled)
+        return metrics
+
+    def start_serial_reading(self):
+        """Serial-Daten lesen starten"""
+        self.running = True
+        self.serial_thread = threading.Thread(target=self.read_serial_data, name='serial-reader')
+        self.serial_thread.daemon = True
+        self.serial_thread.start()
+
+        # GUI-Update-Loop starten (nur einmal, auch nach Reconnect)
+        if not self.serial_pump:
+            self.serial_pump = self.scheduler.every(50, self.process_serial_data, initial_delay_ms=0)
+
+    def read_serial_data(self):
+        """Serial-Daten in separatem Thread lesen"""
+        while self.running and self.serial_connection:
+            try:
+                # Blockiert bis zum Zeilenende (max. 1 s Timeout) - kein Polling von in_waiting
+                line = self.serial_connection.readline()
+                # Nach cancel_read() keine halbe Zeile mehr auswerten
+                if not line or not self.running:
+                    continue
+                received = time.perf_counter()
+                # Trace beginnt, sobald die Zeile da ist (readline wartet auf das ESP32)
+                trace_id = TRACER.new_trace()
+                with TRACER.span('serial_parse', trace_id):
+                    event = parse_line(line)
+                if event and event['type'] in ('signal', 'clients'):
+                    # Wiederholte oder verspätete Pakete des GIGA nicht noch einmal anzeigen
+                    if not self.link_stats.observe(event, received):
+                        continue
+                    # GIGA im Event-Modus: Eingang -> Signal (Loslassen löst meist nichts aus)
+                    event = self.input_map.translate(event)
+                    if not event:
+                        continue
+                    self.data_queue.put((queue_type(event), event['value'], TRACER.enqueue(trace_id)))
+            except Exception as e:
+                logger.error("Serial read error: %s", e)
+                time.sleep(0.1)
+
+    def process_serial_data(self):
+        """Serial-Daten verarbeiten (GUI-Thread)"""
+        try:
+            while not self.data_queue.empty():
+                data_type, value, trace = self.data_queue.get_nowait()
+
+                # Wartezeit in der Queue ist der erste Span im GUI-Thread
+                with TRACER.activate(TRACER.dequeue(trace)), TRACER.span('process_serial_data', type=data_type):
+                    if data_type == 'signal':
+                        self.update_signal(self.page_map.get(value, value))
+                    elif data_type in ('clients', CLIENTS_HEARTBEAT):
+                        self.update_client_count(value, heartbeat=data_type == CLIENTS_HEARTBEAT)
+
+        except queue.Empty:
+            pass
+
+    def stop_serial_reading(self):
+        """Serial-Thread beenden und Verbindung schließen"""
+        self.running = False
+        # Noch laufender Verbindungsaufbau darf danach nichts mehr starten
+        self.serial_generation += 1
+        if self.broker_client:
+            self.broker_client.stop()
+            self.broker_client = None
+        if self.serial_thread and self.serial_thread.is_alive():
+            # readline() blockiert bis zu 1 s - abbrechen, sonst hängt der GUI-Thread im join()
+            if self.serial_connection and hasattr(self.serial_connection, 'cancel_read'):
+                try:
+                    self.serial_connection.cancel_read()
+                except Exception:
+                    pass
+            self.serial_thread.join(timeout=1.5)
+        if self.serial_connection:
+            self.serial_connection.close()
+            self.serial_connection = None
+
+    def restart_connection(self):
+        """Verbindung neu starten"""
+        SERIAL_RECONNECTS.inc()
+        self.stop_serial_reading()
+        self.setup_serial()
+
+    def on_device_hotplug(self, event, info):
+        """Hotplug-Event aus der Device Registry (Monitor-Thread)"""
+        self.scheduler.call_soon(self._handle_device_hotplug, event, info)
+
+    def _handle_device_hotplug(self, event, info):
+        """Port-Liste und ESP32-Verbindung an Hotplug anpassen (GUI-Thread)"""
+        kind = info['kind'] or "USB-Gerät"
+        action = "angeschlossen" if event == 'add' else "entfernt"
+        logger.info("🔌 %s %s: %s", kind, action, info['port'])
+        self.update_port_list()
+
+        # Während des Flashens melden sich Boards ständig neu an; im Broker-Modus gehört der Port dem Broker
+        if self.flash_running or self.broker_path:
+            return
+
+        if event == 'add' and info['kind'] == 'ESP32' and not self.serial_connection and not self.serial_connect_pending():
+            self.esp32_port = info['port']
+            self.restart_connection()
+        elif event == 'remove' and info['port'] == self.esp32_port and self.serial_connection:
+            self.stop_serial_reading()
+            self.set_connection_status("● Offline", self.colors['accent_tertiary'])
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Eingangs-Zuordnung
+Der GIGA im Event-Modus meldet Eingänge statt Seiten: "SIGNAL:<eingang>;ev=1" (1 = gedrückt/aktiv,
+0 = losgelassen/inaktiv). Welcher Eingang welches Signal auslöst, steht hier auf dem Host - ein Umbau
+am Stand braucht kein Neuflashen. Danach gilt --page-map (Signal -> Seite) wie gewohnt.
+
+Format als Text: "1=3,2=5,4:release=1" oder als JSON-Datei:
+    {"inputs": {"1": {"name": "Taster Start", "press": 1},
+                "4": {"name": "Lichtschranke", "press": 7, "release": 1}}}
+Ohne Eintrag: Drücken löst das Signal mit der Nummer des Eingangs aus, Loslassen nichts.
+"""
+
+import json
+import os
+import threading
+
+from log_setup import get_logger
+
+PRESS = 1
+RELEASE = 0
+EDGES = {'press': PRESS, 'on': PRESS, 'release': RELEASE, 'off': RELEASE}
+
+logger = get_logger('inputs')
+
+
+class InputMap:
+    """(Eingang, Flanke) -> Signal; Events ohne 'ev' (Zyklus-Modus, alte Firmware) bleiben unverändert"""
+
+    def __init__(self, mapping=None, names=None, default_press=True):
+        self.mapping = dict(mapping or {})
+        self.names = dict(names or {})
+        # Nicht eingetragene Eingänge: Drücken = gleichnamiges Signal
+        self.default_press = default_press
+        self.stats = {'inputs': 0, 'mapped': 0, 'ignored': 0}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_spec(cls, spec):
+        """Zuordnung aus JSON-Datei oder Text "1=3,2:release=5" laden (None/leer = Standard)"""
+        if not spec:
+            return cls()
+        mapping, names = {}, {}
+        if os.path.exists(spec):
+            with open(spec, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+            inputs = config.get('inputs', config)
+            for input_id, entry in inputs.items():
+                if isinstance(entry, dict):
+                    if 'name' in entry:
+                        names[int(input_id)] = entry['name']
+                    for edge_name, edge in EDGES.items():
+                        if entry.get(edge_name) is not None:
+                            mapping[(int(input_id), edge)] = int(entry[edge_name])
+                else:
+                    mapping[(int(input_id), PRESS)] = int(entry)
+        else:
+            for pair in spec.split(','):
+                source, signal = pair.split('=')
+                input_id, _, edge_name = source.partition(':')
+                mapping[(int(input_id), EDGES[edge_name.strip() or 'press'])] = int(signal)
+        # Mit eigener Zuordnung lösen nur eingetragene Eingänge etwas aus
+        return cls(mapping, names, default_press=not mapping)
+
+    def resolve(self, input_id, edge):
+        """Signal für einen Eingang und eine Flanke, None = ignorieren"""
+        if (input_id, edge) in self.mapping:
+            return self.mapping[(input_id, edge)]
+        if edge == PRESS and self.default_press:
+            return input_id
+        return None
+
+    def translate(self, event):
+        """Eingangs-Event in ein Signal-Event übersetzen; None, wenn die Flanke nichts auslöst"""
+        if event.get('type') != 'signal' or 'ev' not in event:
+            return event
+        input_id = event['value']
+        signal = self.resolve(input_id, event['ev'])
+        with self._lock:
+            self.stats['inputs'] += 1
+            self.stats['mapped' if signal is not None else 'ignored'] += 1
+        if signal is None:
+            return None
+        logger.debug("🎛️ Eingang %s (%s) -> Signal %s", input_id, self.name(input_id), signal)
+        return dict(event, value=signal, input=input_id)
+
+    def name(self, input_id):
+        return self.names.get(input_id, f"Eingang {input_id}")
+
+    def summary(self):
+        with self._lock:
+            return dict(self.stats, configured=len(self.mapping))
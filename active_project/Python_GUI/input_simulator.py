@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Eingangs-Simulator
+Taster und Sensoren des GIGA im Event-Modus ohne Hardware: prellende Kontakte, Störimpulse,
+dieselbe Entprellung wie GIGA_UDP_Sender.ino (LEADING/TRAILING) und dasselbe Paketformat per UDP
+an ESP32, Emulator oder Broker.
+"""
+
+import argparse
+import heapq
+import itertools
+import random
+import threading
+import time
+
+from load_generator import UdpSink
+from log_setup import get_logger
+
+LEADING = 'leading'
+TRAILING = 'trailing'
+
+# Wie INPUTS[] im Sketch
+DEFAULT_INPUTS = (
+    {'input_id': 1, 'name': 'Taster Start', 'debounce_ms': 20, 'debounce': LEADING},
+    {'input_id': 2, 'name': 'Taster Weiter', 'debounce_ms': 20, 'debounce': LEADING},
+    {'input_id': 3, 'name': 'Taster Zurück', 'debounce_ms': 20, 'debounce': LEADING},
+    # Besucher steht etwa eine Sekunde in der Lichtschranke
+    {'input_id': 4, 'name': 'Lichtschranke', 'debounce_ms': 150, 'debounce': TRAILING, 'report_release': True,
+     'hold_ms': 1000},
+)
+
+# Kontaktprellen eines typischen Tasters
+BOUNCE_MS = 5.0
+BOUNCE_EDGES = 6
+HOLD_MS = 150
+# Störimpulse auf Sensorleitungen
+GLITCH_MS = 3.0
+# loop()-Takt - der GIGA ist schneller, time.sleep() nicht
+POLL_INTERVAL_MS = 0.5
+
+logger = get_logger('inputs')
+
+
+class SimulatedInput:
+    """Ein Eingang: physischer Pegel und Entprell-Zustand wie pollInputs() im Sketch"""
+
+    def __init__(self, input_id, name='', debounce_ms=20, debounce=LEADING, report_release=False, hold_ms=HOLD_MS):
+        self.input_id = input_id
+        self.name = name or f"Eingang {input_id}"
+        self.debounce_ms = debounce_ms
+        self.debounce = debounce
+        self.report_release = report_release
+        # Typische Betätigungsdauer für press()
+        self.hold_ms = hold_ms
+        self.level = False
+        self.reported = False
+        self.edge_pending = False
+        self.edge_at = 0.0
+        self.last_edge_at = 0.0
+        self.last_change = float('-inf')
+        # Beginn der aktuellen Betätigung (erste Flanke) - Bezugspunkt der Reaktionszeit, None = Störimpuls
+        self.pressed_at = None
+
+    def set_level(self, active, at):
+        """Interrupt-Routine: Pegelwechsel mit Zeitstempel merken"""
+        if active != self.level:
+            self.level = active
+            self.edge_pending = True
+            self.edge_at = at
+
+    def poll(self, now):
+        """Ein Durchlauf von pollInputs() -> (aktiv, Zeit der letzten Flanke) oder None"""
+        edge = self.edge_pending
+        if edge:
+            self.last_edge_at = self.edge_at
+            self.edge_pending = False
+
+        if self.debounce == TRAILING and edge:
+            # Pegel muss nach der letzten Flanke debounce_ms lang stabil bleiben
+            self.last_change = now
+            return None
+        if now - self.last_change < self.debounce_ms / 1000:
+            return None
+        if self.level == self.reported:
+            return None
+        self.reported = self.level
+        self.last_change = now
+        if self.level or self.report_release:
+            return self.level, self.last_edge_at
+        return None
+
+
+class InputSimulator:
+    """Zeitplan physischer Flanken abspielen, entprellen und Änderungen wie der GIGA senden"""
+
+    def __init__(self, sink, inputs=DEFAULT_INPUTS, poll_interval_ms=POLL_INTERVAL_MS, seed=None):
+        self.sink = sink
+        self.inputs = {config['input_id']: SimulatedInput(**config) for config in inputs}
+        self.poll_interval = poll_interval_ms / 1000
+        self.rng = random.Random(seed)
+        self.running = False
+        self.reports = []
+        self.stats = {'presses': 0, 'glitches': 0, 'reported': 0, 'released': 0}
+        self._timeline = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    # --- Zeitplan --------------------------------------------------------------
+
+    def _schedule(self, at, input_id, active, cause=None):
+        """cause: 'press'/'glitch' an der ersten Flanke einer Betätigung bzw. eines Störimpulses"""
+        with self._lock:
+            heapq.heappush(self._timeline, (at, next(self._order), input_id, active, cause))
+
+    def _bounce(self, at, input_id, final, bounce_ms, edges):
+        """Prellende Flanke: Pegel springt einige Male, bevor er bei final bleibt"""
+        offsets = sorted(self.rng.uniform(0, bounce_ms / 1000) for _ in range(edges))
+        level = final
+        for offset in offsets:
+            self._schedule(at + offset, input_id, level)
+            level = not level
+        self._schedule(at + bounce_ms / 1000, input_id, final)
+
+    def press(self, input_id, at=None, hold_ms=None, bounce_ms=BOUNCE_MS, bounce_edges=BOUNCE_EDGES):
+        """Taster drücken und nach hold_ms loslassen (mit Prellen an beiden Flanken)"""
+        at = time.perf_counter() if at is None else at
+        hold_ms = self.inputs[input_id].hold_ms if hold_ms is None else hold_ms
+        self._schedule(at, input_id, True, cause='press')
+        self._bounce(at, input_id, True, bounce_ms, bounce_edges)
+        self._bounce(at + hold_ms / 1000, input_id, False, bounce_ms, bounce_edges)
+        self.stats['presses'] += 1
+
+    def glitch(self, input_id, at=None, width_ms=GLITCH_MS):
+        """Kurzer Störimpuls - darf mit TRAILING-Entprellung nichts auslösen"""
+        at = time.perf_counter() if at is None else at
+        self._schedule(at, input_id, True, cause='glitch')
+        self._schedule(at + width_ms / 1000, input_id, False)
+        self.stats['glitches'] += 1
+
+    def visitors(self, duration, presses_per_minute=30, glitch_ratio=0.0, start=None):
+        """Zufällige Betätigungen über duration Sekunden; ein Eingang erst wieder nach Loslassen + Entprellzeit"""
+        at = time.perf_counter() if start is None else start
+        mean_gap = 60 / presses_per_minute
+        end = at + duration
+        busy_until = {input_id: at for input_id in self.inputs}
+        while True:
+            at += self.rng.expovariate(1 / mean_gap)
+            if at >= end:
+                break
+            free = [input_id for input_id, until in busy_until.items() if until <= at]
+            if not free:
+                continue
+            input_id = self.rng.choice(free)
+            simulated = self.inputs[input_id]
+            if self.rng.random() < glitch_ratio:
+                self.glitch(input_id, at)
+                busy_until[input_id] = at + (GLITCH_MS + simulated.debounce_ms) / 1000
+            else:
+                self.press(input_id, at)
+                busy_until[input_id] = at + (simulated.hold_ms + BOUNCE_MS + 2 * simulated.debounce_ms) / 1000
+
+    # --- loop() ------------------------------------------------------------------
+
+    def start(self):
+        self.running = True
+        self._thread = threading.Thread(target=self.run, name='input-simulator', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def pending(self):
+        with self._lock:
+            return len(self._timeline)
+
+    def run(self, until_idle=False):
+        """Flanken zu ihrer Zeit anlegen und pollen wie loop() (blockiert)"""
+        self.running = True
+        while self.running:
+            now = time.perf_counter()
+            with self._lock:
+                due = []
+                while self._timeline and self._timeline[0][0] <= now:
+                    due.append(heapq.heappop(self._timeline))
+                idle = not self._timeline
+            for at, _, input_id, active, cause in due:
+                simulated = self.inputs[input_id]
+                if cause:
+                    # Meldungen nach einem Störimpuls haben keine echte Betätigung
+                    simulated.pressed_at = at if cause == 'press' else None
+                # Interrupt-Zeitstempel ist der physische Zeitpunkt, nicht der Poll-Zeitpunkt
+                simulated.set_level(active, at)
+            for simulated in self.inputs.values():
+                report = simulated.poll(now)
+                if report:
+                    self._send(simulated, *report)
+            if until_idle and idle and not any(s.level != s.reported for s in self.inputs.values()):
+                break
+            time.sleep(self.poll_interval)
+        self.running = False
+
+    def _send(self, simulated, active, edge_at):
+        now = time.perf_counter()
+        age_us = int((now - edge_at) * 1_000_000)
+        self.sink.send(f"SIGNAL:{simulated.input_id}", f";ev={int(active)};age={age_us}")
+        self.stats['reported' if active else 'released'] += 1
+        self.reports.append({'input': simulated.input_id, 'active': active, 'sent_at': now,
+                             'pressed_at': simulated.pressed_at if active else None})
+
+    def summary(self):
+        false_triggers = sum(1 for report in self.reports if report['active'] and report['pressed_at'] is None)
+        return dict(self.stats, extra=max(0, self.stats['reported'] - self.stats['presses']),
+                    false_triggers=false_triggers,
+                    dropped=self.sink.dropped, acks=getattr(self.sink, 'acks', 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GIGA-Eingänge (Taster/Sensoren) ohne Hardware simulieren')
+    parser.add_argument('--udp-host', default='127.0.0.1')
+    parser.add_argument('--udp-port', type=int, default=4210, help='ESP32/Emulator (4210) oder Broker --udp-port')
+    parser.add_argument('--duration', type=float, default=60, help='Sekunden')
+    parser.add_argument('--rate', type=float, default=30, help='Betätigungen pro Minute')
+    parser.add_argument('--glitches', type=float, default=0.0, help='Anteil Störimpulse statt Betätigungen')
+    parser.add_argument('--debounce', choices=(LEADING, TRAILING), default=None,
+                        help='Entprellung aller Eingänge überschreiben')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    import log_setup
+    log_setup.setup_logging(log_file=None)
+
+    inputs = [dict(config, debounce=args.debounce or config['debounce']) for config in DEFAULT_INPUTS]
+    sink = UdpSink(args.udp_host, args.udp_port, ack=True)
+    simulator = InputSimulator(sink, inputs, seed=args.seed)
+    simulator.visitors(args.duration, args.rate, args.glitches)
+    logger.info("🎛️ Simuliere %s Betätigungen, %s Störimpulse an %s:%s", simulator.stats['presses'],
+                simulator.stats['glitches'], args.udp_host, args.udp_port)
+    try:
+        simulator.run(until_idle=True)
+    except KeyboardInterrupt:
+        simulator.running = False
+    finally:
+        sink.close()
+        summary = simulator.summary()
+        logger.info("🎛️ %s gemeldet (%s durch Störimpulse, %s zu viel), %s Loslassen, %s ACKs",
+                    summary['reported'], summary['false_triggers'], summary['extra'], summary['released'],
+                    summary['acks'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Kiosk Renderer
+Headless-Anzeige ohne Tk und X-Server: Seiten werden mit PIL aus content/ gerendert
+und direkt in den Linux-Framebuffer oder ein Shared-Memory-Bild (kiosk_viewer.py) geschrieben
+"""
+
+import argparse
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+
+from PIL import Image, ImageChops, ImageDraw
+
+import log_setup
+import metrics
+from page_bitmaps import LIVE_LAYOUTS, PageBitmapCache, pil_font
+from page_content import PAGES, load_page
+from signal_protocol import parse_line
+from theme import COLORS, make_fonts
+
+logger = log_setup.get_logger('kiosk')
+
+# Statusleiste über der Seite (Seite, Clients, Verbindung, Uhrzeit)
+STATUS_BAR_HEIGHT = 48
+
+DEFAULT_SIZE = (1920, 1080)
+DEFAULT_SHM_NAME = 'bertrandt_kiosk'
+
+# Shared-Memory-Kopf: Magic, Breite, Höhe, Frame-Zähler (ungerade = Frame wird gerade geschrieben)
+SHM_HEADER = struct.Struct('<4sIII')
+SHM_MAGIC = b'BKIO'
+
+PAGE_SWITCH_SECONDS = metrics.histogram('bertrandt_page_switch_seconds', 'Dauer eines Seitenwechsels',
+                                        renderer='kiosk')
+
+
+def parse_size(text):
+    """ "1920x1080" -> (1920, 1080) """
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def still_config(config):
+    """Video-Layouts als Standbild zeigen (Text statt Videoplayer)"""
+    if config.get('layout', 'text_only') in LIVE_LAYOUTS:
+        return dict(config, layout='text_only')
+    return config
+
+
+def rgb565(frame):
+    """RGB-Bild als RGB565 (Little Endian) für 16-Bit-Framebuffer"""
+    r, g, b = frame.convert('RGB').split()
+    high = ImageChops.add(r.point(lambda v: v & 0xF8), g.point(lambda v: v >> 5))
+    low = ImageChops.add(g.point(lambda v: (v << 3) & 0xE0), b.point(lambda v: v >> 3))
+    return Image.merge('LA', (low, high)).tobytes()
+
+
+class FramebufferSink:
+    """Frames direkt in /dev/fbX schreiben (Größe und Pixelformat aus sysfs)"""
+
+    def __init__(self, device='/dev/fb0'):
+        sysfs = os.path.join('/sys/class/graphics', os.path.basename(device))
+        self.width, self.height = self._visible_size(sysfs)
+        self.bpp = int(self._read(sysfs, 'bits_per_pixel'))
+        if self.bpp not in (16, 24, 32):
+            raise ValueError(f"Nicht unterstütztes Pixelformat: {self.bpp} bpp")
+        self.row_bytes = self.width * self.bpp // 8
+        try:
+            self.stride = int(self._read(sysfs, 'stride'))
+        except OSError:
+            self.stride = self.row_bytes
+        self._fd = os.open(device, os.O_RDWR)
+        self._map = mmap.mmap(self._fd, self.stride * self.height)
+
+    @staticmethod
+    def _read(sysfs, name):
+        with open(os.path.join(sysfs, name), 'r') as f:
+            return f.read().strip()
+
+    def _visible_size(self, sysfs):
+        # Sichtbarer Modus (z.B. "U:1920x1080p-0"), virtual_size kann für Double-Buffering größer sein
+        try:
+            mode = self._read(sysfs, 'modes').splitlines()[0]
+            return parse_size(mode.split(':')[-1].split('p')[0].split('i')[0])
+        except (OSError, IndexError, ValueError):
+            width, height = self._read(sysfs, 'virtual_size').split(',')
+            return int(width), int(height)
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def _encode(self, frame):
+        if self.bpp == 16:
+            return rgb565(frame)
+        return frame.convert('RGB').tobytes('raw', 'BGRX' if self.bpp == 32 else 'BGR')
+
+    def show(self, frame, top=0, bottom=None):
+        """Zeilen top..bottom des Frames ausgeben (Standard: ganzes Bild)"""
+        bottom = self.height if bottom is None else bottom
+        data = self._encode(frame.crop((0, top, self.width, bottom)))
+        if self.stride == self.row_bytes:
+            self._map[top * self.stride:top * self.stride + len(data)] = data
+            return
+        for row in range(bottom - top):
+            offset = (top + row) * self.stride
+            self._map[offset:offset + self.row_bytes] = data[row * self.row_bytes:(row + 1) * self.row_bytes]
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)
+
+
+class SharedMemorySink:
+    """Frames als RGB in Shared Memory ablegen - kiosk_viewer.py zeigt sie an"""
+
+    def __init__(self, size=DEFAULT_SIZE, name=DEFAULT_SHM_NAME):
+        # Erst hier laden - multiprocessing kostet spürbar Startzeit
+        from multiprocessing import shared_memory
+
+        self.width, self.height = size
+        self.name = name
+        length = SHM_HEADER.size + self.width * self.height * 3
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=length)
+        except FileExistsError:
+            # Übrig gebliebener Speicher eines beendeten Kiosks
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=length)
+        self.frame_counter = 0
+        self._write_header()
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def _write_header(self):
+        SHM_HEADER.pack_into(self._shm.buf, 0, SHM_MAGIC, self.width, self.height, self.frame_counter)
+
+    def show(self, frame, top=0, bottom=None):
+        bottom = self.height if bottom is None else bottom
+        data = frame.crop((0, top, self.width, bottom)).convert('RGB').tobytes()
+        offset = SHM_HEADER.size + top * self.width * 3
+        # Ungerader Zähler: Viewer überspringt den halb geschriebenen Frame
+        self.frame_counter += 1
+        self._write_header()
+        self._shm.buf[offset:offset + len(data)] = data
+        self.frame_counter += 1
+        self._write_header()
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+
+class PngSink:
+    """Frames als PNG-Datei speichern (Test/Vorschau)"""
+
+    def __init__(self, path, size=DEFAULT_SIZE):
+        self.path = path
+        self.size = size
+
+    def show(self, frame, top=0, bottom=None):
+        temp_path = self.path + '.tmp'
+        frame.save(temp_path, format='PNG')
+        os.replace(temp_path, self.path)
+
+    def close(self):
+        pass
+
+
+class KioskRenderer:
+    def __init__(self, sink, content_dir, page_map=None):
+        self.sink = sink
+        self.width, self.height = sink.size
+        self.content_dir = content_dir
+        # Signal -> Seite (wie --page-map in der GUI)
+        self.page_map = page_map or {}
+        # GIGA-Eingang -> Signal, nur bei direktem Serial-Eingang (der Broker übersetzt selbst)
+        self.input_map = None
+        self.colors = COLORS
+        self.fonts = make_fonts(self.width, self.height)
+        self.cache = PageBitmapCache(self.colors, self.fonts, truncate=True)
+        self.events = queue.Queue()
+        self.running = False
+
+        self.current_page = 1
+        self.client_count = 0
+        self.connection = "Offline"
+
+        self.frame = Image.new('RGB', (self.width, self.height), self.colors['background_primary'])
+        self._shown_signature = None
+        self._status_text = None
+        self.stats = {'page_renders': 0, 'status_updates': 0, 'render_ms': 0.0}
+
+    # --- Eingänge ---------------------------------------------------------------
+
+    def attach_serial(self, port, baudrate=115200):
+        """ESP32 Serial-Ausgabe direkt lesen"""
+        import serial
+
+        connection = serial.Serial(port, baudrate, timeout=1)
+        self.events.put(('status', "Online"))
+
+        def read_loop():
+            try:
+                while self.running:
+                    event = parse_line(connection.readline())
+                    if event and self.input_map:
+                        event = self.input_map.translate(event)
+                    if event and event['type'] in ('signal', 'clients'):
+                        self.events.put((event['type'], event['value']))
+            except serial.SerialException as e:
+                logger.error("❌ Serial-Eingang beendet: %s", e)
+                self.events.put(('status', "Offline"))
+            finally:
+                connection.close()
+
+        threading.Thread(target=read_loop, name='kiosk-serial', daemon=True).start()
+
+    def attach_broker(self, socket_path):
+        """Signale vom Broker-Prozess lesen (cli_monitor.py --action broker)"""
+        from signal_broker import BrokerClient
+
+        def on_event(event):
+            if event['type'] in ('signal', 'clients'):
+                self.events.put((event['type'], event['value']))
+
+        def on_status(connected):
+            self.events.put(('status', "Broker" if connected else "Broker offline"))
+
+        client = BrokerClient(socket_path, on_event=on_event, on_status=on_status)
+        client.start()
+        self.events.put(('status', "Broker..."))
+        return client
+
+    def attach_cycle(self, interval):
+        """Ohne Hardware: Seiten reihum zeigen"""
+        self.events.put(('status', "Demo"))
+
+        def cycle_loop():
+            page_ids = sorted(PAGES)
+            index = 0
+            while self.running:
+                time.sleep(interval)
+                index = (index + 1) % len(page_ids)
+                self.events.put(('signal', page_ids[index]))
+
+        threading.Thread(target=cycle_loop, name='kiosk-cycle', daemon=True).start()
+
+    # --- Rendern ----------------------------------------------------------------
+
+    def render_page(self):
+        """Seiten-Bereich neu zusammensetzen, falls sich Inhalt oder Seite geändert haben"""
+        config, page_dir = load_page(self.content_dir, self.current_page)
+        size = (self.width, self.height - STATUS_BAR_HEIGHT)
+        start = time.perf_counter()
+        signature, bitmap = self.cache.get(still_config(config), page_dir, size)
+        if signature == self._shown_signature:
+            return False
+        self._shown_signature = signature
+        self.frame.paste(bitmap, (0, STATUS_BAR_HEIGHT))
+        elapsed = time.perf_counter() - start
+        self.stats['page_renders'] += 1
+        self.stats['render_ms'] += elapsed * 1000
+        PAGE_SWITCH_SECONDS.observe(elapsed)
+        return True
+
+    def render_status_bar(self):
+        """Statusleiste zeichnen; False wenn sich nichts geändert hat (Uhr sekundengenau)"""
+        page_name = PAGES.get(self.current_page, {}).get('name', '')
+        status_text = (f"{self.current_page} · {page_name}",
+                       f"Clients: {self.client_count}  ·  {self.connection}  ·  {time.strftime('%H:%M:%S')}")
+        if status_text == self._status_text:
+            return False
+        self._status_text = status_text
+
+        page_color = self.colors[PAGES.get(self.current_page, {}).get('color', 'accent_primary')]
+        font = pil_font(self.fonts['button'])
+        draw = ImageDraw.Draw(self.frame)
+        middle = STATUS_BAR_HEIGHT // 2
+        draw.rectangle((0, 0, self.width, STATUS_BAR_HEIGHT - 1), fill=self.colors['bertrandt_blue'])
+        draw.rectangle((0, STATUS_BAR_HEIGHT - 4, self.width, STATUS_BAR_HEIGHT - 1), fill=page_color)
+        draw.text((20, middle), "BERTRANDT", font=font, fill=self.colors['bertrandt_orange'], anchor='lm')
+        draw.text((self.width // 2, middle), status_text[0], font=font, fill='#FFFFFF', anchor='mm')
+        draw.text((self.width - 20, middle), status_text[1], font=pil_font(self.fonts['caption']),
+                  fill='#FFFFFF', anchor='rm')
+        self.stats['status_updates'] += 1
+        return True
+
+    def redraw(self):
+        """Nur geänderte Bereiche ausgeben (Uhr-Update = nur die Statusleiste)"""
+        page_changed = self.render_page()
+        status_changed = self.render_status_bar()
+        if page_changed:
+            self.sink.show(self.frame)
+        elif status_changed:
+            self.sink.show(self.frame, 0, STATUS_BAR_HEIGHT)
+
+    def handle(self, kind, value):
+        if kind == 'signal':
+            page_id = self.page_map.get(value, value)
+            if page_id in PAGES:
+                self.current_page = page_id
+        elif kind == 'clients':
+            self.client_count = value
+        elif kind == 'status':
+            self.connection = value
+
+    def run(self):
+        """Event-Schleife: Events abarbeiten, einmal pro Sekunde die Uhr aktualisieren"""
+        self.running = True
+        try:
+            while self.running:
+                timeout = 1.0 - (time.time() % 1.0)
+                try:
+                    self.handle(*self.events.get(timeout=timeout))
+                    # Signal-Bursts bündeln - nur der letzte Stand wird gezeichnet
+                    while True:
+                        self.handle(*self.events.get_nowait())
+                except queue.Empty:
+                    pass
+                self.redraw()
+        finally:
+            self.running = False
+
+    def stop(self):
+        self.running = False
+
+
+def main():
+    started = time.perf_counter()
+    parser = argparse.ArgumentParser(description='Bertrandt Kiosk Renderer (ohne Tk/X-Server)')
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--framebuffer', nargs='?', const='/dev/fb0', default=None,
+                        help='Direkt in den Framebuffer schreiben (Standard: /dev/fb0)')
+    output.add_argument('--shm', nargs='?', const=DEFAULT_SHM_NAME, default=None,
+                        help='Frames in Shared Memory für kiosk_viewer.py ablegen')
+    output.add_argument('--output', default=None,
+                        help='Frames als PNG-Datei speichern (Vorschau)')
+    parser.add_argument('--size', type=parse_size, default=DEFAULT_SIZE,
+                        help='Bildgröße für --shm/--output, z.B. 1920x1080')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--esp32-port', default=None, help='ESP32 Serial Port')
+    source.add_argument('--broker', nargs='?', const='', default=None,
+                        help='Signale vom Broker-Socket lesen')
+    source.add_argument('--cycle', type=float, default=None,
+                        help='Ohne Hardware: Seiten alle N Sekunden wechseln')
+    parser.add_argument('--page', type=int, default=1, help='Startseite')
+    parser.add_argument('--page-map', default=None,
+                        help='Signal -> Seite, z.B. "1=3,2=5" oder JSON-Datei')
+    parser.add_argument('--input-map', default=None,
+                        help='GIGA-Eingang -> Signal im Event-Modus (nur --esp32-port)')
+    parser.add_argument('--content-dir', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "content"),
+                        help='Content-Ordner (wie in der GUI)')
+    parser.add_argument('--once', action='store_true', help='Einen Frame rendern und beenden')
+    metrics.add_arguments(parser)
+    log_setup.add_arguments(parser)
+    args = parser.parse_args()
+    log_setup.setup_from_args(args)
+    metrics_exporter = metrics.start_from_args(args)
+
+    if args.framebuffer:
+        sink = FramebufferSink(args.framebuffer)
+    elif args.shm:
+        sink = SharedMemorySink(args.size, args.shm)
+    else:
+        sink = PngSink(args.output or 'kiosk_frame.png', args.size)
+
+    page_map = {}
+    if args.page_map:
+        from signal_broker import load_page_map
+        page_map = load_page_map(args.page_map)
+
+    kiosk = KioskRenderer(sink, args.content_dir, page_map)
+    if args.esp32_port:
+        from input_map import InputMap
+        kiosk.input_map = InputMap.from_spec(args.input_map)
+    kiosk.current_page = args.page
+    kiosk.running = True
+    broker_client = None
+    try:
+        if args.esp32_port:
+            kiosk.attach_serial(args.esp32_port)
+        elif args.broker is not None:
+            from signal_broker import DEFAULT_SOCKET_PATH
+            broker_client = kiosk.attach_broker(args.broker or DEFAULT_SOCKET_PATH)
+        elif args.cycle:
+            kiosk.attach_cycle(args.cycle)
+
+        kiosk.redraw()
+        logger.info("🖥️ Kiosk %sx%s: erster Frame nach %.0f ms",
+                    kiosk.width, kiosk.height, (time.perf_counter() - started) * 1000)
+        if not args.once:
+            kiosk.run()
+    except KeyboardInterrupt:
+        logger.info("👋 Kiosk beendet")
+    finally:
+        kiosk.stop()
+        if broker_client:
+            broker_client.stop()
+        if metrics_exporter:
+            metrics_exporter.stop()
+        sink.close()
+
+
+if __name__ == "__main__":
+    main()
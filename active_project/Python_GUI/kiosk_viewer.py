@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Kiosk Viewer
+Schlanke Anzeige für kiosk_renderer.py --shm: kopiert fertige Frames aus dem
+Shared Memory in ein einziges PhotoImage - keine Content-Logik
+"""
+
+import argparse
+import os
+import time
+import tkinter as tk
+from multiprocessing import resource_tracker, shared_memory
+
+from PIL import Image, ImageTk
+
+from kiosk_renderer import DEFAULT_SHM_NAME, SHM_HEADER, SHM_MAGIC
+
+POLL_MS = 20
+RECONNECT_MS = 1000
+
+# POSIX Shared Memory liegt unter Linux als Datei hier - neue Inode heißt "Renderer neu gestartet"
+SHM_DIR = '/dev/shm'
+
+
+def open_shared_memory(name):
+    """Fremden Shared Memory öffnen, ohne ihn beim Beenden freizugeben"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: resource_tracker würde den Speicher des Renderers sonst löschen
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def segment_id(name):
+    """(Gerät, Inode) des Shared Memory; None wenn er fehlt oder nicht als Datei sichtbar ist"""
+    try:
+        stat = os.stat(os.path.join(SHM_DIR, name))
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+class KioskViewer:
+    def __init__(self, name=DEFAULT_SHM_NAME, fullscreen=False):
+        self.name = name
+        self.root = tk.Tk()
+        self.root.title("Bertrandt Kiosk")
+        self.root.configure(bg='black')
+        self.root.attributes('-fullscreen', fullscreen)
+        self.root.bind('<Escape>', lambda e: self.root.attributes('-fullscreen', False))
+        self.label = tk.Label(self.root, bg='black', borderwidth=0)
+        self.label.pack(fill='both', expand=True)
+        self.shm = None
+        self.photo = None
+        self.last_counter = None
+        self.segment = None
+        self.last_change = time.monotonic()
+        self.last_check = time.monotonic()
+        self.stats = {'frames': 0, 'torn': 0, 'reconnects': 0}
+
+    def connect(self):
+        try:
+            shm = open_shared_memory(self.name)
+        except FileNotFoundError:
+            self.root.title("Bertrandt Kiosk - warte auf Renderer...")
+            self.root.after(RECONNECT_MS, self.connect)
+            return
+        magic, width, height, _ = SHM_HEADER.unpack_from(shm.buf, 0)
+        if magic != SHM_MAGIC:
+            shm.close()
+            raise ValueError(f"Kein Kiosk-Speicher: {self.name}")
+        self.shm = shm
+        self.segment = segment_id(self.name)
+        self.last_counter = None
+        self.last_change = self.last_check = time.monotonic()
+        self.size = (width, height)
+        self.photo = ImageTk.PhotoImage('RGB', self.size)
+        self.label.config(image=self.photo)
+        self.root.title("Bertrandt Kiosk")
+        self.poll()
+
+    def poll(self):
+        """Neuen Frame übernehmen, falls der Renderer einen vollständigen geschrieben hat"""
+        if self._segment_replaced():
+            self.reconnect()
+            return
+        _, _, _, counter = SHM_HEADER.unpack_from(self.shm.buf, 0)
+        if counter != self.last_counter:
+            self.last_change = time.monotonic()
+        if counter != self.last_counter and counter % 2 == 0:
+            width, height = self.size
+            data = bytes(self.shm.buf[SHM_HEADER.size:SHM_HEADER.size + width * height * 3])
+            # Während des Kopierens weitergeschrieben? Dann beim nächsten Poll erneut
+            if SHM_HEADER.unpack_from(self.shm.buf, 0)[3] == counter:
+                self.photo.paste(Image.frombuffer('RGB', self.size, data, 'raw', 'RGB', 0, 1))
+                self.last_counter = counter
+                self.stats['frames'] += 1
+            else:
+                self.stats['torn'] += 1
+        self.root.after(POLL_MS, self.poll)
+
+    def _segment_replaced(self):
+        """Renderer beendet oder neu gestartet? Alte Abbildung zeigt dann nur noch den letzten Frame"""
+        now = time.monotonic()
+        if (now - self.last_check) * 1000 < RECONNECT_MS:
+            return False
+        self.last_check = now
+        if self.segment is not None:
+            return segment_id(self.name) != self.segment
+        # Ohne /dev/shm: nach Stillstand des Zählers neu verbinden
+        return (now - self.last_change) * 1000 > RECONNECT_MS
+
+    def reconnect(self):
+        """Alten Shared Memory freigeben und neu verbinden (wartet ggf. auf den Renderer)"""
+        self.shm.close()
+        self.shm = None
+        self.stats['reconnects'] += 1
+        self.connect()
+
+    def run(self):
+        self.connect()
+        try:
+            self.root.mainloop()
+        finally:
+            if self.shm:
+                self.shm.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bertrandt Kiosk Viewer (Shared Memory)')
+    parser.add_argument('--shm', default=DEFAULT_SHM_NAME, help='Name des Shared Memory')
+    parser.add_argument('--fullscreen', action='store_true', help='Im Vollbild starten')
+    args = parser.parse_args()
+    KioskViewer(args.shm, args.fullscreen).run()
+
+
+if __name__ == "__main__":
+    main()
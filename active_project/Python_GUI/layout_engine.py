@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Layout Engine
+Bündelt <Configure>-Serien des Hauptfensters (Resize, F11) und rechnet abhängige Größen
+einmal je stabiler Geometrie neu; Bilder werden aus der nächstgrößeren Variante skaliert
+"""
+
+import os
+import time
+from collections import OrderedDict
+
+import metrics
+from log_setup import get_logger
+
+# Ruhezeit nach dem letzten <Configure>, bevor neu gerechnet wird (ms)
+RESIZE_DEBOUNCE_MS = 250
+
+# Anzahl Bilder bzw. skalierter Varianten je Bild im Cache
+IMAGE_CACHE_SIZE = 12
+VARIANTS_PER_IMAGE = 4
+
+CACHE_REQUESTS = {result: metrics.counter('bertrandt_cache_requests_total', 'Cache-Zugriffe nach Ergebnis',
+                                          cache='image', result=result)
+                  for result in ('hit', 'scaled', 'decoded')}
+
+logger = get_logger('layout')
+
+
+class LayoutEngine:
+    """Fenstergröße für alle Layout-Berechnungen - vor dem ersten Anzeigen die angeforderte Geometrie"""
+
+    def __init__(self, root, scheduler, initial_size, debounce_ms=RESIZE_DEBOUNCE_MS):
+        self.root = root
+        self.scheduler = scheduler
+        self.debounce_ms = debounce_ms
+        # winfo_width() liefert 1, solange das Fenster nicht abgebildet ist
+        self.width, self.height = initial_size
+        self._pending = None
+        self._settle_task = None
+        self._listeners = OrderedDict()
+        self.stats = {'configure_events': 0, 'relayouts': 0, 'last_relayout_ms': 0.0}
+        self.root.bind('<Configure>', self._on_configure, add='+')
+
+    def register(self, name, callback):
+        """callback(width, height) nach jeder stabilen Größenänderung aufrufen (gleicher Name ersetzt)"""
+        self._listeners[name] = callback
+
+    def unregister(self, name):
+        self._listeners.pop(name, None)
+
+    def _on_configure(self, event):
+        # <Configure> kommt auch für jedes Kind-Widget - nur das Hauptfenster zählt
+        if event.widget is not self.root:
+            return
+        self.stats['configure_events'] += 1
+        self._pending = (event.width, event.height)
+        if self._settle_task:
+            self._settle_task.cancel()
+        self._settle_task = self.scheduler.after(self.debounce_ms, self._settle, name='layout_settle')
+
+    def _settle(self):
+        self._settle_task = None
+        if self._pending is None or self._pending == (self.width, self.height):
+            return
+        self.width, self.height = self._pending
+        self.relayout()
+
+    def relayout(self):
+        """Alle Listener mit der aktuellen Größe aufrufen"""
+        started = time.perf_counter()
+        for name, callback in list(self._listeners.items()):
+            try:
+                callback(self.width, self.height)
+            except Exception as e:
+                logger.warning("⚠️ Layout '%s' fehlgeschlagen: %s", name, e)
+        self.stats['relayouts'] += 1
+        self.stats['last_relayout_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info("📐 Layout neu berechnet: %sx%s (%s ms)", self.width, self.height, self.stats['last_relayout_ms'])
+
+
+class ScaledImageCache:
+    """Skalierte Bildvarianten - neue Größen entstehen aus der nächstgrößeren Variante statt aus der Datei"""
+
+    def __init__(self, max_images=IMAGE_CACHE_SIZE, max_variants=VARIANTS_PER_IMAGE):
+        self.max_images = max_images
+        self.max_variants = max_variants
+        self._images = OrderedDict()
+        self.stats = {'decodes': 0, 'scaled': 0, 'hits': 0}
+
+    def get(self, path, box, prepare=None):
+        """PIL-Bild proportional in box (Breite, Höhe) eingepasst; prepare(image) einmal nach dem Laden"""
+        from PIL import Image
+
+        key = (path, os.path.getmtime(path), prepare)
+        entry = self._images.get(key)
+        if entry is None:
+            with Image.open(path) as image:
+                image.load()
+                original = prepare(image) if prepare else image.copy()
+            self.stats['decodes'] += 1
+            CACHE_REQUESTS['decoded'].inc()
+            entry = {'original': original, 'variants': OrderedDict()}
+            self._images[key] = entry
+            if len(self._images) > self.max_images:
+                self._images.popitem(last=False)
+        self._images.move_to_end(key)
+
+        size = self.fit(entry['original'].size, box)
+        variants = entry['variants']
+        if size in variants:
+            variants.move_to_end(size)
+            self.stats['hits'] += 1
+            CACHE_REQUESTS['hit'].inc()
+            return variants[size]
+
+        # Kleinste vorhandene Variante, die noch groß genug ist - sonst das Original
+        larger = [variant for variant in variants.values()
+                  if variant.width >= size[0] and variant.height >= size[1]]
+        source = min(larger, key=lambda variant: variant.width) if larger else entry['original']
+        image = source.resize(size, Image.Resampling.LANCZOS) if source.size != size else source
+        variants[size] = image
+        if len(variants) > self.max_variants:
+            variants.popitem(last=False)
+        self.stats['scaled'] += 1
+        CACHE_REQUESTS['scaled'].inc()
+        return image
+
+    @staticmethod
+    def fit(size, box):
+        """Zielgröße wie Image.thumbnail: proportional, nie größer als das Original"""
+        width, height = size
+        scale = min(box[0] / width, box[1] / height, 1.0)
+        return (max(1, round(width * scale)), max(1, round(height * scale)))
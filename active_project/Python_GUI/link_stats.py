@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Link-Statistik
+Latenz der Strecke ESP32-Empfang -> Host aus den micros()-Zeitstempeln der Firmware
+("SIGNAL:X;rx=<micros>"). Die Uhren laufen nicht synchron - der Offset wird aus dem
+kleinsten beobachteten Abstand geschätzt.
+
+Mit Sequenznummern und Sender-Zeitstempel des GIGA ("SIGNAL:X;seq=N;ts=<micros>;rx=...")
+kommen Verlust, Duplikate, Vertauschungen, Jitter und die vom GIGA gemessene RTT dazu.
+"""
+
+import threading
+import time
+from collections import OrderedDict, deque
+
+import metrics
+
+# micros() ist ein 32-Bit-Zähler und läuft nach ~71 Minuten über
+MICROS_WRAP = 1 << 32
+
+# Messwerte für die Offset-Schätzung - kurz genug, dass Quarzdrift (~40 ppm) kaum eingeht
+OFFSET_WINDOW = 256
+
+# Größere Sprünge bedeuten einen Neustart des ESP32 - Schätzung neu beginnen
+RESYNC_SECONDS = 5.0
+
+# Zuletzt gesehene Sequenznummern für Duplikat-/Vertauschungserkennung
+SEQ_WINDOW = 1024
+
+# Ergebnis von LinkQuality.observe - nur 'new' soll die Seite wechseln
+NEW, DUPLICATE, LATE = 'new', 'duplicate', 'late'
+
+# Anzahl Latenz-Messwerte für Perzentile
+LATENCY_WINDOW = 1000
+
+
+def _wrap_signed(delta):
+    """Differenz zweier 32-Bit-Zähler (micros) vorzeichenrichtig"""
+    delta %= MICROS_WRAP
+    return delta - MICROS_WRAP if delta >= MICROS_WRAP // 2 else delta
+
+
+class LatencyStats:
+    """Gleitendes Fenster von Latenzen (Sekunden) mit Ø/p95/max in ms"""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.samples = deque(maxlen=window)
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency):
+        with self._lock:
+            self.samples.append(latency)
+            self.count += 1
+
+    def summary(self):
+        with self._lock:
+            samples = sorted(self.samples)
+        if not samples:
+            return {'count': self.count, 'avg_ms': None, 'p95_ms': None, 'max_ms': None}
+        return {
+            'count': self.count,
+            'avg_ms': round(sum(samples) / len(samples) * 1000, 3),
+            'p95_ms': round(samples[int(len(samples) * 0.95) - 1 if len(samples) > 1 else 0] * 1000, 3),
+            'max_ms': round(samples[-1] * 1000, 3),
+        }
+
+
+class LinkLatency:
+    """Latenz je Event über dem schnellsten beobachteten Weg (Offset = min(Host - ESP32) im Fenster)"""
+
+    def __init__(self, link='serial', window=OFFSET_WINDOW):
+        self.link = link
+        self.latency = LatencyStats()
+        self.resyncs = 0
+        self._offsets = deque(maxlen=window)
+        self._last_device_us = None
+        self._wraps = 0
+        self._histogram = metrics.histogram('bertrandt_link_latency_seconds',
+                                            'Latenz ESP32-Empfang -> Host (über dem schnellsten Weg)', link=link)
+
+    def observe(self, device_us, host_time=None):
+        """rx-Zeitstempel (µs, ESP32) und Empfangszeit am Host (perf_counter) -> Latenz in Sekunden"""
+        if host_time is None:
+            host_time = time.perf_counter()
+        if self._last_device_us is not None and device_us < self._last_device_us - MICROS_WRAP // 2:
+            self._wraps += 1
+        self._last_device_us = device_us
+
+        offset = host_time - (device_us + self._wraps * MICROS_WRAP) / 1_000_000
+        if self._offsets and abs(offset - self._offsets[-1]) > RESYNC_SECONDS:
+            # ESP32 neu gestartet (micros() beginnt bei 0) - alte Schätzung verwerfen
+            self._offsets.clear()
+            self._wraps = 0
+            self.resyncs += 1
+            offset = host_time - device_us / 1_000_000
+        self._offsets.append(offset)
+
+        latency = offset - min(self._offsets)
+        self.latency.record(latency)
+        self._histogram.observe(latency)
+        return latency
+
+    def summary(self):
+        return dict(self.latency.summary(), link=self.link, resyncs=self.resyncs)
+
+
+class LinkQuality:
+    """Sequenznummern des GIGA auswerten: Verlust, Duplikate, Vertauschungen, Jitter (RFC 3550), RTT"""
+
+    def __init__(self, link='serial', window=SEQ_WINDOW):
+        self.link = link
+        self.window = window
+        self.stats = {'received': 0, 'lost': 0, 'duplicates': 0, 'reordered': 0, 'retransmits': 0, 'resyncs': 0}
+        # Jitter in Sekunden - geglätteter Betrag der Laufzeitänderung zwischen zwei Paketen
+        self.jitter = 0.0
+        self.rtt = LatencyStats()
+        self._first = None
+        self._highest = None
+        # Erwartete Pakete aus der Zeit vor einem Neustart des GIGA
+        self._expected_before = 0
+        # seq -> ts: gleiche seq mit anderem ts heißt "GIGA neu gestartet", nicht "Duplikat"
+        self._seen = OrderedDict()
+        self._last_transit = None
+        labels = {'link': link}
+        self._counters = {status: metrics.counter('bertrandt_link_packets_total', 'Sequenzierte Pakete nach Ergebnis',
+                                                  status=status, **labels)
+                          for status in (NEW, DUPLICATE, LATE)}
+        self._rtt_histogram = metrics.histogram('bertrandt_link_rtt_seconds', 'RTT GIGA <-> ESP32 (ACK)', **labels)
+        metrics.gauge('bertrandt_link_lost', 'Fehlende Sequenznummern', **labels).set_function(
+            lambda: self.stats['lost'])
+        metrics.gauge('bertrandt_link_jitter_seconds', 'Jitter der Laufzeit (RFC 3550)', **labels).set_function(
+            lambda: self.jitter)
+
+    def observe(self, event, host_time=None):
+        """Event mit 'seq' (und ggf. ts/rx/rtt/retry) einordnen -> NEW, DUPLICATE oder LATE"""
+        seq = event['seq']
+        ts = event.get('ts')
+        if 'rtt' in event:
+            self.rtt.record(event['rtt'] / 1_000_000)
+            self._rtt_histogram.observe(event['rtt'] / 1_000_000)
+        if event.get('retry'):
+            self.stats['retransmits'] += 1
+
+        if seq in self._seen and self._seen[seq] == ts:
+            # Wiederholung nach verlorenem ACK - Seite wurde schon gewechselt
+            self.stats['duplicates'] += 1
+            return self._count(DUPLICATE)
+        if self._highest is not None and (seq in self._seen or seq < self._highest - self.window):
+            # Gleiche seq mit neuem ts oder weit zurück: GIGA neu gestartet
+            self._reset()
+            self.stats['resyncs'] += 1
+
+        self._remember(seq, ts)
+        self.stats['received'] += 1
+        if self._highest is None:
+            self._first = self._highest = seq
+        elif seq > self._highest:
+            self.stats['lost'] += seq - self._highest - 1
+            self._highest = seq
+        else:
+            if self._first < seq and self.stats['lost'] > 0:
+                # Lücke wird nachträglich gefüllt - war nicht verloren, nur zu spät
+                self.stats['lost'] -= 1
+            # Vor dem ersten Paket (nie als verloren gezählt): nur vertauscht
+            self.stats['reordered'] += 1
+            return self._count(LATE)
+
+        if ts is not None and not event.get('retry'):
+            self._update_jitter(ts, event.get('rx'), host_time)
+        return self._count(NEW)
+
+    def _count(self, status):
+        self._counters[status].inc()
+        return status
+
+    def _remember(self, seq, ts):
+        self._seen[seq] = ts
+        if len(self._seen) > self.window:
+            self._seen.popitem(last=False)
+
+    def _reset(self):
+        self._expected_before = self.expected
+        self._seen.clear()
+        self._first = self._highest = None
+        self._last_transit = None
+
+    def _update_jitter(self, ts, rx, host_time):
+        # Laufzeit GIGA -> ESP32 (rx) bzw. -> Host; der unbekannte Uhren-Offset fällt in der Differenz weg
+        if rx is None:
+            rx = int((host_time if host_time is not None else time.perf_counter()) * 1_000_000)
+        transit = _wrap_signed(rx - ts)
+        if self._last_transit is not None:
+            delta = abs(transit - self._last_transit) / 1_000_000
+            self.jitter += (delta - self.jitter) / 16
+        self._last_transit = transit
+
+    @property
+    def expected(self):
+        """Gesendete Pakete laut Sequenznummern (seit Start, über Neustarts des GIGA hinweg)"""
+        current = self._highest - self._first + 1 if self._highest is not None else 0
+        return self._expected_before + current
+
+    def summary(self):
+        expected = self.expected
+        return dict(self.stats, link=self.link, expected=expected,
+                    loss_pct=round(self.stats['lost'] / expected * 100, 2) if expected else None,
+                    jitter_ms=round(self.jitter * 1000, 3), rtt=self.rtt.summary())
+
+
+class LinkStats:
+    """Latenz und Qualität einer Strecke - ein Objekt je Eingang ('serial', 'udp')"""
+
+    def __init__(self, link='serial'):
+        self.link = link
+        self.latency = LinkLatency(link)
+        self.quality = LinkQuality(link)
+        self.last_latency = None
+        self.last_status = None
+
+    def observe(self, event, host_time=None):
+        """Event auswerten; False für Duplikate und verspätete Pakete (Seite wurde schon gewechselt)"""
+        if host_time is None:
+            host_time = time.perf_counter()
+        self.last_latency = self.latency.observe(event['rx'], host_time) if 'rx' in event else None
+        # Alte GIGA-Firmware ohne Sequenznummern: alles weiterreichen
+        self.last_status = self.quality.observe(event, host_time) if 'seq' in event else NEW
+        return self.last_status == NEW
+
+    @property
+    def active(self):
+        return bool(self.latency.latency.count or self.quality.stats['received'])
+
+    def summary(self):
+        summary = {'link': self.link}
+        if self.latency.latency.count:
+            summary['latency'] = self.latency.summary()
+        if self.quality.stats['received']:
+            summary['quality'] = self.quality.summary()
+        return summary
+
+    def format_stats(self):
+        """Eine Zeile für Statistik-Fenster und CLI"""
+        parts = []
+        if self.latency.latency.count:
+            k = self.latency.summary()
+            parts.append(f"Latenz Ø {k['avg_ms']} ms / p95 {k['p95_ms']} ms / max {k['max_ms']} ms")
+        if self.quality.stats['received']:
+            q = self.quality.summary()
+            parts.append(f"{q['received']} Pakete, {q['lost']} verloren ({q['loss_pct']} %), "
+                         f"{q['duplicates']} doppelt, {q['reordered']} vertauscht, Jitter {q['jitter_ms']} ms")
+            if q['rtt']['count']:
+                parts.append(f"RTT Ø {q['rtt']['avg_ms']} ms / p95 {q['rtt']['p95_ms']} ms, "
+                             f"{q['retransmits']} Wiederholungen")
+        return ", ".join(parts)
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Lastgenerator
+Synthetische Signale für Stresstests ohne Hardware: Raten bis zu einigen tausend Events/s,
+Muster (sequential, random, bursty, zipf, malformed) und drei Einspeisepunkte - direkt in die
+data_queue der GUI, über einen Pseudo-Terminal als Fake-Serial-Port oder per UDP wie der GIGA.
+"""
+
+import argparse
+import itertools
+import os
+import random
+import socket
+import threading
+import time
+
+from log_setup import get_logger
+from signal_protocol import SIGNAL_MAX, SIGNAL_MIN, is_valid_signal, parse_line
+from tracing import TRACER
+
+PATTERNS = ('sequential', 'random', 'bursty', 'zipf', 'malformed')
+SINKS = ('queue', 'pty', 'udp')
+
+DEFAULT_RATE = 100
+DEFAULT_BURST = 50
+DEFAULT_ZIPF_EXPONENT = 1.2
+# Anteil fehlerhafter Zeilen im Muster 'malformed'
+MALFORMED_RATIO = 0.3
+# Client-Anzahl wie das ESP32 alle 5 s melden
+CLIENTS_INTERVAL = 5.0
+
+# Was über die Leitung kommen kann, aber kein gültiges Signal ist
+MALFORMED_LINES = (
+    "SIGNAL:",
+    "SIGNAL:abc",
+    "SIGNAL:-1",
+    f"SIGNAL:{SIGNAL_MAX + 89}",
+    "Clients: viele",
+    "SIGN",
+    "SIGNAL:3SIGNAL:4",
+    "\x00\xff\xfe\x07",
+    "x" * 300,
+)
+
+logger = get_logger('load')
+
+
+def line_source(pattern, pages=None, zipf_exponent=DEFAULT_ZIPF_EXPONENT,
+                malformed_ratio=MALFORMED_RATIO, seed=None):
+    """Endloser Generator von Serial-Zeilen ('SIGNAL:X' bzw. fehlerhafte Zeilen) für ein Muster"""
+    pages = list(pages or range(SIGNAL_MIN, SIGNAL_MAX + 1))
+    rng = random.Random(seed)
+
+    if pattern == 'sequential':
+        for page in itertools.cycle(pages):
+            yield f"SIGNAL:{page}"
+    elif pattern == 'zipf':
+        # Wenige Seiten sehr häufig (Startseite, Highlights), der Rest selten
+        weights = list(itertools.accumulate(1 / rank ** zipf_exponent for rank in range(1, len(pages) + 1)))
+        while True:
+            yield f"SIGNAL:{rng.choices(pages, cum_weights=weights)[0]}"
+    elif pattern == 'malformed':
+        while True:
+            if rng.random() < malformed_ratio:
+                yield rng.choice(MALFORMED_LINES)
+            else:
+                yield f"SIGNAL:{rng.choice(pages)}"
+    else:
+        # 'random' und 'bursty' (Bursts entstehen im Timing, nicht in der Seitenwahl)
+        while True:
+            yield f"SIGNAL:{rng.choice(pages)}"
+
+
+def is_well_formed(line):
+    """Gültige Signal-Zeile wie vom ESP32 ('SIGNAL:1' .. 'SIGNAL:10')"""
+    value = line[len("SIGNAL:"):]
+    return line.startswith("SIGNAL:") and value.isdigit() and is_valid_signal(int(value))
+
+
+class QueueSink:
+    """Direkt in die data_queue der GUI - gleicher Weg wie read_serial_data (Parser + Trace)"""
+
+    name = 'queue'
+
+    def __init__(self, data_queue):
+        self.data_queue = data_queue
+        self.dropped = 0
+
+    def send(self, line):
+        trace_id = TRACER.new_trace()
+        with TRACER.span('serial_parse', trace_id):
+            event = parse_line(line)
+        if event and event['type'] in ('signal', 'clients'):
+            self.data_queue.put((event['type'], event['value'], TRACER.enqueue(trace_id)))
+
+    def close(self):
+        pass
+
+
+class PtySink:
+    """Pseudo-Terminal als Fake-Serial-Port - die GUI öffnet self.port wie ein ESP32"""
+
+    name = 'pty'
+
+    def __init__(self):
+        import tty
+
+        self.master, self._slave = os.openpty()
+        # Kein Echo/Zeilenpuffer, sonst liest der Generator seine eigenen Zeilen zurück
+        tty.setraw(self._slave)
+        os.set_blocking(self.master, False)
+        self.port = os.ttyname(self._slave)
+        self.dropped = 0
+
+    def send(self, line):
+        # Liest niemand mit, ist der Puffer schnell voll - dann zählt die Zeile als verworfen
+        try:
+            os.write(self.master, (line + "\r\n").encode('utf-8', errors='replace'))
+        except (BlockingIOError, OSError):
+            self.dropped += 1
+
+    def close(self):
+        for fd in (self.master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class UdpSink:
+    """UDP-Pakete wie der GIGA - an den ESP32, Emulator oder Broker (--udp-port)
+
+    sequenced: "X;seq=N;ts=<micros>" wie die aktuelle GIGA-Firmware, ack: jedes Paket quittieren
+    lassen (RTT geht mit dem nächsten Paket mit), loss: Anteil absichtlich nicht gesendeter Pakete.
+    """
+
+    name = 'udp'
+
+    def __init__(self, host='127.0.0.1', port=4210, sequenced=False, ack=False, loss=0.0, seed=None):
+        self.address = (host, port)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sequenced = sequenced or ack
+        self.ack = ack
+        self.loss = loss
+        self.dropped = 0
+        self.seq = 0
+        self.acks = 0
+        self._rtt_us = None
+        self._rng = random.Random(seed)
+        self._started = time.perf_counter()
+        if ack:
+            # ACKs sofort abholen wie der GIGA in jedem loop() - sonst misst die RTT das Sendeintervall mit
+            self.sock.settimeout(0.2)
+            threading.Thread(target=self._read_acks, name='udp-acks', daemon=True).start()
+
+    def send(self, line, fields=''):
+        """fields: Zusatzfelder vor seq/ts, z.B. ";ev=1;age=120" (Event-Modus des GIGA)"""
+        if not (line.startswith("SIGNAL:") and line[7:].isdigit()):
+            self._sendto(line)
+            return
+        payload = line[len("SIGNAL:"):] + fields
+        if self.sequenced:
+            self.seq += 1
+            payload += f";seq={self.seq};ts={self._micros()}"
+            if self.ack:
+                payload += ";ack=1"
+            if self._rtt_us is not None:
+                payload += f";rtt={self._rtt_us}"
+                self._rtt_us = None
+        if self.loss and self._rng.random() < self.loss:
+            # Verlust auf der Funkstrecke nachbilden - Sequenznummer ist trotzdem verbraucht
+            self.dropped += 1
+            return
+        self._sendto(payload)
+
+    def _sendto(self, payload):
+        try:
+            self.sock.sendto(payload.encode('utf-8', errors='replace'), self.address)
+        except OSError:
+            self.dropped += 1
+
+    def _micros(self):
+        return int((time.perf_counter() - self._started) * 1_000_000) & 0xFFFFFFFF
+
+    def _read_acks(self):
+        """ACKs des Empfängers abholen - RTT wie im GIGA aus dem zurückgeschickten ts"""
+        while self.sock.fileno() != -1:
+            try:
+                reply = self.sock.recv(64)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            event = parse_line(reply)
+            if event and event['type'] == 'ack' and 'ts' in event:
+                self.acks += 1
+                self._rtt_us = (self._micros() - event['ts']) & 0xFFFFFFFF
+
+    def close(self):
+        self.sock.close()
+
+
+class LoadGenerator:
+    """Zeilen eines Musters mit fester Rate (bzw. in Bursts) an einen Sink senden"""
+
+    def __init__(self, sink, pattern='random', rate=DEFAULT_RATE, duration=None, count=None,
+                 burst=DEFAULT_BURST, clients_interval=CLIENTS_INTERVAL, seed=None, **source_options):
+        if pattern not in PATTERNS:
+            raise ValueError(f"Unbekanntes Muster: {pattern} (erlaubt: {', '.join(PATTERNS)})")
+        self.sink = sink
+        self.pattern = pattern
+        self.rate = rate
+        self.duration = duration
+        self.count = count
+        # Bursty: burst Events direkt hintereinander, dann Pause - im Mittel trotzdem rate/s
+        self.burst = burst if pattern == 'bursty' else 1
+        self.clients_interval = clients_interval
+        self.lines = line_source(pattern, seed=seed, **source_options)
+        self._rng = random.Random(seed)
+        self.running = False
+        self._thread = None
+        self.stats = {'sent': 0, 'malformed': 0, 'clients': 0, 'elapsed': 0.0}
+
+    def start(self):
+        self.running = True
+        self._thread = threading.Thread(target=self.run, name='load-generator', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def run(self):
+        """Senden bis duration/count erreicht oder stop() aufgerufen wurde (blockiert)"""
+        self.running = True
+        group_interval = self.burst / self.rate
+        started = time.perf_counter()
+        next_clients = 0.0
+        sent = 0
+        logger.info("🧪 Lastgenerator: %s, %s Events/s über %s", self.pattern, self.rate, self.sink.name)
+        try:
+            while self.running:
+                elapsed = time.perf_counter() - started
+                if self.duration and elapsed >= self.duration:
+                    break
+                if self.clients_interval and elapsed >= next_clients:
+                    self.sink.send(f"Clients: {self._rng.randint(0, 8)}")
+                    self.stats['clients'] += 1
+                    next_clients += self.clients_interval
+
+                # Alle fälligen Events gebündelt senden - time.sleep() ist für kHz-Raten zu grob
+                groups_due = int(elapsed / group_interval) + 1
+                due = groups_due * self.burst
+                if self.count:
+                    due = min(due, self.count)
+                while sent < due:
+                    line = next(self.lines)
+                    if not is_well_formed(line):
+                        self.stats['malformed'] += 1
+                    self.sink.send(line)
+                    sent += 1
+                self.stats['sent'] = sent
+                if self.count and sent >= self.count:
+                    break
+                time.sleep(max(0.0, groups_due * group_interval - (time.perf_counter() - started)))
+        finally:
+            self.running = False
+            self.stats['elapsed'] = time.perf_counter() - started
+            logger.info("🧪 Lastgenerator beendet: %s", self.format_stats())
+
+    def summary(self):
+        elapsed = self.stats['elapsed'] if not self.running else None
+        return dict(self.stats, pattern=self.pattern, rate=self.rate, sink=self.sink.name,
+                    dropped=self.sink.dropped, running=self.running,
+                    achieved_rate=round(self.stats['sent'] / elapsed, 1) if elapsed else None)
+
+    def format_stats(self):
+        s = self.summary()
+        rate = f", {s['achieved_rate']}/s erreicht" if s['achieved_rate'] else ""
+        return (f"{s['sent']} Zeilen ({s['pattern']}, Soll {s['rate']}/s{rate}), "
+                f"{s['malformed']} fehlerhaft, {s['dropped']} verworfen")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bertrandt Lastgenerator (Fake-Serial-Port oder UDP)')
+    parser.add_argument('--pattern', choices=PATTERNS, default='random')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='Events pro Sekunde')
+    parser.add_argument('--duration', type=float, default=None, help='Sekunden (Standard: bis Strg+C)')
+    parser.add_argument('--count', type=int, default=None, help='Anzahl Events')
+    parser.add_argument('--burst', type=int, default=DEFAULT_BURST, help='Events je Burst (bursty)')
+    parser.add_argument('--sink', choices=('pty', 'udp'), default='pty')
+    parser.add_argument('--udp-host', default='127.0.0.1')
+    parser.add_argument('--udp-port', type=int, default=4210)
+    parser.add_argument('--udp-seq', action='store_true', help='Mit Sequenznummer und Zeitstempel senden')
+    parser.add_argument('--udp-ack', action='store_true', help='Jedes Paket quittieren lassen (RTT, impliziert --udp-seq)')
+    parser.add_argument('--udp-loss', type=float, default=0.0, help='Anteil verworfener Pakete, z.B. 0.05')
+    parser.add_argument('--delay', type=float, default=0, help='Sekunden warten, bevor gesendet wird')
+    parser.add_argument('--seed', type=int, default=None, help='Reproduzierbare Zufallsfolge')
+    args = parser.parse_args()
+
+    import log_setup
+    log_setup.setup_logging(log_file=None)
+
+    if args.sink == 'pty':
+        sink = PtySink()
+        logger.info("🔌 Fake-Serial-Port: %s (python3 Bertrandt_GUI.py --esp32-port %s)", sink.port, sink.port)
+    else:
+        sink = UdpSink(args.udp_host, args.udp_port, sequenced=args.udp_seq, ack=args.udp_ack,
+                       loss=args.udp_loss, seed=args.seed)
+    generator = LoadGenerator(sink, args.pattern, args.rate, args.duration, args.count,
+                              burst=args.burst, seed=args.seed)
+    try:
+        time.sleep(args.delay)
+        generator.run()
+    except KeyboardInterrupt:
+        generator.running = False
+    finally:
+        sink.close()
+
+
+if __name__ == "__main__":
+    main()
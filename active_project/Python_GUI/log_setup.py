@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Logging
+Logs gehen über eine Queue an einen Hintergrund-Thread: farbige Konsole und JSON-Zeilen
+in eine rotierende Datei. Der aufrufende Thread prüft nur den Level - formatiert wird erst im Writer.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+import time
+
+LOGGER_NAME = 'bertrandt'
+
+# Zusätzlicher Level zwischen INFO und WARNING (wie bisher BertrandtCLI.log)
+SUCCESS = 25
+logging.addLevelName(SUCCESS, 'SUCCESS')
+
+DEFAULT_LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "bertrandt.jsonl")
+MAX_LOG_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+
+LEVEL_COLORS = {
+    logging.DEBUG: "\033[0;37m",
+    logging.INFO: "\033[0;34m",
+    SUCCESS: "\033[0;32m",
+    logging.WARNING: "\033[1;33m",
+    logging.ERROR: "\033[0;31m",
+    logging.CRITICAL: "\033[1;31m",
+}
+RESET = "\033[0m"
+
+# Attribute jedes LogRecords - alles andere kam über extra={...} und landet im JSON
+_RECORD_FIELDS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'taskName'}
+
+LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'SUCCESS': SUCCESS,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+}
+
+_listener = None
+
+
+def get_logger(name):
+    """Logger eines Moduls (unterhalb von 'bertrandt')"""
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
+
+
+def level_logger(name):
+    """log(message, level="INFO") - Signatur der bisherigen print-basierten Log-Funktionen"""
+    logger = get_logger(name)
+
+    def log(message, level="INFO"):
+        logger.log(LEVELS.get(level, logging.INFO), message)
+    return log
+
+
+class ConsoleFormatter(logging.Formatter):
+    """[HH:MM:SS] Nachricht - farbig nur auf einem Terminal"""
+
+    def __init__(self, color):
+        super().__init__()
+        self.color = color
+
+    def format(self, record):
+        line = f"[{time.strftime('%H:%M:%S', time.localtime(record.created))}] {record.getMessage()}"
+        if record.exc_info:
+            line += '\n' + self.formatException(record.exc_info)
+        if self.color:
+            return f"{LEVEL_COLORS.get(record.levelno, '')}{line}{RESET}"
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """Eine JSON-Zeile je Eintrag; Felder aus extra={...} werden übernommen"""
+
+    def format(self, record):
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+            'thread': record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.Handler):
+    """Record unverändert einreihen - formatiert wird erst im Writer-Thread"""
+
+    def __init__(self, log_queue):
+        super().__init__()
+        self.queue = log_queue
+
+    def emit(self, record):
+        self.queue.put_nowait(record)
+
+
+def setup_logging(level='INFO', log_file=DEFAULT_LOG_FILE, console=True):
+    """Logging einmal pro Prozess einrichten; gibt den Listener (Writer-Thread) zurück"""
+    global _listener
+    if _listener:
+        return _listener
+    # Rotation und Listener erst hier laden - Module, die nur loggen, brauchen sie nicht
+    from logging.handlers import QueueListener, RotatingFileHandler
+
+    handlers = []
+    if console:
+        color = sys.stderr.isatty() and not os.environ.get('NO_COLOR')
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(ConsoleFormatter(color))
+        handlers.append(console_handler)
+    if log_file:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            file_handler = RotatingFileHandler(log_file, maxBytes=MAX_LOG_BYTES,
+                                               backupCount=LOG_BACKUPS, encoding='utf-8')
+            file_handler.setFormatter(JsonFormatter())
+            handlers.append(file_handler)
+        except OSError as e:
+            sys.stderr.write(f"⚠️ Log-Datei nicht beschreibbar ({log_file}): {e}\n")
+
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+    logger.addHandler(_QueueHandler(log_queue))
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """Restliche Einträge schreiben und Writer-Thread beenden"""
+    global _listener
+    if _listener:
+        _listener.stop()
+        _listener = None
+
+
+def add_arguments(parser):
+    """Gemeinsame Kommandozeilen-Optionen (GUI, CLI, Kiosk)"""
+    group = parser.add_argument_group('Logging')
+    group.add_argument('--log-level', default='INFO', choices=list(LEVELS),
+                       help='Minimaler Level (DEBUG zeigt z.B. jeden Seitenwechsel)')
+    group.add_argument('--log-file', default=DEFAULT_LOG_FILE,
+                       help='JSON-Lines Log (rotierend, 5 MB x 3); "" = keine Datei')
+
+
+def setup_from_args(args):
+    return setup_logging(args.log_level, args.log_file or None)
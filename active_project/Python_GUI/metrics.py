@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Metrics
+Zähler, Gauges und HDR-Histogramme mit Export als Prometheus-Text (Datei oder HTTP)
+und JSON-Snapshots. Ausgeschaltet (Standard) kostet eine Messung nur eine Flag-Abfrage.
+"""
+
+import json
+import os
+import threading
+import time
+
+from log_setup import get_logger
+
+# HDR-Histogramm: 2^7 Unter-Buckets je Zweierpotenz -> relative Auflösung < 1,6 %
+SUB_BUCKET_BITS = 7
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+HALF_BUCKETS = SUB_BUCKETS // 2
+
+# Quantile im Export (Prometheus-Summary)
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+DEFAULT_EXPORT_INTERVAL = 15
+
+logger = get_logger('metrics')
+
+
+def _bucket_index(value):
+    """Bucket für einen Wert in µs (ganzzahlig, >= 0)"""
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * HALF_BUCKETS + (value >> shift)
+
+
+def _bucket_value(index):
+    """Mittlerer Wert (µs) eines Buckets"""
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // HALF_BUCKETS - 1
+    lower = (index - shift * HALF_BUCKETS) << shift
+    return lower + ((1 << shift) - 1) / 2
+
+
+class Counter:
+    """Monoton steigender Zähler"""
+
+    kind = 'counter'
+
+    def __init__(self, registry):
+        self._registry = registry
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def inc(self, amount=1):
+        if self._registry.enabled:
+            with self._lock:
+                self.value += amount
+
+    def sample(self):
+        return self.value
+
+
+class Gauge:
+    """Momentanwert - gesetzt oder beim Export über eine Funktion abgefragt"""
+
+    kind = 'gauge'
+
+    def __init__(self, registry):
+        self._registry = registry
+        self.value = 0
+        self._function = None
+
+    def set(self, value):
+        if self._registry.enabled:
+            self.value = value
+
+    def set_function(self, function):
+        """Wert erst beim Export abfragen (z.B. Queue-Tiefe) - kostet im Betrieb nichts"""
+        self._function = function
+
+    def sample(self):
+        if self._function:
+            try:
+                return self._function()
+            except Exception:
+                return None
+        return self.value
+
+
+class Histogram:
+    """HDR-Histogramm für Dauern in Sekunden (µs-Auflösung, log-lineare Buckets)"""
+
+    kind = 'summary'
+
+    def __init__(self, registry):
+        self._registry = registry
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        if not self._registry.enabled:
+            return
+        index = _bucket_index(max(0, int(seconds * 1_000_000)))
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def time(self):
+        """with histogram.time(): ... - misst die Dauer des Blocks"""
+        return _Timer(self)
+
+    def sample(self):
+        with self._lock:
+            buckets = sorted(self._buckets.items())
+            count, total, maximum = self.count, self.total, self.max
+        quantiles = {}
+        for q in QUANTILES:
+            rank = q * count
+            seen = 0
+            for index, bucket_count in buckets:
+                seen += bucket_count
+                if seen >= rank:
+                    quantiles[q] = min(_bucket_value(index) / 1_000_000, maximum)
+                    break
+            else:
+                quantiles[q] = None
+        return {'count': count, 'sum': total, 'max': maximum, 'quantiles': quantiles}
+
+
+class _Timer:
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class MetricsRegistry:
+    """Alle Metriken eines Prozesses; gleiche Namen + Labels liefern dasselbe Objekt"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self._families.setdefault(name, {'kind': cls.kind, 'help': help_text, 'series': {}})
+            if family['kind'] != cls.kind:
+                raise ValueError(f"Metrik {name} existiert bereits als {family['kind']}")
+            metric = family['series'].get(key)
+            if metric is None:
+                metric = family['series'][key] = cls(self)
+        return metric
+
+    def counter(self, name, help_text='', **labels):
+        return self._get(Counter, name, help_text, labels)
+
+    def gauge(self, name, help_text='', **labels):
+        return self._get(Gauge, name, help_text, labels)
+
+    def histogram(self, name, help_text='', **labels):
+        return self._get(Histogram, name, help_text, labels)
+
+    def _collect(self):
+        with self._lock:
+            families = [(name, family['kind'], family['help'], list(family['series'].items()))
+                        for name, family in sorted(self._families.items())]
+        return [(name, kind, help_text, [(dict(key), metric.sample()) for key, metric in series])
+                for name, kind, help_text, series in families]
+
+    def prometheus_text(self):
+        """Prometheus Text-Format (0.0.4)"""
+        lines = []
+        for name, kind, help_text, series in self._collect():
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in series:
+                if kind != 'summary':
+                    if value is not None:
+                        lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                    continue
+                for q, quantile in value['quantiles'].items():
+                    if quantile is not None:
+                        lines.append(f"{name}{_labels(dict(labels, quantile=q))} {_number(quantile)}")
+                lines.append(f"{name}_sum{_labels(labels)} {_number(value['sum'])}")
+                lines.append(f"{name}_count{_labels(labels)} {value['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self):
+        """Alle Werte als JSON-taugliches Dict"""
+        metrics = {}
+        for name, kind, _, series in self._collect():
+            entries = []
+            for labels, value in series:
+                if kind == 'summary':
+                    value = dict(value, quantiles={str(q): v for q, v in value['quantiles'].items()})
+                entries.append({'labels': labels, 'value': value})
+            metrics[name] = {'type': kind, 'series': entries}
+        return {'timestamp': time.time(), 'metrics': metrics}
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_label_value(value)}"' for key, value in sorted(labels.items())) + '}'
+
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+# Prozessweite Registry - Module legen ihre Metriken beim Import an
+REGISTRY = MetricsRegistry()
+
+
+def counter(name, help_text='', **labels):
+    return REGISTRY.counter(name, help_text, **labels)
+
+
+def gauge(name, help_text='', **labels):
+    return REGISTRY.gauge(name, help_text, **labels)
+
+
+def histogram(name, help_text='', **labels):
+    return REGISTRY.histogram(name, help_text, **labels)
+
+
+class MetricsExporter:
+    """Schreibt periodisch Prometheus-Textdatei und/oder JSON-Snapshots; optional HTTP /metrics"""
+
+    def __init__(self, registry=REGISTRY, prometheus_path=None, json_path=None,
+                 interval=DEFAULT_EXPORT_INTERVAL, http_port=None, http_host='127.0.0.1'):
+        self.registry = registry
+        self.prometheus_path = prometheus_path
+        self.json_path = json_path
+        self.interval = interval
+        self.http_port = http_port
+        self.http_host = http_host
+        self._stop = threading.Event()
+        self._thread = None
+        self._http = None
+
+    def start(self):
+        if self.http_port:
+            self._start_http()
+        if self.prometheus_path or self.json_path:
+            self._thread = threading.Thread(target=self._run, name='metrics-export', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.export()
+
+    def export(self):
+        """Einmal exportieren (Textdatei atomar ersetzen, JSON-Zeile anhängen)"""
+        try:
+            if self.prometheus_path:
+                temp_path = self.prometheus_path + '.tmp'
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    f.write(self.registry.prometheus_text())
+                os.replace(temp_path, self.prometheus_path)
+            if self.json_path:
+                with open(self.json_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(self.registry.snapshot()) + '\n')
+        except OSError as e:
+            logger.warning("⚠️ Metriken konnten nicht geschrieben werden: %s", e)
+
+    def _start_http(self):
+        # http.server nur laden, wenn der Endpunkt gewünscht ist
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body, content_type = registry.prometheus_text(), 'text/plain; version=0.0.4'
+                elif self.path == '/metrics.json':
+                    body, content_type = json.dumps(registry.snapshot()), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', f"{content_type}; charset=utf-8")
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._http = ThreadingHTTPServer((self.http_host, self.http_port), Handler)
+        self._http.daemon_threads = True
+        threading.Thread(target=self._http.serve_forever, name='metrics-http', daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self.export()
+        if self._http:
+            self._http.shutdown()
+            self._http.server_close()
+
+
+def add_arguments(parser):
+    """Gemeinsame Kommandozeilen-Optionen (GUI, CLI, Kiosk)"""
+    group = parser.add_argument_group('Metriken')
+    group.add_argument('--metrics-port', type=int, default=None,
+                       help='Prometheus-Endpunkt http://127.0.0.1:<port>/metrics')
+    group.add_argument('--metrics-file', default=None, help='Prometheus-Textdatei (z.B. für node_exporter)')
+    group.add_argument('--metrics-json', default=None, help='JSON-Snapshots zeilenweise anhängen')
+    group.add_argument('--metrics-interval', type=float, default=DEFAULT_EXPORT_INTERVAL,
+                       help='Sekunden zwischen Datei-Exporten')
+
+
+def start_from_args(args, registry=REGISTRY):
+    """Metriken einschalten, falls ein Export gewünscht ist; gibt den Exporter (oder None) zurück"""
+    if not (args.metrics_port or args.metrics_file or args.metrics_json):
+        return None
+    registry.enabled = True
+    exporter = MetricsExporter(registry, args.metrics_file, args.metrics_json,
+                               args.metrics_interval, args.metrics_port)
+    try:
+        exporter.start()
+    except OSError as e:
+        logger.warning("⚠️ Metrik-Endpunkt konnte nicht starten (Port %s): %s", args.metrics_port, e)
+        exporter.http_port = None
+        exporter.start()
+        return exporter
+    if args.metrics_port:
+        logger.info("📈 Metriken: http://127.0.0.1:%s/metrics", args.metrics_port)
+    return exporter
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Page Bitmaps
+Rendert den Content-Bereich jeder Seite vorab mit PIL in ein Bitmap -
+ein Seitenwechsel tauscht dann nur noch ein PhotoImage aus
+"""
+
+import json
+import os
+import threading
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+import metrics
+from page_content import HEADER_HEIGHT, content_area, find_page_image, plain_text
+
+# Layouts mit Live-Elementen (Video) werden weiterhin als Widgets aufgebaut
+LIVE_LAYOUTS = {'video_text', 'fullscreen_video'}
+
+FONT_FILES = {
+    False: ['DejaVuSans.ttf', 'LiberationSans-Regular.ttf', 'Arial.ttf', 'Helvetica.ttc'],
+    True: ['DejaVuSans-Bold.ttf', 'LiberationSans-Bold.ttf', 'Arial Bold.ttf', 'Helvetica.ttc'],
+}
+
+# Zeilenabstand relativ zur Schriftgröße
+LINE_SPACING = 1.35
+
+# Verzögerung nach Fenster-Resize bis zum Neu-Rendern (ms)
+RESIZE_DEBOUNCE_MS = 300
+
+CACHE_REQUESTS = {result: metrics.counter('bertrandt_cache_requests_total', 'Cache-Zugriffe nach Ergebnis',
+                                          cache='page_bitmap', result=result)
+                  for result in ('hit', 'rendered')}
+RENDER_SECONDS = metrics.histogram('bertrandt_page_render_seconds', 'Dauer des Vorab-Renderns einer Seite')
+
+
+@lru_cache(maxsize=32)
+def load_font(size_px, bold=False):
+    """TrueType-Schrift laden (systemweite Suche), sonst PIL-Standardschrift"""
+    for name in FONT_FILES[bold]:
+        try:
+            return ImageFont.truetype(name, size_px)
+        except OSError:
+            continue
+    return ImageFont.load_default(size_px)
+
+
+def pil_font(tk_font):
+    """Tk-Fonttupel (Familie, Punkte, Stil) in eine PIL-Schrift umrechnen"""
+    size_pt = tk_font[1]
+    bold = len(tk_font) > 2 and 'bold' in tk_font[2]
+    return load_font(round(size_pt * 96 / 72), bold)
+
+
+def wrap_text(draw, text, font, width):
+    """Text wortweise auf die Breite umbrechen (Absätze bleiben erhalten)
+
+    Zu lange Wörter (z.B. Pfade) werden wie im Tk-Text-Widget zeichenweise getrennt.
+    """
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ''
+        for word in paragraph.split(' '):
+            candidate = f"{line} {word}" if line else word
+            if draw.textlength(candidate, font=font) <= width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            line = word
+            while len(line) > 1 and draw.textlength(line, font=font) > width:
+                split = _fitting_chars(draw, line, font, width)
+                lines.append(line[:split])
+                line = line[split:]
+        lines.append(line)
+    return lines
+
+
+def _fitting_chars(draw, word, font, width):
+    """Anzahl Zeichen vom Wortanfang, die in die Breite passen (mindestens eins)"""
+    count = 1
+    while count < len(word) and draw.textlength(word[:count + 1], font=font) <= width:
+        count += 1
+    return count
+
+
+def page_signature(config, page_dir, size):
+    """Alles, was das Bitmap einer Seite beeinflusst (Config-Inhalt, Bild + Änderungszeit, Größe)"""
+    def mtime(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    image_path = find_page_image(config, page_dir)
+    return (json.dumps(config, sort_keys=True),
+            image_path, mtime(image_path) if image_path else None,
+            tuple(size))
+
+
+def render_page_bitmap(config, page_dir, size, colors, fonts, truncate=False):
+    """Content-Bereich einer Seite als PIL-Bild - None, falls Live-Widgets nötig sind.
+
+    truncate=True kürzt zu langen Text (ohne Widget-Fallback, z.B. im Kiosk-Modus).
+    """
+    if config.get('layout', 'text_only') in LIVE_LAYOUTS:
+        return None
+
+    width, height = size
+    bitmap = Image.new('RGB', (width, height), colors['background_tertiary'])
+    draw = ImageDraw.Draw(bitmap)
+
+    # Header mit Titel/Untertitel
+    draw.rectangle((0, 0, width, HEADER_HEIGHT), fill=colors['background_secondary'])
+    draw.text((width // 2, 12), config.get('title', 'Titel'), font=pil_font(fonts['display']),
+              fill=colors['text_primary'], anchor='ma')
+    if config.get('subtitle'):
+        draw.text((width // 2, 52), config['subtitle'], font=pil_font(fonts['subtitle']),
+                  fill=colors['accent_primary'], anchor='ma')
+
+    area = content_area(width, height)
+    left, top, right, bottom = area
+    layout = config.get('layout', 'text_only')
+
+    if layout == 'image_text':
+        middle = (left + right) // 2
+        _draw_image(bitmap, draw, config, page_dir, (left, top, middle - 10, bottom), colors, fonts)
+        fits = _draw_text(draw, config, (middle + 10, top, right, bottom), colors, fonts, truncate)
+    elif layout == 'fullscreen_image':
+        _draw_image(bitmap, draw, config, page_dir, area, colors, fonts)
+        fits = True
+    else:
+        fits = _draw_text(draw, config, area, colors, fonts, truncate)
+
+    # Zu langer Text braucht das scrollbare Text-Widget
+    return bitmap if fits else None
+
+
+def _draw_text(draw, config, box, colors, fonts, truncate=False):
+    left, top, right, bottom = box
+    # Rand wie im Widget-Renderer: Frame (15) + Text-Innenabstand (15)
+    draw.rectangle((left + 15, top + 15, right - 15, bottom - 15), fill=colors['background_secondary'])
+
+    font = pil_font(fonts['label'])
+    line_height = round(font.size * LINE_SPACING)
+    lines = wrap_text(draw, plain_text(config), font, right - left - 60)
+    max_lines = (bottom - 15 - top - 30) // line_height
+    if len(lines) > max_lines:
+        if not truncate:
+            return False
+        lines = lines[:max(1, max_lines)]
+        lines[-1] += " …"
+
+    y = top + 30
+    for line in lines:
+        draw.text((left + 30, y), line, font=font, fill=colors['text_primary'])
+        y += line_height
+    return True
+
+
+def _draw_image(bitmap, draw, config, page_dir, box, colors, fonts):
+    left, top, right, bottom = box
+    center = ((left + right) // 2, (top + bottom) // 2)
+    image_path = find_page_image(config, page_dir)
+
+    if image_path:
+        try:
+            with Image.open(image_path) as image:
+                image.thumbnail((max(1, right - left), max(1, bottom - top)), Image.Resampling.LANCZOS)
+                image = image.convert('RGBA')
+                bitmap.paste(image, (center[0] - image.width // 2, center[1] - image.height // 2), image)
+            return
+        except Exception as e:
+            message, color = f"Bild konnte nicht geladen werden\n{e}", colors['accent_tertiary']
+    else:
+        message = "Kein Bild verfügbar\n\nFügen Sie Bilder in den Ordner hinzu:\n" + page_dir
+        color = colors['text_secondary']
+
+    draw.multiline_text(center, message, font=pil_font(fonts['label']), fill=color,
+                        anchor='mm', align='center')
+
+
+class PageBitmapCache:
+    """Vorgerenderte Seiten-Bitmaps - thread-sicher, invalidiert über Änderungszeiten"""
+
+    def __init__(self, colors, fonts, truncate=False):
+        self.colors = colors
+        self.fonts = fonts
+        self.truncate = truncate
+        self._entries = {}
+        self._lock = threading.Lock()
+        # FreeType-Schriften nicht parallel benutzen
+        self._render_lock = threading.Lock()
+        self.stats = {'renders': 0, 'hits': 0}
+
+    def get(self, config, page_dir, size):
+        """(Signatur, Bitmap) einer Seite - rendert nur bei geänderter Signatur"""
+        signature = page_signature(config, page_dir, size)
+        with self._lock:
+            entry = self._entries.get(page_dir)
+            if entry and entry[0] == signature:
+                self.stats['hits'] += 1
+                CACHE_REQUESTS['hit'].inc()
+                return entry
+
+        with self._render_lock, RENDER_SECONDS.time():
+            bitmap = render_page_bitmap(config, page_dir, size, self.colors, self.fonts, self.truncate)
+        with self._lock:
+            self._entries[page_dir] = (signature, bitmap)
+            self.stats['renders'] += 1
+        CACHE_REQUESTS['rendered'].inc()
+        return signature, bitmap
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class BitmapPageView:
+    """Zeigt vorgerenderte Seiten in einem Canvas mit genau einem Bild-Item"""
+
+    def __init__(self, parent, colors, fonts, scheduler, page_source, transition_ms=0):
+        # Tk erst hier laden - Rendern/Cache funktionieren auch ohne Display (Kiosk-Modus)
+        import tkinter as tk
+        from PIL import ImageTk
+        from page_transitions import CrossfadeEngine
+        self._image_tk = ImageTk
+
+        self.parent = parent
+        self.scheduler = scheduler
+        # page_source() -> [(config, page_dir), ...] aller Seiten für das Vorab-Rendern
+        self.page_source = page_source
+        self.cache = PageBitmapCache(colors, fonts)
+        self.canvas = tk.Canvas(parent, bg=colors['background_tertiary'], highlightthickness=0, borderwidth=0)
+        self.canvas.pack(fill='both', expand=True)
+        self.image_item = self.canvas.create_image(0, 0, anchor='nw')
+
+        # Optional: Überblendung zwischen den Seiten-Bitmaps
+        self.transitions = CrossfadeEngine(scheduler, self.canvas, self.image_item,
+                                           duration_ms=transition_ms) if transition_ms else None
+
+        self._photos = {}
+        self._shown = None
+        self._shown_bitmap = None
+        self._shown_page_dir = None
+        self._size = None
+        self._resize_task = None
+        self.parent.bind('<Configure>', self._on_configure, add='+')
+
+    def _current_size(self):
+        # Größe des Content-Frames - der Canvas ist bei Live-Seiten ausgeblendet
+        return (max(self.parent.winfo_width(), 1), max(self.parent.winfo_height(), 1))
+
+    def render(self, config, page_dir):
+        """Seite anzeigen; False falls die Seite Live-Widgets braucht"""
+        size = self._current_size()
+        signature = page_signature(config, page_dir, size)
+
+        photo_entry = self._photos.get(page_dir)
+        if photo_entry is None or photo_entry[0] != signature:
+            # Nicht vorgerendert oder Inhalt geändert - jetzt synchron rendern
+            signature, bitmap = self.cache.get(config, page_dir, size)
+            photo_entry = self._store_photo(page_dir, signature, bitmap)
+
+        previous_bitmap = self._shown_bitmap if page_dir != self._shown_page_dir else None
+        self._shown_page_dir = page_dir
+        signature, photo, bitmap = photo_entry
+        if photo is None:
+            self._shown_bitmap = None
+            if self.transitions:
+                self.transitions.cancel()
+            return False
+
+        self._shown_bitmap = bitmap
+        if not (self.transitions and self.transitions.start(previous_bitmap, bitmap, lambda: self._show(photo))):
+            self._show(photo)
+        return True
+
+    def _show(self, photo):
+        # Referenz halten - sonst löscht Tk das Bild, sobald der Cache geleert wird
+        self._shown = photo
+        self.canvas.itemconfigure(self.image_item, image=photo)
+
+    def _store_photo(self, page_dir, signature, bitmap):
+        photo = self._image_tk.PhotoImage(bitmap) if bitmap is not None else None
+        self._photos[page_dir] = (signature, photo, bitmap)
+        return self._photos[page_dir]
+
+    def _store_prerendered(self, page_dir, signature, bitmap):
+        self._store_photo(page_dir, signature, bitmap)
+        # Nach einem Resize die sichtbare Seite in neuer Größe zeigen
+        if page_dir == self._shown_page_dir and bitmap is not None and signature[-1] == self._current_size():
+            if self.transitions:
+                self.transitions.cancel()
+            self._shown_bitmap = bitmap
+            self._show(self._photos[page_dir][1])
+
+    def prerender(self):
+        """Alle Seiten im Worker-Thread rendern, PhotoImages danach gestaffelt im GUI-Thread erzeugen"""
+        size = self._current_size()
+        pages = self.page_source()
+
+        def render_all():
+            return [(page_dir,) + self.cache.get(config, page_dir, size) for config, page_dir in pages]
+
+        def store_all(results):
+            for index, (page_dir, signature, bitmap) in enumerate(results):
+                # PhotoImage-Konvertierung kostet UI-Zeit - nicht alles in einem Rutsch
+                self.scheduler.after(index * 50, lambda args=(page_dir, signature, bitmap): self._store_prerendered(*args),
+                                     name='bitmap_photo')
+
+        self.scheduler.submit(render_all, name='bitmap_prerender', on_done=store_all)
+
+    def _on_configure(self, event):
+        if event.widget is not self.parent:
+            return
+        size = (event.width, event.height)
+        if size == self._size:
+            return
+        self._size = size
+        # Resize-Serien bündeln und erst danach neu rendern
+        if self._resize_task:
+            self._resize_task.cancel()
+        self._resize_task = self.scheduler.after(RESIZE_DEBOUNCE_MS, self._on_resized, name='bitmap_resize')
+
+    def _on_resized(self):
+        self._resize_task = None
+        self._photos.clear()
+        self.cache.clear()
+        self.prerender()
+
+    def destroy(self):
+        if self.transitions:
+            self.transitions.cancel()
+        self.canvas.destroy()
+        self._photos.clear()
+        self.cache.clear()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Page Content
+Gemeinsamer Zugriff auf die Seiten-Konfiguration (content/page_X_typ/config.json)
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+
+IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.bmp']
+
+# Unterstützte Seiten-Layouts
+LAYOUTS = ['text_only', 'image_text', 'video_text', 'fullscreen_image', 'fullscreen_video']
+
+# Seiten-Geometrie (gemeinsam für Canvas- und Bitmap-Renderer)
+HEADER_HEIGHT = 80
+VIDEO_TEXT_HEIGHT = 200
+
+# Einfaches Text-Markup (config.json: "text_format": "markup")
+#   # Überschrift   ## Zwischenüberschrift   - Aufzählung   **fett**
+MARKUP_BOLD = re.compile(r'\*\*(.+?)\*\*')
+
+# Seiten des Messestands (Farbe als Schlüssel in theme.COLORS)
+PAGES = {
+    1: {'name': 'Willkommen', 'color': 'accent_secondary', 'icon': '🏠', 'content_type': 'welcome'},
+    2: {'name': 'Unternehmen', 'color': 'bertrandt_blue', 'icon': '🏢', 'content_type': 'company'},
+    3: {'name': 'Produkte', 'color': 'bertrandt_orange', 'icon': '⚙️', 'content_type': 'products'},
+    4: {'name': 'Innovation', 'color': 'accent_primary', 'icon': '💡', 'content_type': 'innovation'},
+    5: {'name': 'Technologie', 'color': 'bertrandt_blue', 'icon': '🔬', 'content_type': 'technology'},
+    6: {'name': 'Referenzen', 'color': 'accent_secondary', 'icon': '⭐', 'content_type': 'references'},
+    7: {'name': 'Team', 'color': 'bertrandt_orange', 'icon': '👥', 'content_type': 'team'},
+    8: {'name': 'Karriere', 'color': 'accent_primary', 'icon': '🚀', 'content_type': 'career'},
+    9: {'name': 'Kontakt', 'color': 'bertrandt_blue', 'icon': '📞', 'content_type': 'contact'},
+    10: {'name': 'Danke', 'color': 'accent_secondary', 'icon': '🙏', 'content_type': 'thanks'},
+}
+
+
+def page_directory(content_dir, page_id, content_type):
+    """Ordner einer Seite"""
+    return os.path.join(content_dir, f"page_{page_id}_{content_type}")
+
+
+def load_page_config(page_dir, fallback):
+    """config.json einer Seite laden - bei fehlender/defekter Datei den Fallback"""
+    try:
+        with open(os.path.join(page_dir, "config.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return dict(fallback)
+
+
+def load_page(content_dir, page_id):
+    """(Konfiguration, Ordner) einer Seite - mit Platzhalter-Text, falls noch kein Inhalt existiert"""
+    page_info = PAGES.get(page_id, {})
+    page_dir = page_directory(content_dir, page_id, page_info.get('content_type', 'welcome'))
+    config = load_page_config(page_dir, {
+        "title": page_info.get('name', f'Seite {page_id}'),
+        "subtitle": f"Seite {page_id}",
+        "text_content": f"Seite {page_id} - Inhalt wird geladen...",
+        "layout": "text_only"
+    })
+    return config, page_dir
+
+
+def find_page_image(config, page_dir):
+    """Bildpfad einer Seite: background_image, erstes Bild aus images oder erstes Bild im Ordner"""
+    image_path = None
+    if config.get('background_image'):
+        image_path = os.path.join(page_dir, config['background_image'])
+    elif config.get('images'):
+        image_path = os.path.join(page_dir, config['images'][0])
+
+    if image_path and os.path.exists(image_path):
+        return image_path
+
+    try:
+        files = sorted(os.listdir(page_dir))
+    except OSError:
+        return None
+    for ext in IMAGE_EXTENSIONS:
+        for file in files:
+            if file.lower().endswith(ext):
+                return os.path.join(page_dir, file)
+    return None
+
+
+def content_area(width, height):
+    """Content-Bereich unter dem Header mit responsivem Rand (wie im Widget-Renderer)"""
+    pad_x = max(10, width // 80)
+    pad_y = max(10, height // 60)
+    return (pad_x, HEADER_HEIGHT + pad_y, width - pad_x, height - pad_y)
+
+
+@lru_cache(maxsize=64)
+def parse_markup(text):
+    """Markup in Abschnitte (Text, Tags) zerlegen - je Text nur einmal"""
+    runs = []
+    for number, line in enumerate(text.split('\n')):
+        if number:
+            runs.append(('\n', ()))
+        tags = ()
+        if line.startswith('## '):
+            line, tags = line[3:], ('h2',)
+        elif line.startswith('# '):
+            line, tags = line[2:], ('h1',)
+        elif line.startswith('- '):
+            line, tags = '• ' + line[2:], ('bullet',)
+        for index, part in enumerate(MARKUP_BOLD.split(line)):
+            if part:
+                runs.append((part, tags + ('bold',) if index % 2 else tags))
+    return tuple(runs)
+
+
+def page_text(config):
+    """Text einer Seite als Abschnitte (Text, Tags) - ohne Markup ein einziger Abschnitt"""
+    text = config.get('text_content', 'Kein Text verfügbar.')
+    if config.get('text_format') == 'markup':
+        return parse_markup(text)
+    return ((text, ()),)
+
+
+def plain_text(config):
+    """Text einer Seite ohne Markup-Zeichen (für Canvas- und Bitmap-Renderer)"""
+    return ''.join(chunk for chunk, _ in page_text(config))
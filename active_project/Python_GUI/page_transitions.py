@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Page Transitions
+Überblendung zwischen zwei vorgerenderten Seiten-Bitmaps: die Frames werden im
+Worker-Thread mit Image.blend berechnet und im GUI-Thread in ein PhotoImage kopiert
+"""
+
+import threading
+import time
+
+from PIL import Image
+
+from log_setup import get_logger
+
+# Anteil der geplanten Frames, der mindestens angezeigt werden muss
+MIN_FRAME_RATIO = 0.3
+
+# Nach so vielen zu langsamen Überblendungen wird sofort umgeschaltet
+MAX_SLOW_TRANSITIONS = 2
+
+logger = get_logger('transitions')
+
+
+class CrossfadeRun:
+    """Eine laufende Überblendung (Worker berechnet, GUI-Thread zeigt den jeweils neuesten Frame)"""
+
+    def __init__(self, engine, before, after, on_done):
+        self.engine = engine
+        self.before = before
+        self.after = after
+        self.on_done = on_done
+        self.cancelled = False
+        self.finished = False
+        self.last_frame = None
+        self.frames_shown = 0
+        self.frames_dropped = 0
+        self._slot = None
+        self._blending_done = False
+        self._lock = threading.Lock()
+        self._task = None
+        self._start = None
+
+    def start(self):
+        engine = self.engine
+        self._start = time.perf_counter()
+        engine.scheduler.submit(self._blend_loop, name='crossfade_blend')
+        self._task = engine.scheduler.every(engine.frame_ms, self._tick, name='crossfade_frame')
+
+    def _blend_loop(self):
+        """Worker: Frames für den jeweils nächsten Anzeigezeitpunkt berechnen"""
+        engine = self.engine
+        frame_time = engine.frame_ms / 1000
+        while not self.cancelled:
+            started = time.perf_counter()
+            # Alpha für den Zeitpunkt berechnen, an dem der Frame angezeigt wird
+            alpha = (started - self._start + frame_time) / engine.duration
+            if alpha >= 1:
+                break
+            frame = Image.blend(self.before, self.after, alpha)
+            with self._lock:
+                if self._slot is not None:
+                    # GUI-Thread kommt nicht hinterher - älteren Frame verwerfen
+                    self.frames_dropped += 1
+                self._slot = frame
+            time.sleep(max(0.0, frame_time - (time.perf_counter() - started)))
+        self._blending_done = True
+
+    def _tick(self):
+        """GUI-Thread: neuesten Frame anzeigen, bei Zeitablauf abschließen"""
+        if self.finished:
+            return
+        with self._lock:
+            frame, self._slot = self._slot, None
+
+        engine = self.engine
+        elapsed = time.perf_counter() - self._start
+        if frame is not None and elapsed < engine.duration:
+            paste_start = time.perf_counter()
+            engine.show_frame(frame)
+            self.last_frame = frame
+            self.frames_shown += 1
+            # Ein einzelner Frame sprengt das Zeitbudget deutlich - sofort fertig stellen
+            if time.perf_counter() - paste_start > 2 * engine.frame_ms / 1000:
+                self.finish(too_slow=True)
+                return
+
+        if elapsed >= engine.duration or (self._blending_done and self._slot is None):
+            self.finish()
+
+    def cancel(self):
+        """Abbrechen ohne Ziel-Seite anzuzeigen (neuer Seitenwechsel übernimmt)"""
+        self.cancelled = True
+        self.finished = True
+        if self._task:
+            self._task.cancel()
+
+    def finish(self, too_slow=False):
+        if self.finished:
+            return
+        self.cancel()
+        self.on_done()
+
+        engine = self.engine
+        expected = max(1, int(engine.duration * 1000 / engine.frame_ms))
+        engine.stats['frames_shown'] += self.frames_shown
+        engine.stats['frames_dropped'] += self.frames_dropped + max(0, expected - self.frames_shown - self.frames_dropped)
+        if too_slow or self.frames_shown < expected * MIN_FRAME_RATIO:
+            engine.report_slow(self.frames_shown, expected)
+
+
+class CrossfadeEngine:
+    def __init__(self, scheduler, canvas, image_item, duration_ms=400, fps=30):
+        # ImageTk erst hier laden - das Modul bleibt ohne Display importierbar
+        from PIL import ImageTk
+        self._image_tk = ImageTk
+
+        self.scheduler = scheduler
+        self.canvas = canvas
+        self.image_item = image_item
+        self.duration = duration_ms / 1000
+        self.frame_ms = max(1, int(1000 / fps))
+        self.enabled = True
+        self.slow_transitions = 0
+        self.stats = {'transitions': 0, 'instant': 0, 'frames_shown': 0, 'frames_dropped': 0}
+        self._run = None
+        self._frame_photo = None
+
+    def start(self, before, after, on_done):
+        """Überblendung starten - False heißt: sofort umschalten (on_done wird nicht aufgerufen)"""
+        previous = self.cancel()
+        if previous is not None and previous.last_frame is not None:
+            # Laufende Überblendung: vom gerade sichtbaren Frame aus weiterblenden
+            before = previous.last_frame
+
+        if not self.enabled or before is None or after is None or before.size != after.size:
+            self.stats['instant'] += 1
+            return False
+
+        self.stats['transitions'] += 1
+        self._run = CrossfadeRun(self, before, after, on_done)
+        self._run.start()
+        return True
+
+    def cancel(self):
+        """Laufende Überblendung abbrechen; gibt sie zurück (oder None)"""
+        run, self._run = self._run, None
+        if run is not None and not run.finished:
+            run.cancel()
+            return run
+        return None
+
+    def show_frame(self, frame):
+        """Frame in das wiederverwendete PhotoImage kopieren und anzeigen"""
+        photo = self._frame_photo
+        if photo is None or (photo.width(), photo.height()) != frame.size:
+            photo = self._frame_photo = self._image_tk.PhotoImage(frame.mode, frame.size)
+            self.canvas.itemconfigure(self.image_item, image=photo)
+        elif self.canvas.itemcget(self.image_item, 'image') != str(photo):
+            self.canvas.itemconfigure(self.image_item, image=photo)
+        photo.paste(frame)
+
+    def report_slow(self, frames_shown, expected):
+        """Zu wenige Frames geschafft - nach wiederholtem Auftreten nur noch sofort umschalten"""
+        self.slow_transitions += 1
+        logger.warning("⚠️ Überblendung zu langsam (%s/%s Frames)", frames_shown, expected)
+        if self.slow_transitions >= MAX_SLOW_TRANSITIONS and self.enabled:
+            self.enabled = False
+            logger.warning("⚠️ Überblendungen deaktiviert - Seitenwechsel ab jetzt ohne Animation")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Sampling Profiler
+Statistischer Profiler für den laufenden Betrieb: ein Hintergrund-Thread liest in festen
+Abständen die Stacks aller Threads (Tk-Mainloop, Serial-Reader, Flash-Worker, ...) und zählt
+sie pro Sekunde. Ausgabe als Collapsed Stacks (flamegraph.pl, speedscope.app) für die letzten
+N Minuten. Ein-/Ausschalten per GUI-Button, SIGUSR1 oder cli_monitor.py --action profile.
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+DEFAULT_INTERVAL_MS = 10
+DEFAULT_WINDOW_MINUTES = 5
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs")
+
+# Tiefere Stacks werden oben abgeschnitten (Rekursion)
+MAX_DEPTH = 80
+
+
+class SamplingProfiler:
+    """Stacks aller Threads sammeln - je Sekunde ein Counter, ältere als das Fenster fallen heraus"""
+
+    def __init__(self, interval_ms=DEFAULT_INTERVAL_MS, window_minutes=DEFAULT_WINDOW_MINUTES,
+                 output_dir=DEFAULT_OUTPUT_DIR):
+        self.interval = interval_ms / 1000
+        self.window = window_minutes * 60
+        self.output_dir = output_dir
+        self.running = False
+        self._thread = None
+        self._lock = threading.Lock()
+        self._buckets = deque()
+        self._labels = {}
+        self.stats = {'samples': 0, 'sample_ms': 0.0, 'started': None}
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.stats['started'] = time.time()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.running = False
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def toggle(self):
+        """Starten bzw. stoppen und schreiben; gibt beim Stoppen den Pfad der Ausgabe zurück"""
+        if not self.running:
+            self.start()
+            return None
+        self.stop()
+        return self.write()
+
+    def _label(self, code):
+        # Ein String je Code-Objekt - im Sampling-Takt wird nichts formatiert
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+
+    def _run(self):
+        own_id = threading.get_ident()
+        names = {}
+        names_refreshed = 0
+        while self.running:
+            time.sleep(self.interval)
+            started = time.perf_counter()
+            now = time.time()
+            if now - names_refreshed > 1:
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+                names_refreshed = now
+
+            stacks = []
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                labels = []
+                while frame is not None and len(labels) < MAX_DEPTH:
+                    labels.append(self._label(frame.f_code))
+                    frame = frame.f_back
+                labels.append(names.get(thread_id, f"thread-{thread_id}"))
+                stacks.append(';'.join(reversed(labels)))
+
+            second = int(now)
+            with self._lock:
+                if not self._buckets or self._buckets[-1][0] != second:
+                    self._buckets.append((second, Counter()))
+                    while self._buckets and self._buckets[0][0] < second - self.window:
+                        self._buckets.popleft()
+                self._buckets[-1][1].update(stacks)
+
+            # Eigene Kosten mitführen - zeigt, ob das Intervall zu klein ist
+            elapsed = (time.perf_counter() - started) * 1000
+            self.stats['samples'] += 1
+            self.stats['sample_ms'] += (elapsed - self.stats['sample_ms']) / min(self.stats['samples'], 100)
+
+    def collapsed(self, minutes=None):
+        """Counter {Stack: Anzahl} über die letzten minutes (Standard: ganzes Fenster)"""
+        since = time.time() - (minutes * 60 if minutes else self.window)
+        total = Counter()
+        with self._lock:
+            for second, counts in self._buckets:
+                if second >= since:
+                    total.update(counts)
+        return total
+
+    def write(self, path=None, minutes=None):
+        """Collapsed Stacks schreiben ('thread;aussen;...;innen anzahl' je Zeile)"""
+        if path is None:
+            os.makedirs(self.output_dir, exist_ok=True)
+            path = os.path.join(self.output_dir, time.strftime("profile-%Y%m%d-%H%M%S.folded"))
+        stacks = self.collapsed(minutes)
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        return path
+
+    def top(self, count=15, minutes=None):
+        """Funktionen mit den meisten Samples als innerster Frame (Self-Time)"""
+        leaves = Counter()
+        for stack, samples in self.collapsed(minutes).items():
+            leaves[stack.rsplit(';', 1)[-1]] += samples
+        return leaves.most_common(count)
+
+
+def install_signal_handler(callback, signum=getattr(signal, 'SIGUSR1', None)):
+    """callback() bei SIGUSR1 aufrufen (nur im Haupt-Thread und nicht unter Windows möglich)"""
+    if signum is None or threading.current_thread() is not threading.main_thread():
+        return False
+
+    def handler(received, frame):
+        # Der Handler unterbricht den Haupt-Thread an beliebiger Stelle - evtl. mitten in einem
+        # gehaltenen Lock (z.B. Scheduler). Darum läuft der Callback in einem eigenen Thread.
+        threading.Thread(target=callback, name='profiler-signal', daemon=True).start()
+    signal.signal(signum, handler)
+    return True
+
+
+def find_process(script="Bertrandt_GUI.py"):
+    """PID eines laufenden Python-Prozesses mit diesem Skript (über /proc, nur Linux)"""
+    own_pid = os.getpid()
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit() or int(entry) == own_pid:
+            continue
+        try:
+            with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                args = f.read().split(b'\0')
+        except OSError:
+            continue
+        if any(os.path.basename(arg.decode(errors='replace')) == script for arg in args[1:3]):
+            return int(entry)
+    return None
+
+
+def add_arguments(parser):
+    """Kommandozeilen-Optionen für die GUI"""
+    group = parser.add_argument_group('Profiler')
+    group.add_argument('--profile', action='store_true',
+                       help='Sampling-Profiler sofort starten (sonst per Button oder SIGUSR1)')
+    group.add_argument('--profile-interval', type=float, default=DEFAULT_INTERVAL_MS,
+                       help='Abstand zwischen zwei Samples in ms')
+    group.add_argument('--profile-window', type=float, default=DEFAULT_WINDOW_MINUTES,
+                       help='Minuten, die in die Ausgabe eingehen')
+
+
+def from_args(args):
+    """Profiler nach den Optionen anlegen (und mit --profile gleich starten)"""
+    profiler = SamplingProfiler(args.profile_interval, args.profile_window)
+    if args.profile:
+        profiler.start()
+    return profiler
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Signal Broker
+Ein Prozess besitzt die Serial/UDP-Eingänge und verteilt die Events über einen
+lokalen Unix-Socket an beliebig viele Anzeige-Prozesse
+"""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+
+import metrics
+from link_stats import LatencyStats
+from log_setup import level_logger
+from signal_protocol import ack_packet, parse_line
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "bertrandt_signals.sock")
+
+PUBLISH_SECONDS = metrics.histogram('bertrandt_broker_publish_seconds', 'Verteilzeit eines Events an alle Anzeigen')
+DELIVERY_SECONDS = metrics.histogram('bertrandt_broker_delivery_seconds', 'Latenz Empfang im Broker -> Anzeige')
+BROKER_RECONNECTS = metrics.counter('bertrandt_reconnects_total', 'Neu aufgebaute Verbindungen', link='broker')
+
+
+def load_page_map(spec):
+    """Signal -> Seite Zuordnung aus JSON-Datei ({"1": 3, ...}) oder Text "1=3,2=5" """
+    if not spec:
+        return {}
+    if os.path.exists(spec):
+        with open(spec, 'r', encoding='utf-8') as f:
+            return {int(signal): int(page) for signal, page in json.load(f).items()}
+    page_map = {}
+    for pair in spec.split(','):
+        signal, page = pair.split('=')
+        page_map[int(signal)] = int(page)
+    return page_map
+
+
+class SignalBroker:
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, log=None, input_map=None):
+        self.socket_path = socket_path
+        self.log = log or level_logger('broker')
+        # GIGA-Eingang -> Signal (Event-Modus) - zentral, damit alle Anzeigen dasselbe sehen
+        self.input_map = input_map
+        self.running = False
+        self.clients = []
+        self.state = {}
+        self.seq = 0
+        self.stats = {'published': 0, 'clients_dropped': 0}
+        self.publish_time = LatencyStats()
+        # Latenz/Verlust je Eingang ('serial', 'udp')
+        self.link_stats = {}
+        self._lock = threading.Lock()
+        metrics.gauge('bertrandt_broker_clients', 'Verbundene Anzeigen').set_function(lambda: len(self.clients))
+        # Serial-, UDP- und Accept-Thread dürfen nicht gleichzeitig in einen Socket schreiben
+        self._send_lock = threading.Lock()
+        self._server = None
+        self._threads = []
+
+    def start(self):
+        """Unix-Socket öffnen und Verbindungen annehmen"""
+        if os.path.exists(self.socket_path):
+            # Übrig gebliebener Socket eines beendeten Brokers
+            os.unlink(self.socket_path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.socket_path)
+        self._server.listen()
+        self.running = True
+        self._spawn(self._accept_loop, 'broker-accept')
+        self.log(f"📡 Broker lauscht auf {self.socket_path}", "SUCCESS")
+
+    def _spawn(self, target, name, *args):
+        thread = threading.Thread(target=target, args=args, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                break
+            client.setblocking(False)
+            with self._send_lock:
+                with self._lock:
+                    self.clients.append(client)
+                    # Neue Anzeige sofort auf den aktuellen Stand bringen
+                    snapshot = sorted(self.state.values(), key=lambda event: event['seq'])
+                for event in snapshot:
+                    self._send(client, self._encode(dict(event, replay=True)))
+            self.log(f"🖥️ Anzeige verbunden ({len(self.clients)} aktiv)", "INFO")
+
+    def _encode(self, event):
+        return (json.dumps(event) + "\n").encode('utf-8')
+
+    def _send(self, client, data):
+        """Nicht-blockierend senden - eine hängende Anzeige bremst die anderen nicht aus"""
+        try:
+            client.sendall(data)
+            return True
+        except (BlockingIOError, OSError):
+            with self._lock:
+                if client in self.clients:
+                    self.clients.remove(client)
+                    self.stats['clients_dropped'] += 1
+            client.close()
+            self.log("🖥️ Anzeige getrennt", "WARNING")
+            return False
+
+    def publish(self, event, t_rx=None):
+        """Event mit Sequenznummer und Empfangszeitpunkt an alle Anzeigen verteilen"""
+        start = time.time()
+        with self._lock:
+            self.seq += 1
+            event = dict(event, seq=self.seq, t_rx=t_rx or start)
+            if event['type'] in ('signal', 'clients'):
+                self.state[event['type']] = event
+            clients = list(self.clients)
+        data = self._encode(event)
+        with self._send_lock:
+            for client in clients:
+                self._send(client, data)
+            self.stats['published'] += 1
+        elapsed = time.time() - start
+        self.publish_time.record(elapsed)
+        PUBLISH_SECONDS.observe(elapsed)
+
+    # --- Eingänge ------------------------------------------------------------
+
+    def attach_serial(self, port, baudrate=115200):
+        """ESP32 Serial-Ausgabe einlesen"""
+        # pyserial nur im Broker-Prozess laden - Anzeigen brauchen es nicht
+        import serial
+
+        from link_stats import LinkStats
+
+        connection = serial.Serial(port, baudrate, timeout=1)
+        self.link_stats['serial'] = LinkStats('serial')
+        self.log(f"🔌 Serial-Eingang: {port}", "SUCCESS")
+        self._spawn(self._serial_loop, 'broker-serial', connection)
+
+    def _serial_loop(self, connection):
+        import serial
+
+        link = self.link_stats['serial']
+        try:
+            while self.running:
+                raw = connection.readline()
+                t_rx = time.time()
+                received = time.perf_counter()
+                event = parse_line(raw)
+                if event and event['type'] in ('signal', 'clients'):
+                    if not link.observe(event, received):
+                        continue
+                    self._publish_input(event, t_rx)
+        except serial.SerialException as e:
+            self.log(f"Serial-Eingang beendet: {e}", "ERROR")
+        finally:
+            connection.close()
+
+    def attach_udp(self, port, host='0.0.0.0'):
+        """GIGA UDP-Pakete direkt empfangen (Host im Messe-WLAN)"""
+        from link_stats import LinkStats
+
+        self.link_stats['udp'] = LinkStats('udp')
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.bind((host, port))
+        sock.settimeout(1.0)
+        self.log(f"📶 UDP-Eingang: Port {port}", "SUCCESS")
+        self._spawn(self._udp_loop, 'broker-udp', sock)
+
+    def _udp_loop(self, sock):
+        link = self.link_stats['udp']
+        try:
+            while self.running:
+                try:
+                    payload, address = sock.recvfrom(512)
+                except socket.timeout:
+                    continue
+                t_rx = time.time()
+                received = time.perf_counter()
+                event = parse_line(payload, source='udp')
+                if event and event['type'] == 'signal':
+                    if event.get('ack') and 'seq' in event:
+                        # Wie das ESP32 quittieren - auch Wiederholungen, das erste ACK kann verloren sein
+                        sock.sendto(ack_packet(event), address)
+                    if not link.observe(event, received):
+                        continue
+                    self._publish_input(event, t_rx)
+        finally:
+            sock.close()
+
+    def _publish_input(self, event, t_rx):
+        """Eingangs-Events des GIGA vor dem Verteilen in Signale übersetzen"""
+        if self.input_map:
+            event = self.input_map.translate(event)
+        if event:
+            self.publish(event, t_rx)
+
+    def summary(self):
+        with self._lock:
+            clients = len(self.clients)
+        summary = dict(self.stats, clients=clients, publish=self.publish_time.summary())
+        if self.link_stats:
+            summary['links'] = {name: link.summary() for name, link in self.link_stats.items()}
+        if self.input_map and self.input_map.stats['inputs']:
+            summary['inputs'] = self.input_map.summary()
+        return summary
+
+    def stop(self):
+        self.running = False
+        if self._server:
+            self._server.close()
+            self._server = None
+        with self._lock:
+            clients, self.clients = self.clients, []
+        for client in clients:
+            client.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+class BrokerClient:
+    """Anzeige-Seite: Events vom Broker lesen, Latenz messen, bei Abbruch neu verbinden"""
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, on_event=None, on_status=None, reconnect_interval=2.0):
+        self.socket_path = socket_path
+        self.on_event = on_event
+        self.on_status = on_status
+        self.reconnect_interval = reconnect_interval
+        self.running = False
+        self.connected = False
+        self.latency = LatencyStats()
+        self.lost_events = 0
+        self.connects = 0
+        self._last_seq = None
+        self._sock = None
+        self._thread = None
+
+    def start(self):
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name='broker-client', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.running = False
+        if self._sock:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _set_connected(self, connected):
+        if connected != self.connected:
+            self.connected = connected
+            if self.on_status:
+                self.on_status(connected)
+
+    def _run(self):
+        while self.running:
+            try:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._sock.connect(self.socket_path)
+            except OSError:
+                self._sock.close()
+                time.sleep(self.reconnect_interval)
+                continue
+
+            self.connects += 1
+            if self.connects > 1:
+                BROKER_RECONNECTS.inc()
+            self._set_connected(True)
+            try:
+                for line in self._sock.makefile('r', encoding='utf-8'):
+                    self._handle(line)
+            except (OSError, ValueError):
+                pass
+            finally:
+                self._sock.close()
+                self._last_seq = None
+                self._set_connected(False)
+            if self.running:
+                time.sleep(self.reconnect_interval)
+
+    def _handle(self, line):
+        event = json.loads(line)
+        if not event.get('replay'):
+            latency = max(0.0, time.time() - event.get('t_rx', time.time()))
+            self.latency.record(latency)
+            DELIVERY_SECONDS.observe(latency)
+
+        seq = event.get('seq')
+        # Replay enthält nur die letzten Events je Typ - Lücken dort sind keine Verluste
+        if (not event.get('replay') and self._last_seq is not None and seq is not None
+                and seq > self._last_seq + 1):
+            self.lost_events += seq - self._last_seq - 1
+        if seq is not None:
+            self._last_seq = max(seq, self._last_seq or 0)
+
+        if self.on_event:
+            self.on_event(event)
+
+    def summary(self):
+        return dict(self.latency.summary(), connected=self.connected, lost=self.lost_events)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Signal Protocol
+Gemeinsamer Parser für ESP32-Zeilen (Serial) und GIGA-Pakete (UDP)
+
+Zeilen können Zusatzfelder tragen: "SIGNAL:3;rx=123456" (rx = micros() beim Empfang im ESP32)
+
+GIGA-Pakete mit Sequenznummer: "3;seq=17;ts=<micros>" - optional ";ack=1" (Empfänger quittiert mit
+"ACK:17;ts=<micros>"), ";retry=n" bei Wiederholungen und ";rtt=<µs>" (RTT des letzten ACK).
+Das ESP32 hängt die Felder an seine Zeile an: "SIGNAL:3;seq=17;ts=...;rx=..."
+"""
+
+import metrics
+
+SIGNAL_MIN = 1
+SIGNAL_MAX = 10
+
+# Metriken je Quelle ('serial', 'udp') - nur aktiv mit eingeschalteter Registry
+_METRICS = {}
+
+
+def parse_line(line, source='serial'):
+    """Eine Zeile in ein Event übersetzen.
+
+    Ergebnis: {'type': 'signal'|'clients', 'value': n, ...Zusatzfelder},
+    {'type': 'invalid'|'log', 'text': ...} oder None für Leerzeilen.
+    """
+    event = _parse(line)
+    if metrics.REGISTRY.enabled:
+        _record(line, event, source)
+    return event
+
+
+def _record(line, event, source):
+    if source not in _METRICS:
+        _METRICS[source] = {
+            'bytes': metrics.counter('bertrandt_input_bytes_total', 'Empfangene Bytes', source=source),
+            'errors': metrics.counter('bertrandt_parse_errors_total', 'Zeilen mit ungültigem Format', source=source),
+            'events': {kind: metrics.counter('bertrandt_input_events_total', 'Geparste Zeilen nach Typ',
+                                             source=source, type=kind)
+                       for kind in ('signal', 'clients', 'ack', 'invalid', 'log')},
+        }
+    counters = _METRICS[source]
+    counters['bytes'].inc(len(line))
+    if event:
+        counters['events'][event['type']].inc()
+        if event['type'] == 'invalid':
+            counters['errors'].inc()
+
+
+def _parse(line):
+    if isinstance(line, bytes):
+        line = line.decode('utf-8', errors='replace')
+    line = line.strip()
+    if not line:
+        return None
+
+    for prefix, event_type in (("SIGNAL:", 'signal'), ("Clients:", 'clients'), ("ACK:", 'ack')):
+        if line.startswith(prefix):
+            value, *fields = line[len(prefix):].split(';')
+            try:
+                event = {'type': event_type, 'value': int(value.strip())}
+                for field in fields:
+                    key, _, number = field.partition('=')
+                    key = key.strip()
+                    if key in event:
+                        raise ValueError(key)
+                    event[key] = int(number)
+            except ValueError:
+                return {'type': 'invalid', 'text': line}
+            return event
+
+    # GIGA sendet per UDP nur die Zahl (ggf. mit Zusatzfeldern)
+    if line.split(';', 1)[0].isdigit():
+        return _parse("SIGNAL:" + line)
+
+    return {'type': 'log', 'text': line}
+
+
+def ack_packet(event):
+    """Quittung für ein Paket mit ack=1 - ts geht zurück, damit der Sender die RTT messen kann"""
+    return f"ACK:{event['seq']};ts={event.get('ts', 0)}".encode('ascii')
+
+
+def is_valid_signal(value):
+    return SIGNAL_MIN <= value <= SIGNAL_MAX
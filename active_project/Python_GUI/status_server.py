@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Status Server
+Eingebetteter HTTP+WebSocket Server (asyncio im eigenen Thread) für Status,
+Messwerte und Seitenwahl aus dem Messe-LAN - ohne den Tk-Thread zu berühren
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import ipaddress
+import json
+import secrets
+import struct
+import threading
+import time
+from collections import deque
+from urllib.parse import parse_qs, urlsplit
+
+# Modulname kollidiert sonst mit dem metrics-Callback des Servers
+import metrics as metrics_registry
+from tracing import TRACER
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+HISTORY_SIZE = 100
+
+# Ausstehende Events pro WebSocket-Client - langsame Clients verlieren die ältesten
+CLIENT_QUEUE_SIZE = 100
+
+MAX_HEADER_BYTES = 8192
+MAX_BODY_BYTES = 4096
+MAX_WS_FRAME_BYTES = 4096
+
+STATUS_TEXTS = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed"}
+
+# Host-Header bei Bindung an localhost ohne Token (gegen DNS-Rebinding)
+LOOPBACK_NAMES = {'localhost', '127.0.0.1', '::1'}
+TOKEN_HEADER = 'x-bertrandt-token'
+
+INDEX_HTML = """<!DOCTYPE html>
+<html lang="de"><head><meta charset="utf-8"><title>Bertrandt Messestand</title>
+<style>
+body{font-family:sans-serif;background:#111;color:#eee;margin:2em}
+.big{font-size:3em;color:#FF6600}button{margin:3px;padding:10px 14px;font-size:1em}
+pre{background:#222;padding:1em;max-height:20em;overflow:auto}
+</style></head><body>
+<h1>Bertrandt Messestand</h1>
+<div>Seite: <span class="big" id="signal">-</span> <span id="name"></span></div>
+<div>Clients: <b id="clients">-</b> &middot; Verbindung: <b id="connection">-</b> &middot; Zuschauer: <b id="watchers">-</b></div>
+<div id="pages"></div>
+<h3>Ereignisse</h3><pre id="log"></pre>
+<script>
+const $ = id => document.getElementById(id);
+const token = new URLSearchParams(location.search).get('token');
+function show(s){ for (const k of ['signal','name','clients','connection','watchers']) if (s[k] !== undefined && s[k] !== null) $(k).textContent = s[k]; }
+function connect(){
+  const ws = new WebSocket((location.protocol === 'https:' ? 'wss://' : 'ws://') + location.host + '/ws'
+                           + (token ? '?token=' + encodeURIComponent(token) : ''));
+  ws.onmessage = m => { const e = JSON.parse(m.data);
+    if (e.type === 'snapshot') { show(e.state);
+      $('pages').innerHTML = !e.control ? '<i>Nur Anzeige - Seitenwahl braucht ?token=...</i>' : Object.entries(e.pages).map(([id, n]) => `<button data-page="${id}">${id}: ${n}</button>`).join('');
+    } else { show(e); $('log').textContent = new Date(e.ts * 1000).toLocaleTimeString() + ' ' + JSON.stringify(e) + '\\n' + $('log').textContent.slice(0, 5000); } };
+  $('pages').onclick = ev => { const p = ev.target.dataset.page; if (p) ws.send(JSON.stringify({cmd: 'select_page', page: Number(p)})); };
+  ws.onclose = () => setTimeout(connect, 2000);
+}
+connect();
+</script></body></html>
+"""
+
+
+def is_loopback(host):
+    """Bindung nur an die lokale Schnittstelle?"""
+    if host in LOOPBACK_NAMES:
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _ws_frame(payload, opcode=0x1):
+    """Unmaskierter Server-Frame (RFC 6455)"""
+    header = bytes([0x80 | opcode])
+    length = len(payload)
+    if length < 126:
+        header += bytes([length])
+    elif length < 1 << 16:
+        header += bytes([126]) + struct.pack('!H', length)
+    else:
+        header += bytes([127]) + struct.pack('!Q', length)
+    return header + payload
+
+
+async def _ws_read_frame(reader):
+    """(opcode, payload) eines maskierten Client-Frames lesen"""
+    first, second = await reader.readexactly(2)
+    opcode = first & 0x0F
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack('!H', await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', await reader.readexactly(8))[0]
+    if length > MAX_WS_FRAME_BYTES:
+        raise ValueError("WebSocket-Frame zu groß")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+    return opcode, payload
+
+
+class StatusServer:
+    def __init__(self, port=8080, host='127.0.0.1', pages=None, on_page_select=None, metrics=None, token=None):
+        self.port = port
+        self.host = host
+        # Seitenwahl (POST, WebSocket) nur mit Token; außerhalb von localhost immer eines erzeugen
+        self.token = token or (None if is_loopback(host) else secrets.token_urlsafe(12))
+        # {Seite: Name} für Buttons und Validierung
+        self.pages = pages or {}
+        # on_page_select(page_id) muss thread-sicher sein (z.B. scheduler.call_soon)
+        self.on_page_select = on_page_select
+        # metrics() -> dict, wird im Server-Thread aufgerufen
+        self.metrics = metrics
+        self.state = {'signal': None, 'name': None, 'clients': None, 'connection': None}
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self.stats = {'http_requests': 0, 'ws_connections': 0, 'ws_peak': 0, 'events': 0,
+                      'events_dropped': 0, 'page_selects': 0, 'rejected': 0}
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._watchers = set()
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    # --- Thread-sichere API für die GUI ------------------------------------------
+
+    def update(self, **changes):
+        """Status ändern und an alle WebSocket-Clients pushen (aus beliebigem Thread)"""
+        now = time.time()
+        with self._lock:
+            self.state.update(changes)
+            if 'signal' in changes:
+                self.history.append({'signal': changes['signal'], 'name': changes.get('name'), 'ts': now})
+        self._broadcast(dict(changes, type='state', ts=now))
+
+    def _broadcast(self, event):
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(self._fanout, json.dumps(event, default=str))
+
+    def _fanout(self, data):
+        self.stats['events'] += 1
+        for queue in self._watchers:
+            if queue.full():
+                queue.get_nowait()
+                self.stats['events_dropped'] += 1
+            queue.put_nowait(data)
+
+    @property
+    def url(self):
+        """Adresse der Status-Seite (mit Token, falls Seitenwahl geschützt ist)"""
+        return f"http://{self.host}:{self.port}/" + (f"?token={self.token}" if self.token else "")
+
+    def snapshot(self):
+        with self._lock:
+            state = dict(self.state)
+        return dict(state, watchers=len(self._watchers), uptime_s=round(time.time() - self.started))
+
+    # --- Server-Lebenszyklus ----------------------------------------------------
+
+    def start(self):
+        """Server im eigenen Thread starten; wirft OSError falls der Port belegt ist"""
+        ready = threading.Event()
+        errors = []
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            try:
+                self._server = loop.run_until_complete(
+                    asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEADER_BYTES))
+            except OSError as e:
+                errors.append(e)
+                ready.set()
+                loop.close()
+                return
+            self._loop = loop
+            ready.set()
+            try:
+                loop.run_forever()
+            finally:
+                self._server.close()
+                loop.run_until_complete(self._server.wait_closed())
+                loop.close()
+
+        self._thread = threading.Thread(target=run, name='status-server', daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+
+    def stop(self):
+        loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    # --- HTTP --------------------------------------------------------------------
+
+    async def _handle(self, reader, writer):
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+            lines = head.decode('latin-1').split('\r\n')
+            method, path, _ = lines[0].split(' ', 2)
+            headers = {}
+            for line in lines[1:]:
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    headers[key.strip().lower()] = value.strip()
+            self.stats['http_requests'] += 1
+            path, _, query = path.partition('?')
+            if not self._host_allowed(headers):
+                await self._reject(writer, 'Unerwarteter Host')
+                return
+
+            if path == '/ws' and headers.get('upgrade', '').lower() == 'websocket':
+                if not self._same_origin(headers):
+                    await self._reject(writer, 'Fremde Origin')
+                    return
+                await self._websocket(reader, writer, headers, self._authorized(headers, query))
+                return
+
+            length = int(headers.get('content-length', 0))
+            if length > MAX_BODY_BYTES:
+                await self._respond(writer, 400, {'error': 'Body zu groß'})
+                return
+            body = await reader.readexactly(length) if length else b''
+            await self._route(writer, method, path, body, headers, query)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    # --- Zugriffsschutz -----------------------------------------------------------
+
+    def _host_allowed(self, headers):
+        """Ohne Token nur Host-Header von localhost - sonst könnte eine Webseite per DNS-Rebinding zugreifen"""
+        if self.token:
+            return True
+        host = urlsplit('//' + headers.get('host', '')).hostname
+        return host is None or host in LOOPBACK_NAMES
+
+    def _same_origin(self, headers):
+        """Browser schicken Origin mit - Seiten anderer Herkunft dürfen nichts auslösen (CSRF, WebSocket-Hijacking)"""
+        origin = headers.get('origin')
+        if not origin:
+            # Kein Browser (curl, Skripte)
+            return True
+        return urlsplit(origin).netloc.lower() == headers.get('host', '').lower()
+
+    def _authorized(self, headers, query):
+        if not self.token:
+            return True
+        supplied = headers.get(TOKEN_HEADER) or parse_qs(query).get('token', [''])[0]
+        return hmac.compare_digest(supplied.encode(), self.token.encode())
+
+    async def _reject(self, writer, reason):
+        self.stats['rejected'] += 1
+        await self._respond(writer, 403, {'error': reason})
+
+    async def _route(self, writer, method, path, body, headers, query):
+        if method == 'GET' and path == '/':
+            await self._respond(writer, 200, INDEX_HTML, 'text/html; charset=utf-8')
+        elif method == 'GET' and path == '/api/status':
+            await self._respond(writer, 200, self.snapshot())
+        elif method == 'GET' and path == '/api/history':
+            with self._lock:
+                history = list(self.history)
+            await self._respond(writer, 200, history)
+        elif method == 'GET' and path == '/metrics':
+            # Prometheus-Format der Metrik-Registry (nur mit --metrics-*)
+            if not metrics_registry.REGISTRY.enabled:
+                await self._respond(writer, 404, {'error': 'Metriken deaktiviert (--metrics-port/-file/-json)'})
+                return
+            await self._respond(writer, 200, metrics_registry.REGISTRY.prometheus_text(),
+                                'text/plain; version=0.0.4; charset=utf-8')
+        elif method == 'GET' and path == '/trace.json':
+            # Chrome-Trace der letzten Signale (nur mit --trace)
+            if not TRACER.enabled:
+                await self._respond(writer, 404, {'error': 'Tracing deaktiviert (--trace)'})
+                return
+            await self._respond(writer, 200, TRACER.chrome_trace())
+        elif method == 'GET' and path == '/api/metrics':
+            metrics = self.metrics() if self.metrics else {}
+            await self._respond(writer, 200, dict(metrics, server=dict(self.stats)))
+        elif path.startswith('/api/page/'):
+            if method != 'POST':
+                await self._respond(writer, 405, {'error': 'POST verwenden'})
+                return
+            if not self._same_origin(headers):
+                await self._reject(writer, 'Fremde Origin')
+                return
+            if not self._authorized(headers, query):
+                await self._reject(writer, 'Token fehlt oder falsch')
+                return
+            try:
+                page_id = int(path.rsplit('/', 1)[1])
+            except ValueError:
+                page_id = None
+            if self.select_page(page_id):
+                await self._respond(writer, 200, {'ok': True, 'page': page_id})
+            else:
+                await self._respond(writer, 400, {'error': f'Unbekannte Seite: {page_id}'})
+        else:
+            await self._respond(writer, 404, {'error': 'Nicht gefunden'})
+
+    async def _respond(self, writer, status, body, content_type='application/json'):
+        if not isinstance(body, str):
+            body = json.dumps(body, ensure_ascii=False, default=str)
+        data = body.encode('utf-8')
+        writer.write((f"HTTP/1.1 {status} {STATUS_TEXTS.get(status, '')}\r\n"
+                      f"Content-Type: {content_type}\r\n"
+                      f"Content-Length: {len(data)}\r\n"
+                      "Cache-Control: no-store\r\n"
+                      "Connection: close\r\n\r\n").encode('latin-1') + data)
+        await writer.drain()
+
+    def select_page(self, page_id):
+        """Seitenwahl von außen an die GUI weitergeben"""
+        if page_id not in self.pages or not self.on_page_select:
+            return False
+        self.stats['page_selects'] += 1
+        self.on_page_select(page_id)
+        return True
+
+    # --- WebSocket ---------------------------------------------------------------
+
+    async def _websocket(self, reader, writer, headers, control):
+        """control: Seitenwahl erlaubt (Token), sonst nur Anzeige"""
+        key = headers.get('sec-websocket-key')
+        if not key:
+            await self._respond(writer, 400, {'error': 'Sec-WebSocket-Key fehlt'})
+            return
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\n"
+                      "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode('latin-1'))
+
+        queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._watchers.add(queue)
+        self.stats['ws_connections'] += 1
+        self.stats['ws_peak'] = max(self.stats['ws_peak'], len(self._watchers))
+
+        snapshot = {'type': 'snapshot', 'state': self.snapshot(), 'pages': self.pages, 'control': control,
+                    'ts': time.time()}
+        writer.write(_ws_frame(json.dumps(snapshot, ensure_ascii=False).encode('utf-8')))
+        await writer.drain()
+
+        sender = asyncio.ensure_future(self._ws_sender(writer, queue))
+        try:
+            while True:
+                opcode, payload = await _ws_read_frame(reader)
+                if opcode == 0x8:
+                    writer.write(_ws_frame(b'', 0x8))
+                    break
+                if opcode == 0x9:
+                    writer.write(_ws_frame(payload, 0xA))
+                elif opcode == 0x1:
+                    if control:
+                        self._ws_command(payload)
+                    else:
+                        self.stats['rejected'] += 1
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            sender.cancel()
+            self._watchers.discard(queue)
+
+    async def _ws_sender(self, writer, queue):
+        try:
+            while True:
+                data = await queue.get()
+                writer.write(_ws_frame(data.encode('utf-8')))
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    def _ws_command(self, payload):
+        try:
+            command = json.loads(payload)
+        except ValueError:
+            return
+        if isinstance(command, dict) and command.get('cmd') == 'select_page':
+            self.select_page(command.get('page'))
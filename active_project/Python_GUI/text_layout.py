@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Text Layout
+Ein einziges Text-Widget für alle Textseiten: Texte werden je (Inhalt, Schrift, Breite)
+einmal umbrochen und vermessen, ein Seitenwechsel tauscht danach nur noch den Inhalt
+"""
+
+import re
+import tkinter as tk
+import tkinter.font as tkfont
+from collections import OrderedDict
+
+import metrics
+from page_content import page_text
+
+# Anzahl vorberechneter Layouts (Seiten x Breiten)
+LAYOUT_CACHE_SIZE = 40
+
+# Innen- und Außenabstand des Textbereichs (wie bisher im Widget-Renderer)
+TEXT_PADDING = 15
+
+# Zusätzlicher Abstand über/unter Überschriften (spacing1, spacing3)
+TAG_SPACING = {'h1': (10, 6), 'h2': (8, 4)}
+
+TOKENS = re.compile(r'\n| |[^ \n]+')
+
+CACHE_REQUESTS = {result: metrics.counter('bertrandt_cache_requests_total', 'Cache-Zugriffe nach Ergebnis',
+                                          cache='text_layout', result=result)
+                  for result in ('hit', 'wrapped')}
+
+
+class TextLayout:
+    """Umbrochener Text: Argumente für einen einzigen Text.insert-Aufruf plus Maße"""
+
+    def __init__(self, insert_args, lines, height):
+        self.insert_args = insert_args
+        self.lines = lines
+        self.height = height
+
+
+class TextLayoutCache:
+    """Layouts je (Inhalt, Schrift, Breite) - Wortbreiten werden je Schrift gemerkt"""
+
+    def __init__(self, widget, fonts):
+        self.widget = widget
+        body = fonts['label']
+        self.tag_fonts = {
+            'body': body,
+            'bold': (body[0], body[1], 'bold'),
+            'h1': fonts['title'],
+            'h2': (fonts['subtitle'][0], fonts['subtitle'][1], 'bold'),
+        }
+        self._fonts = {}
+        self._widths = {}
+        self._layouts = OrderedDict()
+        self.stats = {'layouts': 0, 'hits': 0}
+
+    def font_for(self, tags):
+        for tag in ('h1', 'h2', 'bold'):
+            if tag in tags:
+                return self.tag_fonts[tag]
+        return self.tag_fonts['body']
+
+    def font(self, font):
+        """tkfont.Font je Schrift-Tupel (nur einmal anlegen)"""
+        if font not in self._fonts:
+            self._fonts[font] = tkfont.Font(root=self.widget, font=font)
+        return self._fonts[font]
+
+    def measure(self, word, font):
+        key = (font, word)
+        width = self._widths.get(key)
+        if width is None:
+            width = self._widths[key] = self.font(font).measure(word)
+        return width
+
+    def get(self, runs, width):
+        """Layout für Abschnitte (Text, Tags) bei gegebener Breite - berechnet nur beim ersten Mal"""
+        key = (runs, self.tag_fonts['body'], width)
+        layout = self._layouts.get(key)
+        if layout:
+            self._layouts.move_to_end(key)
+            self.stats['hits'] += 1
+            CACHE_REQUESTS['hit'].inc()
+            return layout
+
+        layout = self._wrap(runs, width)
+        self._layouts[key] = layout
+        if len(self._layouts) > LAYOUT_CACHE_SIZE:
+            self._layouts.popitem(last=False)
+        self.stats['layouts'] += 1
+        CACHE_REQUESTS['wrapped'].inc()
+        return layout
+
+    def _wrap(self, runs, width):
+        """Wortweise umbrechen; Folgezeilen von Aufzählungen werden eingerückt"""
+        args = []
+        lines, height = 1, 0
+        x, indent, line_height = 0, 0, 0
+
+        def append(text, tags):
+            if args and args[-1] == tags:
+                args[-2] += text
+            else:
+                args.extend([text, tags])
+
+        for chunk, tags in runs:
+            font = self.font_for(tags)
+            above, below = next((TAG_SPACING[t] for t in tags if t in TAG_SPACING), (0, 0))
+            linespace = self.font(font).metrics('linespace') + above + below
+            for token in TOKENS.findall(chunk):
+                line_tags = tags + ('indent',) if indent else tags
+                if token == '\n':
+                    append(token, line_tags)
+                    height += line_height or linespace
+                    lines += 1
+                    x, indent, line_height = 0, 0, 0
+                    continue
+
+                token_width = self.measure(token, font)
+                if token != ' ' and x > indent and x + token_width > width:
+                    append('\n', line_tags)
+                    height += line_height
+                    lines += 1
+                    if 'bullet' in tags:
+                        indent = self.measure('• ', font)
+                    x, line_height = indent, 0
+                    line_tags = tags + ('indent',) if indent else tags
+
+                append(token, line_tags)
+                x += token_width
+                line_height = max(line_height, linespace)
+
+        height += line_height
+        return TextLayout(tuple(args), lines, height)
+
+
+class TextPageView:
+    """Wiederverwendetes Text-Widget samt Scrollbar für text_only, image_text und video_text"""
+
+    def __init__(self, parent, colors, fonts, scheduler):
+        self.scheduler = scheduler
+        self.frame = tk.Frame(parent, bg=colors['background_tertiary'])
+        self.text = tk.Text(self.frame,
+                            font=fonts['label'],
+                            bg=colors['background_secondary'],
+                            fg=colors['text_primary'],
+                            wrap='none',
+                            relief='flat',
+                            borderwidth=0,
+                            highlightthickness=0,
+                            padx=TEXT_PADDING,
+                            pady=TEXT_PADDING)
+        self.scrollbar = tk.Scrollbar(self.frame, orient='vertical', command=self.text.yview)
+        self.text.configure(yscrollcommand=self.scrollbar.set)
+        self.text.pack(side='left', fill='both', expand=True)
+
+        self.cache = TextLayoutCache(self.text, fonts)
+        self._configure_tags(colors)
+
+        self.slot = None
+        self.runs = None
+        self.shown = None   # (Abschnitte, Breite) des angezeigten Inhalts
+        self.sizes = {}     # Slot (Layout) -> (Breite, Höhe) des Textbereichs
+        self.stats = {'swaps': 0, 'skips': 0}
+        self.frame.bind('<Configure>', self._on_configure)
+
+    def _configure_tags(self, colors):
+        fonts = self.cache.tag_fonts
+        indent = self.cache.measure('• ', fonts['body'])
+        # Später angelegte Tags haben Vorrang: Überschrift schlägt fett
+        self.text.tag_configure('bold', font=fonts['bold'])
+        self.text.tag_configure('bullet', lmargin2=indent)
+        self.text.tag_configure('indent', lmargin1=indent)
+        self.text.tag_configure('h2', font=fonts['h2'], foreground=colors['accent_primary'],
+                                spacing1=TAG_SPACING['h2'][0], spacing3=TAG_SPACING['h2'][1])
+        self.text.tag_configure('h1', font=fonts['h1'], foreground=colors['bertrandt_blue'],
+                                spacing1=TAG_SPACING['h1'][0], spacing3=TAG_SPACING['h1'][1])
+
+    def show(self, container, config, slot):
+        """Text einer Seite im Container anzeigen - neu befüllt wird nur bei anderem Inhalt oder Breite"""
+        self.slot = slot
+        self.runs = page_text(config)
+        self.frame.pack(in_=container, fill='both', expand=True, padx=TEXT_PADDING, pady=TEXT_PADDING)
+        # Frame ist älter als der Container der Seite und läge sonst dahinter
+        self.frame.lift()
+        self.fill()
+
+    def hide(self):
+        self.frame.pack_forget()
+        self.slot = None
+
+    def fill(self):
+        if self.slot is None:
+            return
+        size = self.sizes.get(self.slot)
+        width = size[0] if size else None
+
+        if width is None:
+            # Breite noch unbekannt (erste Anzeige in diesem Layout) - Tk bricht selbst um,
+            # <Configure> liefert die Breite für alle weiteren Wechsel
+            insert_args = tuple(item for run in self.runs for item in run)
+            wrap, needs_scrollbar = 'word', True
+        else:
+            layout = self.cache.get(self.runs, width)
+            insert_args = layout.insert_args
+            wrap, needs_scrollbar = 'none', layout.height > size[1]
+
+        if self.shown == (self.runs, width):
+            self.stats['skips'] += 1
+        else:
+            self.text.config(state='normal', wrap=wrap)
+            self.text.delete('1.0', tk.END)
+            if insert_args:
+                self.text.insert('1.0', *insert_args)
+            self.text.config(state='disabled')  # Nur lesen
+            self.shown = (self.runs, width)
+            self.stats['swaps'] += 1
+
+        if needs_scrollbar and not self.scrollbar.winfo_manager():
+            self.scrollbar.pack(side='right', fill='y', before=self.text)
+        elif not needs_scrollbar and self.scrollbar.winfo_manager():
+            self.scrollbar.pack_forget()
+
+    def _on_configure(self, event):
+        if self.slot is None:
+            return
+        # Platz der Scrollbar immer freihalten - ihr Ein-/Ausblenden ändert so die Breite nicht
+        size = (event.width - self.scrollbar.winfo_reqwidth() - 2 * TEXT_PADDING,
+                event.height - 2 * TEXT_PADDING)
+        if size[0] > 0 and self.sizes.get(self.slot) != size:
+            self.sizes[self.slot] = size
+            self.scheduler.call_soon(self.fill, key='text_relayout', name='text_relayout')
+
+    def summary(self):
+        return dict(self.cache.stats, **self.stats)
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Theme
+Farben und Schriften - gemeinsam für Tk-GUI und Kiosk-Renderer
+"""
+
+# Modern Clean Design - Minimalistisch & Intuitiv (Inspired by Apple/Google/Notion)
+COLORS = {
+    'background_primary': '#FFFFFF',     # Haupthintergrund (sauberes Weiß)
+    'background_secondary': '#F8F9FA',   # Sekundär-Hintergrund (sehr helles Grau)
+    'background_tertiary': '#F1F3F4',    # Karten/Widgets (dezentes Grau)
+    'background_hover': '#E8F0FE',       # Hover-Zustand (sehr helles Blau)
+    'text_primary': '#202124',           # Haupt-Text (fast schwarz, aber weicher)
+    'text_secondary': '#5F6368',         # Sekundär-Text (mittleres Grau)
+    'text_tertiary': '#9AA0A6',          # Tertiär-Text (helles Grau)
+    'accent_primary': '#1A73E8',         # Google Blue (vertrauenswürdig)
+    'accent_secondary': '#34A853',       # Google Green (Erfolg)
+    'accent_tertiary': '#EA4335',        # Google Red (Warnung/Fehler)
+    'accent_warning': '#FBBC04',         # Google Yellow (Warnung)
+    'border_light': '#E8EAED',           # Helle Rahmen
+    'border_medium': '#DADCE0',          # Mittlere Rahmen
+    'shadow': 'rgba(60, 64, 67, 0.15)',  # Weiche Schatten
+    'bertrandt_blue': '#003366',         # Bertrandt Corporate Blue
+    'bertrandt_orange': '#FF6600',       # Bertrandt Corporate Orange
+}
+
+
+def make_fonts(window_width, window_height):
+    """Modern Typography - Clean & Readable (Cross-platform compatible)"""
+    base_size = min(window_width, window_height) // 60  # Responsive Basis
+    return {
+        'display': ('Helvetica Neue', max(32, base_size + 20), 'bold'),      # Große Headlines
+        'title': ('Helvetica Neue', max(24, base_size + 12), 'bold'),        # Titel (Bold)
+        'subtitle': ('Helvetica Neue', max(18, base_size + 6), 'normal'),    # Untertitel (Normal)
+        'body': ('Helvetica Neue', max(14, base_size + 2), 'normal'),        # Fließtext
+        'label': ('Helvetica Neue', max(13, base_size + 1), 'normal'),       # Labels (Normal)
+        'button': ('Helvetica Neue', max(14, base_size + 2), 'bold'),        # Buttons (Bold)
+        'caption': ('Helvetica Neue', max(12, base_size), 'normal'),         # Kleine Texte
+        'nav': ('Helvetica Neue', max(15, base_size + 3), 'normal'),         # Navigation (Normal)
+    }
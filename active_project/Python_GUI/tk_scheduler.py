@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Tk Scheduler
+Thread-Pool für blockierende Arbeit, ein gebündelter UI-Update-Pump und
+abbrechbare periodische Tasks - mit Messung von Queue-Tiefe, Latenz und UI-Zeit
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from log_setup import get_logger
+
+logger = get_logger('scheduler')
+
+
+def _task_name(fn, name=None):
+    return name or getattr(fn, '__qualname__', None) or repr(fn)
+
+
+class TaskStats:
+    def __init__(self):
+        self.count = 0
+        self.ui_total = 0.0
+        self.ui_max = 0.0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.coalesced = 0
+
+    def record(self, ui_time, latency):
+        self.count += 1
+        self.ui_total += ui_time
+        self.ui_max = max(self.ui_max, ui_time)
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def as_dict(self):
+        count = max(1, self.count)
+        return {
+            'count': self.count,
+            'ui_total_ms': round(self.ui_total * 1000, 2),
+            'ui_avg_ms': round(self.ui_total * 1000 / count, 3),
+            'ui_max_ms': round(self.ui_max * 1000, 2),
+            'latency_avg_ms': round(self.latency_total * 1000 / count, 2),
+            'latency_max_ms': round(self.latency_max * 1000, 2),
+            'coalesced': self.coalesced,
+        }
+
+
+class PeriodicTask:
+    """Über root.after geplanter (wiederholter) Task, jederzeit abbrechbar"""
+
+    def __init__(self, scheduler, interval_ms, fn, name, repeat=True):
+        self.scheduler = scheduler
+        self.interval_ms = interval_ms
+        self.fn = fn
+        self.name = name
+        self.repeat = repeat
+        self.cancelled = False
+        self._after_id = None
+        self._due = None
+
+    def start(self, delay_ms):
+        if self.cancelled:
+            return
+        self._due = time.perf_counter() + delay_ms / 1000
+        self._after_id = self.scheduler.root.after(delay_ms, self._run)
+
+    def _run(self):
+        self._after_id = None
+        if self.cancelled:
+            return
+        start = time.perf_counter()
+        try:
+            self.fn()
+        except Exception as e:
+            logger.warning("⚠️ Task '%s' fehlgeschlagen: %s", self.name, e)
+        finally:
+            # Latenz = Verspätung gegenüber dem geplanten Zeitpunkt
+            self.scheduler._record(self.name, time.perf_counter() - start, start - self._due)
+
+        if self.repeat and not self.cancelled:
+            self.start(self.interval_ms)
+
+    def cancel(self):
+        """Thread-sicher abbrechen"""
+        self.cancelled = True
+        if self._after_id is not None and self.scheduler.on_ui_thread():
+            self.scheduler.root.after_cancel(self._after_id)
+            self._after_id = None
+
+
+class TkScheduler:
+    def __init__(self, root, max_workers=4, pump_interval_ms=20):
+        self.root = root
+        self.pump_interval_ms = pump_interval_ms
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='bertrandt-worker')
+        self.running = True
+
+        self._ui_thread = threading.current_thread()
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._keys = itertools.count()
+        self._stats = {}
+        self._workers_busy = 0
+        self.max_queue_depth = 0
+        self.last_queue_depth = 0
+        self.pump_ui_max = 0.0
+
+        self._pump_id = self.root.after(self.pump_interval_ms, self._pump)
+
+    def on_ui_thread(self):
+        return threading.current_thread() is self._ui_thread
+
+    # --- UI-Updates ---------------------------------------------------------
+
+    def call_soon(self, fn, *args, key=None, name=None):
+        """Callback im GUI-Thread ausführen (thread-sicher).
+
+        Aufrufe mit gleichem key werden zusammengefasst - nur der letzte wird ausgeführt.
+        """
+        name = _task_name(fn, name or key)
+        with self._lock:
+            if key is None:
+                key = next(self._keys)
+            elif key in self._pending:
+                # Position und ursprünglichen Zeitpunkt behalten, Inhalt ersetzen
+                enqueued = self._pending[key][2]
+                self._pending[key] = (fn, args, enqueued, name)
+                self._stat(name).coalesced += 1
+                return
+            self._pending[key] = (fn, args, time.perf_counter(), name)
+
+    def _pump(self):
+        """Einziger UI-Update-Pump: alle anstehenden Callbacks gebündelt ausführen"""
+        # Vorab neu planen - modale Dialoge (messagebox) blockieren so keine späteren Updates
+        if self.running:
+            self._pump_id = self.root.after(self.pump_interval_ms, self._pump)
+
+        with self._lock:
+            batch = list(self._pending.values())
+            self._pending.clear()
+
+        depth = len(batch)
+        self.last_queue_depth = depth
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+
+        pump_start = time.perf_counter()
+        for fn, args, enqueued, name in batch:
+            start = time.perf_counter()
+            try:
+                fn(*args)
+            except Exception as e:
+                logger.warning("⚠️ UI-Callback '%s' fehlgeschlagen: %s", name, e)
+            self._record(name, time.perf_counter() - start, start - enqueued)
+        if batch:
+            self.pump_ui_max = max(self.pump_ui_max, time.perf_counter() - pump_start)
+
+    # --- Periodische Tasks ----------------------------------------------------
+
+    def every(self, interval_ms, fn, name=None, initial_delay_ms=None):
+        """Periodischen Task starten; gibt ein abbrechbares PeriodicTask zurück"""
+        task = PeriodicTask(self, interval_ms, fn, _task_name(fn, name))
+        delay = interval_ms if initial_delay_ms is None else initial_delay_ms
+        self._start_task(task, delay)
+        return task
+
+    def after(self, delay_ms, fn, name=None):
+        """Einmaligen, abbrechbaren Task planen"""
+        task = PeriodicTask(self, delay_ms, fn, _task_name(fn, name), repeat=False)
+        self._start_task(task, delay_ms)
+        return task
+
+    def _start_task(self, task, delay_ms):
+        if self.on_ui_thread():
+            task.start(delay_ms)
+        else:
+            # root.after nur aus dem GUI-Thread aufrufen
+            self.call_soon(task.start, delay_ms, name=task.name)
+
+    # --- Blockierende Arbeit ---------------------------------------------------
+
+    def submit(self, fn, *args, name=None, on_done=None, on_error=None):
+        """fn im Thread-Pool ausführen; on_done/on_error laufen im GUI-Thread"""
+        name = _task_name(fn, name)
+        enqueued = time.perf_counter()
+
+        def run():
+            start = time.perf_counter()
+            with self._lock:
+                self._workers_busy += 1
+            try:
+                result = fn(*args)
+            except Exception as e:
+                if on_error:
+                    self.call_soon(on_error, e, name=f"{name}.on_error")
+                else:
+                    logger.warning("⚠️ Worker '%s' fehlgeschlagen: %s", name, e)
+                return None
+            finally:
+                with self._lock:
+                    self._workers_busy -= 1
+                    # Worker-Zeit zählt nicht als UI-Zeit - separat unter "worker:" ablegen
+                    self._stat(f"worker:{name}").record(time.perf_counter() - start, start - enqueued)
+            if on_done:
+                self.call_soon(on_done, result, name=f"{name}.on_done")
+            return result
+
+        return self.pool.submit(run)
+
+    # --- Instrumentierung -----------------------------------------------------
+
+    def _stat(self, name):
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = TaskStats()
+        return stats
+
+    def _record(self, name, ui_time, latency):
+        with self._lock:
+            self._stat(name).record(ui_time, max(0.0, latency))
+
+    def stats(self):
+        """Momentaufnahme aller Messwerte"""
+        with self._lock:
+            tasks = {name: stats.as_dict() for name, stats in self._stats.items()}
+            pending = len(self._pending)
+            busy = self._workers_busy
+        return {
+            'queue_depth': pending,
+            'last_pump_depth': self.last_queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'pump_ui_max_ms': round(self.pump_ui_max * 1000, 2),
+            'workers_busy': busy,
+            'tasks': tasks,
+        }
+
+    def format_stats(self):
+        """Messwerte als Text - sortiert nach UI-Zeit (was kostet Frame-Zeit?)"""
+        stats = self.stats()
+        lines = [
+            f"UI-Queue: {stats['queue_depth']} (max {stats['max_queue_depth']}), "
+            f"längster Pump: {stats['pump_ui_max_ms']} ms, Worker aktiv: {stats['workers_busy']}",
+            "",
+            f"{'Task':<40} {'Anz.':>6} {'UI ges.':>9} {'UI max':>8} {'Lat. Ø':>8} {'Lat. max':>9} {'Gebündelt':>9}",
+        ]
+        ordered = sorted(stats['tasks'].items(), key=lambda item: item[1]['ui_total_ms'], reverse=True)
+        for name, task in ordered:
+            lines.append(f"{name[:40]:<40} {task['count']:>6} {task['ui_total_ms']:>9} "
+                         f"{task['ui_max_ms']:>8} {task['latency_avg_ms']:>8} {task['latency_max_ms']:>9} "
+                         f"{task['coalesced']:>9}")
+        return "\n".join(lines)
+
+    def shutdown(self):
+        self.running = False
+        if self._pump_id is not None:
+            try:
+                self.root.after_cancel(self._pump_id)
+            except Exception:
+                pass
+        self.pool.shutdown(wait=False)
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Bertrandt Tracing
+Spans je Signal vom Serial-Eingang bis zum gezeichneten Frame. Jedes Event bekommt eine
+Trace-ID; Spans landen in einem Ringpuffer und lassen sich als Chrome-Trace-JSON exportieren
+(https://ui.perfetto.dev oder chrome://tracing). Ausgeschaltet (Standard) kostet ein Span nur
+eine Flag-Abfrage.
+"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Spans im Ringpuffer (ältere fallen heraus)
+TRACE_BUFFER_SIZE = 20000
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, tracer, name, trace_id, args):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.trace_id, self.start, **self.args)
+        return False
+
+
+class _Activation:
+    """Trace-ID für den aktuellen Thread setzen - verschachtelte Spans übernehmen sie"""
+
+    def __init__(self, local, trace_id):
+        self.local = local
+        self.trace_id = trace_id
+
+    def __enter__(self):
+        self.previous = getattr(self.local, 'trace_id', None)
+        self.local.trace_id = self.trace_id
+        return self.trace_id
+
+    def __exit__(self, *exc):
+        self.local.trace_id = self.previous
+        return False
+
+
+class Tracer:
+    """Trace-IDs vergeben und Spans (Name, Trace, Thread, Start, Ende) sammeln"""
+
+    def __init__(self, capacity=TRACE_BUFFER_SIZE, enabled=False):
+        self.enabled = enabled
+        self._spans = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._epoch = time.perf_counter()
+        self._wall_epoch = time.time()
+
+    def enable(self, capacity=None):
+        """Aufzeichnung einschalten (optional mit neuer Puffergröße)"""
+        if capacity and capacity != self._spans.maxlen:
+            self._spans = deque(self._spans, maxlen=capacity)
+        self.enabled = True
+
+    def new_trace(self):
+        """Neue Trace-ID (None, solange Tracing aus ist)"""
+        return next(self._ids) if self.enabled else None
+
+    @property
+    def current(self):
+        return getattr(self._local, 'trace_id', None)
+
+    def activate(self, trace_id):
+        """with tracer.activate(trace_id): ... - Spans ohne explizite ID gehören zu diesem Trace"""
+        return _Activation(self._local, trace_id)
+
+    def span(self, name, trace_id=None, **args):
+        """with tracer.span('stufe'): ... - nur aufgezeichnet, wenn ein Trace aktiv ist"""
+        if not self.enabled:
+            return NULL_SPAN
+        trace_id = trace_id or self.current
+        if trace_id is None:
+            return NULL_SPAN
+        return _Span(self, name, trace_id, args)
+
+    def record(self, name, trace_id, start, end=None, **args):
+        """Span mit perf_counter()-Zeiten eintragen (end=None: jetzt)"""
+        if not (self.enabled and trace_id):
+            return
+        if end is None:
+            end = time.perf_counter()
+        thread = threading.current_thread()
+        # deque.append ist threadsicher - kein Lock im Hot Path
+        self._spans.append((name, trace_id, thread.ident, thread.name, start, end, args))
+
+    def enqueue(self, trace_id):
+        """Metadaten für die Übergabe an eine Queue (Trace-ID + Einreihzeit)"""
+        return (trace_id, time.perf_counter()) if trace_id else None
+
+    def dequeue(self, meta, name='data_queue'):
+        """Wartezeit in der Queue als Span eintragen; gibt die Trace-ID zurück"""
+        if not meta:
+            return None
+        trace_id, queued = meta
+        self.record(name, trace_id, queued)
+        return trace_id
+
+    def spans(self):
+        return list(self._spans)
+
+    def clear(self):
+        self._spans.clear()
+
+    def summary(self):
+        """Dauer je Stufe: Anzahl, Ø und max in ms"""
+        stages = {}
+        for name, _, _, _, start, end, _ in self.spans():
+            stage = stages.setdefault(name, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            duration = (end - start) * 1000
+            stage['count'] += 1
+            stage['total_ms'] += duration
+            stage['max_ms'] = max(stage['max_ms'], duration)
+        return {name: {'count': s['count'], 'avg_ms': round(s['total_ms'] / s['count'], 2),
+                       'max_ms': round(s['max_ms'], 2)}
+                for name, s in stages.items()}
+
+    def chrome_trace(self):
+        """Trace Event Format: ein 'X'-Event je Span, Flow-Pfeile verbinden die Stufen eines Traces"""
+        pid = os.getpid()
+        events = []
+        threads = {}
+        traces = {}
+        for name, trace_id, tid, thread_name, start, end, args in self.spans():
+            threads[tid] = thread_name
+            ts = (start - self._epoch) * 1_000_000
+            events.append({'name': name, 'cat': 'signal', 'ph': 'X', 'pid': pid, 'tid': tid,
+                           'ts': round(ts, 1), 'dur': round((end - start) * 1_000_000, 1),
+                           'args': dict(args, trace_id=trace_id)})
+            traces.setdefault(trace_id, []).append((ts, tid))
+
+        for trace_id, points in traces.items():
+            if len(points) < 2:
+                continue
+            points.sort()
+            for index, (ts, tid) in enumerate(points):
+                phase = 's' if index == 0 else ('f' if index == len(points) - 1 else 't')
+                flow = {'name': 'signal', 'cat': 'signal', 'ph': phase, 'id': trace_id,
+                        'pid': pid, 'tid': tid, 'ts': round(ts, 1)}
+                if phase == 'f':
+                    flow['bp'] = 'e'
+                events.append(flow)
+
+        for tid, thread_name in threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                           'args': {'name': thread_name}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms',
+                'otherData': {'epoch': self._wall_epoch}}
+
+    def export(self, path):
+        """Chrome-Trace als Datei schreiben (atomar ersetzt)"""
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+        os.replace(temp_path, path)
+        return len(self._spans)
+
+
+# Prozessweiter Tracer - eingeschaltet mit --trace
+TRACER = Tracer()
+
+
+def add_arguments(parser):
+    """Kommandozeilen-Optionen für die GUI"""
+    group = parser.add_argument_group('Tracing')
+    group.add_argument('--trace', default=None, metavar='DATEI',
+                       help='Spans je Signal aufzeichnen und beim Beenden als Chrome-Trace-JSON schreiben')
+    group.add_argument('--trace-buffer', type=int, default=TRACE_BUFFER_SIZE,
+                       help='Anzahl Spans im Ringpuffer')
+
+
+def start_from_args(args, tracer=TRACER):
+    """Tracing einschalten, falls --trace gesetzt ist"""
+    if not args.trace:
+        return None
+    tracer.enable(args.trace_buffer)
+    return tracer
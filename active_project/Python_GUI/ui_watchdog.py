@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Bertrandt UI Watchdog
+Erkennt Hänger im Tk-Event-Loop und zeichnet den Stack des GUI-Threads auf
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+from log_setup import get_logger
+
+DEFAULT_LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "ui_stalls.jsonl")
+
+# Histogramm-Grenzen für Stall-Dauern (ms)
+STALL_BUCKETS_MS = [250, 500, 1000, 2000, 5000, 10000]
+
+# Maximal aufgezeichnete Stack-Samples pro Stall
+MAX_SAMPLES = 5
+
+logger = get_logger('watchdog')
+
+
+def bucket_label(duration_ms):
+    """Histogramm-Bucket für eine Stall-Dauer"""
+    for limit in STALL_BUCKETS_MS:
+        if duration_ms < limit:
+            return f"< {limit} ms"
+    return f">= {STALL_BUCKETS_MS[-1]} ms"
+
+
+def build_histogram(stalls):
+    histogram = {bucket_label(limit - 1): 0 for limit in STALL_BUCKETS_MS}
+    histogram[bucket_label(STALL_BUCKETS_MS[-1])] = 0
+    for stall in stalls:
+        histogram[bucket_label(stall['duration_ms'])] += 1
+    return histogram
+
+
+def load_stall_log(path=DEFAULT_LOG_PATH):
+    """Stall-Events aus dem JSON-Lines Log lesen"""
+    stalls = []
+    if not os.path.exists(path):
+        return stalls
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                stalls.append(json.loads(line))
+            except ValueError:
+                continue
+    return stalls
+
+
+def format_stall_report(stalls, last=5):
+    """Histogramm und die letzten Stalls (mit Stack) als Text"""
+    if not stalls:
+        return "Keine UI-Stalls aufgezeichnet 🎉"
+
+    longest = max(stall['duration_ms'] for stall in stalls)
+    lines = [f"UI-Stalls: {len(stalls)}, längster: {longest:.0f} ms", "", "Dauer-Histogramm:"]
+    histogram = build_histogram(stalls)
+    peak = max(histogram.values()) or 1
+    for label, count in histogram.items():
+        bar = "█" * int(30 * count / peak)
+        lines.append(f"  {label:>12}  {count:>5}  {bar}")
+
+    lines.append("")
+    lines.append(f"Letzte {min(last, len(stalls))} Stalls:")
+    for stall in stalls[-last:]:
+        lines.append(f"--- {stall['started']} - {stall['duration_ms']:.0f} ms")
+        # Innerster Frame des ersten Samples zeigt meist den Verursacher
+        for frame_line in stall['samples'][0][-6:] if stall['samples'] else []:
+            lines.append("    " + frame_line.rstrip().replace("\n", "\n    "))
+    return "\n".join(lines)
+
+
+class UIWatchdog:
+    def __init__(self, scheduler, threshold_ms=250, heartbeat_ms=50, log_path=DEFAULT_LOG_PATH):
+        self.scheduler = scheduler
+        self.threshold = threshold_ms / 1000
+        self.heartbeat = heartbeat_ms / 1000
+        self.log_path = log_path
+        self.stalls = deque(maxlen=500)
+        self.running = False
+
+        # Muss im GUI-Thread erzeugt werden - dessen Stack wird bei Stalls gelesen
+        self.ui_thread_id = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self._heartbeat_task = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.last_beat = time.monotonic()
+        self._heartbeat_task = self.scheduler.every(int(self.heartbeat * 1000), self._beat,
+                                                    name='watchdog_heartbeat')
+        self._thread = threading.Thread(target=self._watch, name='ui-watchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.running = False
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+
+    def _beat(self):
+        self.last_beat = time.monotonic()
+
+    def _capture_stack(self):
+        frame = sys._current_frames().get(self.ui_thread_id)
+        return traceback.format_stack(frame) if frame else []
+
+    def _watch(self):
+        """Watchdog-Thread: Heartbeat-Verzögerung messen und Stalls erfassen"""
+        stall = None
+        stall_beat = None
+        next_sample = 0
+
+        while self.running:
+            time.sleep(self.heartbeat / 2)
+            now = time.monotonic()
+            beat = self.last_beat
+            lag = now - beat - self.heartbeat
+
+            if stall is None:
+                if lag > self.threshold:
+                    stall = {
+                        'started': datetime.fromtimestamp(time.time() - lag).isoformat(timespec='milliseconds'),
+                        'samples': [self._capture_stack()],
+                    }
+                    stall_beat = beat
+                    next_sample = now + self.threshold
+            elif beat != stall_beat:
+                # Heartbeat ist wieder da - Stall abschließen
+                stall['duration_ms'] = round((beat - stall_beat - self.heartbeat) * 1000, 1)
+                self._record(stall)
+                stall = None
+            elif now >= next_sample and len(stall['samples']) < MAX_SAMPLES:
+                # Lange Hänger: weitere Samples zeigen, wo die Zeit verbracht wird
+                stack = self._capture_stack()
+                if stack != stall['samples'][-1]:
+                    stall['samples'].append(stack)
+                next_sample = now + self.threshold
+
+    def _record(self, stall):
+        with self._lock:
+            self.stalls.append(stall)
+        culprit = stall['samples'][0][-1].strip().splitlines()[0] if stall['samples'] and stall['samples'][0] else "?"
+        logger.warning("🐢 UI-Stall: %.0f ms (%s)", stall['duration_ms'], culprit)
+
+        if self.log_path:
+            try:
+                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(stall, ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.warning("⚠️ Stall-Log konnte nicht geschrieben werden: %s", e)
+
+    def recent_stalls(self):
+        with self._lock:
+            return list(self.stalls)
+
+    def histogram(self):
+        return build_histogram(self.recent_stalls())
+
+    def report(self):
+        return format_stall_report(self.recent_stalls())
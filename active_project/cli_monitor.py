@@ -4,20 +4,37 @@
 Kommandozeilen-Version für Headless-Systeme
 """
 
-import serial
 import time
-import subprocess
 import sys
+import os
 import argparse
+import signal
 import threading
-from datetime import datetime
+
+# Gemeinsame Module aus dem GUI-Ordner
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "Python_GUI"))
+
+# Nur was jede Aktion braucht - Broker, Flash, Geräte-Scan, Profiler und Stall-Log erst in ihrer Aktion
+import client_series
+import log_setup
+import metrics
+from signal_protocol import parse_line, is_valid_signal
+from input_map import PRESS, InputMap
+from link_stats import NEW, LinkStats
 
 class BertrandtCLI:
     def __init__(self, esp32_port="/dev/ttyUSB0"):
+        # Farben, Zeitstempel und Datei schreibt der Log-Thread (log_setup)
+        self.log = log_setup.level_logger('cli')
+        self.flash_log = log_setup.get_logger('flash')
         self.esp32_port = esp32_port
         self.serial_connection = None
         self.running = False
         self.signal_count = 0
+        self.link_stats = None
+        self.input_map = InputMap()
+        self.client_heartbeat = client_series.HEARTBEAT_SECONDS
         
         # Signal-Mapping
         self.signal_names = {
@@ -33,49 +50,25 @@ class BertrandtCLI:
             10: "System Reset 🔄"
         }
     
-    def log(self, message, level="INFO"):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        colors = {
-            "INFO": "\033[0;34m",
-            "SUCCESS": "\033[0;32m", 
-            "WARNING": "\033[1;33m",
-            "ERROR": "\033[0;31m"
-        }
-        color = colors.get(level, "\033[0m")
-        print(f"{color}[{timestamp}] {message}\033[0m")
-    
     def check_arduino_cli(self):
         """Prüft ob Arduino CLI verfügbar ist"""
-        try:
-            result = subprocess.run(["arduino-cli", "version"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                self.log("Arduino CLI gefunden", "SUCCESS")
-                return True
-        except FileNotFoundError:
-            pass
+        from flash_runner import arduino_cli_available
+        
+        if arduino_cli_available():
+            self.log("Arduino CLI gefunden", "SUCCESS")
+            return True
         
         self.log("Arduino CLI nicht gefunden - installiere...", "WARNING")
         return self.install_arduino_cli()
     
     def install_arduino_cli(self):
         """Installiert Arduino CLI"""
+        import subprocess
+        from flash_runner import install_arduino_cli
+        
         try:
-            self.log("Lade Arduino CLI herunter...", "INFO")
-            subprocess.run([
-                "curl", "-fsSL", 
-                "https://raw.githubusercontent.com/arduino/arduino-cli/master/install.sh"
-            ], stdout=subprocess.PIPE, check=True)
-            
-            subprocess.run(["sh", "-c", 
-                "curl -fsSL https://raw.githubusercontent.com/arduino/arduino-cli/master/install.sh | sh"],
-                check=True)
-            
-            # Cores installieren
-            self.log("Installiere Arduino Cores...", "INFO")
-            subprocess.run(["arduino-cli", "core", "update-index"], check=True)
-            subprocess.run(["arduino-cli", "core", "install", "esp32:esp32"], check=True)
-            subprocess.run(["arduino-cli", "core", "install", "arduino:mbed_giga"], check=True)
+            self.log("Lade Arduino CLI herunter und installiere Cores...", "INFO")
+            install_arduino_cli()
             
             self.log("Arduino CLI erfolgreich installiert", "SUCCESS")
             return True
@@ -85,55 +78,62 @@ class BertrandtCLI:
             return False
     
     def scan_ports(self):
-        """Scannt verfügbare Ports"""
-        import glob
-        ports = []
+        """Scannt verfügbare Ports (mit Board-Erkennung über USB VID/PID)"""
+        from device_registry import DeviceRegistry
         
-        # Linux/Mac Ports
-        for pattern in ["/dev/ttyUSB*", "/dev/ttyACM*", "/dev/cu.usbserial*", "/dev/cu.usbmodem*"]:
-            ports.extend(glob.glob(pattern))
+        devices = DeviceRegistry().devices()
         
-        if ports:
-            self.log(f"Gefundene Ports: {', '.join(ports)}", "SUCCESS")
+        if devices:
+            for info in devices:
+                kind = info['kind'] or "Unbekannt"
+                self.log(f"Gefunden: {info['port']} - {kind} ({info['vid']}:{info['pid']}, "
+                         f"SN {info['serial_number'] or '-'})", "SUCCESS")
         else:
             self.log("Keine Ports gefunden", "WARNING")
         
-        return ports
+        return [info['port'] for info in devices]
+    
+    def sketch_path(self, kind):
+        """Sketch-Ordner eines Board-Typs (unabhängig vom Arbeitsverzeichnis)"""
+        from flash_runner import BOARDS
+        
+        return os.path.join(SCRIPT_DIR, "Arduino", BOARDS[kind]['sketch'])
+    
+    def run_streaming(self, cmd):
+        """arduino-cli ausführen und Ausgabe live durchreichen"""
+        from flash_runner import FlashProcess
+        
+        process = FlashProcess(cmd, on_line=lambda line: self.flash_log.info("   %s", line))
+        process.run()
+        return process
     
     def flash_esp32(self, port="/dev/ttyUSB0"):
         """Flasht ESP32"""
+        from flash_runner import compile_command, upload_command
+        
         self.log("🔥 Flashe ESP32...", "INFO")
         self.log("⚠️  WICHTIG: Boot-Button am ESP32 gedrückt halten wenn 'Connecting...' erscheint!", "WARNING")
         
         try:
             # Kompilieren
             self.log("Kompiliere ESP32 Code...", "INFO")
-            result = subprocess.run([
-                "arduino-cli", "compile", 
-                "--fqbn", "esp32:esp32:esp32",
-                "Arduino/ESP32_UDP_Receiver/"
-            ], capture_output=True, text=True)
+            result = self.run_streaming(compile_command("ESP32", self.sketch_path("ESP32")))
             
             if result.returncode != 0:
-                self.log(f"Kompilier-Fehler: {result.stderr}", "ERROR")
+                self.log(f"Kompilier-Fehler (Exit-Code {result.returncode})", "ERROR")
                 return False
             
             # Upload
             self.log(f"Lade auf Port {port} hoch...", "INFO")
             self.log("🔴 JETZT Boot-Button drücken und halten!", "WARNING")
             
-            result = subprocess.run([
-                "arduino-cli", "upload",
-                "-p", port,
-                "--fqbn", "esp32:esp32:esp32",
-                "Arduino/ESP32_UDP_Receiver/"
-            ], capture_output=True, text=True)
+            result = self.run_streaming(upload_command("ESP32", port, self.sketch_path("ESP32")))
             
             if result.returncode == 0:
                 self.log("ESP32 erfolgreich geflasht! 🎉", "SUCCESS")
                 return True
             else:
-                self.log(f"Upload-Fehler: {result.stderr}", "ERROR")
+                self.log(f"Upload-Fehler (Exit-Code {result.returncode})", "ERROR")
                 return False
                 
         except Exception as e:
@@ -142,44 +142,79 @@ class BertrandtCLI:
     
     def flash_giga(self, port="/dev/ttyACM0"):
         """Flasht Arduino GIGA"""
+        from flash_runner import compile_command, upload_command
+        
         self.log("🔥 Flashe Arduino GIGA...", "INFO")
         
         try:
             # Kompilieren
             self.log("Kompiliere GIGA Code...", "INFO")
-            result = subprocess.run([
-                "arduino-cli", "compile",
-                "--fqbn", "arduino:mbed_giga:giga", 
-                "Arduino/GIGA_UDP_Sender/"
-            ], capture_output=True, text=True)
+            result = self.run_streaming(compile_command("GIGA", self.sketch_path("GIGA")))
             
             if result.returncode != 0:
-                self.log(f"Kompilier-Fehler: {result.stderr}", "ERROR")
+                self.log(f"Kompilier-Fehler (Exit-Code {result.returncode})", "ERROR")
                 return False
             
             # Upload
             self.log(f"Lade auf Port {port} hoch...", "INFO")
-            result = subprocess.run([
-                "arduino-cli", "upload",
-                "-p", port,
-                "--fqbn", "arduino:mbed_giga:giga",
-                "Arduino/GIGA_UDP_Sender/"
-            ], capture_output=True, text=True)
+            result = self.run_streaming(upload_command("GIGA", port, self.sketch_path("GIGA")))
             
             if result.returncode == 0:
                 self.log("Arduino GIGA erfolgreich geflasht! 🎉", "SUCCESS")
                 return True
             else:
-                self.log(f"Upload-Fehler: {result.stderr}", "ERROR")
+                self.log(f"Upload-Fehler (Exit-Code {result.returncode})", "ERROR")
                 return False
                 
         except Exception as e:
             self.log(f"Fehler beim GIGA Flash: {e}", "ERROR")
             return False
     
+    def provision_fleet(self, max_workers=4, report_path=None, smoke_timeout=15):
+        """Alle angeschlossenen Kits flashen, prüfen und Report schreiben"""
+        from fleet_provisioning import FleetProvisioner
+        
+        self.log("🏭 Starte Fleet-Provisionierung...", "INFO")
+        provisioner = FleetProvisioner(os.path.join(SCRIPT_DIR, "Arduino"),
+                                       max_workers=max_workers,
+                                       smoke_timeout=smoke_timeout,
+                                       log=self.log)
+        results = provisioner.run()
+        if results:
+            provisioner.write_report(results, report_path)
+        return results and all(r['flashed'] and r['smoke_test'] for r in results)
+    
+    def show_stalls(self, log_path=None, last=5):
+        """Vom GUI-Watchdog aufgezeichnete UI-Hänger auswerten"""
+        from ui_watchdog import DEFAULT_LOG_PATH, format_stall_report, load_stall_log
+        
+        log_path = log_path or DEFAULT_LOG_PATH
+        stalls = load_stall_log(log_path)
+        self.log(f"🐢 Stall-Log: {log_path}", "INFO")
+        print(format_stall_report(stalls, last))
+    
+    def toggle_gui_profiler(self, pid=None):
+        """Sampling-Profiler der laufenden GUI per SIGUSR1 ein- bzw. ausschalten"""
+        import sampling_profiler
+        
+        pid = pid or sampling_profiler.find_process()
+        if not pid:
+            self.log("Keine laufende Bertrandt GUI gefunden (--pid angeben)", "ERROR")
+            return False
+        try:
+            os.kill(pid, signal.SIGUSR1)
+        except OSError as e:
+            self.log(f"SIGUSR1 an PID {pid} fehlgeschlagen: {e}", "ERROR")
+            return False
+        self.log(f"🔥 Profiler der GUI (PID {pid}) umgeschaltet - beim Stoppen landet das Profil "
+                 f"in {sampling_profiler.DEFAULT_OUTPUT_DIR}", "SUCCESS")
+        return True
+    
     def connect_serial(self):
         """Verbindet mit ESP32 Serial"""
         try:
+            import serial
+            
             self.serial_connection = serial.Serial(
                 self.esp32_port, 
                 115200, 
@@ -191,6 +226,79 @@ class BertrandtCLI:
             self.log(f"Serial-Verbindung fehlgeschlagen: {e}", "ERROR")
             return False
     
+    def log_event(self, event, suffix=""):
+        """Geparstes Event (Serial oder Broker) ausgeben"""
+        if event['type'] == 'signal':
+            signal_num = event['value']
+            if is_valid_signal(signal_num):
+                self.signal_count += 1
+                signal_name = self.signal_names.get(signal_num, f"Signal {signal_num}")
+                self.log(f"📡 Signal {signal_num}: {signal_name} (#{self.signal_count}){suffix}", "SUCCESS")
+            else:
+                self.log(f"⚠️  Unbekanntes Signal: {signal_num}", "WARNING")
+        elif event['type'] == 'clients':
+            # Heartbeat = unveränderte Anzahl, nur als Lebenszeichen des ESP32
+            heartbeat = " [Heartbeat]" if event.get('hb') else ""
+            self.log(f"📶 Clients: {event['value']}{heartbeat}{suffix}", "DEBUG" if heartbeat else "INFO")
+        elif event['type'] == 'invalid':
+            self.log(f"⚠️  Ungültiges Signal-Format: {event['text']}", "WARNING")
+        else:
+            self.log(f"📝 ESP32: {event['text']}", "INFO")
+    
+    def run_broker(self, socket_path=None, udp_port=None, input_map=None):
+        """Broker: ESP32 (und optional UDP) lesen und an alle Anzeigen verteilen"""
+        from signal_broker import DEFAULT_SOCKET_PATH, SignalBroker
+        
+        broker = SignalBroker(socket_path or DEFAULT_SOCKET_PATH, log=self.log, input_map=input_map)
+        broker.start()
+        try:
+            broker.attach_serial(self.esp32_port)
+        except Exception as e:
+            self.log(f"Serial-Eingang nicht verfügbar: {e}", "WARNING")
+        if udp_port:
+            broker.attach_udp(udp_port)
+        
+        self.log("Drücke Ctrl+C zum Beenden", "INFO")
+        try:
+            while True:
+                time.sleep(10)
+                summary = broker.summary()
+                publish = summary['publish']
+                self.log(f"📊 {summary['published']} Events an {summary['clients']} Anzeigen, "
+                         f"Verteilzeit Ø {publish['avg_ms']} ms / max {publish['max_ms']} ms", "INFO")
+                for name, link in broker.link_stats.items():
+                    if link.active:
+                        self.log(f"📶 {name}: {link.format_stats()}", "INFO")
+        except KeyboardInterrupt:
+            self.log("Broker beendet", "INFO")
+        finally:
+            broker.stop()
+    
+    def listen_broker(self, socket_path=None):
+        """Als Anzeige am Broker lauschen und die Verteil-Latenz ausgeben"""
+        from signal_broker import DEFAULT_SOCKET_PATH, BrokerClient
+        
+        def on_event(event):
+            if event.get('replay'):
+                self.log_event(event, " [Stand beim Verbinden]")
+                return
+            latency = (time.time() - event['t_rx']) * 1000
+            self.log_event(event, f" [seq {event['seq']}, {latency:.2f} ms]")
+        
+        client = BrokerClient(socket_path or DEFAULT_SOCKET_PATH, on_event=on_event,
+                              on_status=lambda ok: self.log("Mit Broker verbunden" if ok else "Broker getrennt",
+                                                            "SUCCESS" if ok else "WARNING"))
+        client.start()
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            summary = client.summary()
+            self.log(f"Latenz: Ø {summary['avg_ms']} ms, p95 {summary['p95_ms']} ms, max {summary['max_ms']} ms, "
+                     f"{summary['lost']} Events verloren", "INFO")
+        finally:
+            client.stop()
+    
     def monitor_signals(self):
         """Überwacht eingehende Signale"""
         self.log("🔍 Starte Signal-Monitoring...", "INFO")
@@ -200,30 +308,46 @@ class BertrandtCLI:
             return
         
         self.running = True
+        self.link_stats = LinkStats('serial')
+        clients = client_series.ClientSeries(heartbeat_seconds=self.client_heartbeat)
+        stale = False
         
         try:
             while self.running:
-                if self.serial_connection.in_waiting > 0:
-                    line = self.serial_connection.readline().decode('utf-8').strip()
-                    
-                    if line.startswith("SIGNAL:"):
-                        try:
-                            signal_num = int(line.split(":")[1])
-                            if 1 <= signal_num <= 10:
-                                self.signal_count += 1
-                                signal_name = self.signal_names.get(signal_num, f"Signal {signal_num}")
-                                self.log(f"📡 Signal {signal_num}: {signal_name} (#{self.signal_count})", "SUCCESS")
-                            else:
-                                self.log(f"⚠️  Unbekanntes Signal: {signal_num}", "WARNING")
-                        except ValueError:
-                            self.log(f"⚠️  Ungültiges Signal-Format: {line}", "WARNING")
+                # Blockiert bis zur nächsten Zeile (Timeout 1 s) statt alle 100 ms zu pollen
+                line = self.serial_connection.readline()
+                received = time.perf_counter()
+                event = parse_line(line)
+                if event and event['type'] == 'clients':
+                    clients.record(event['value'], heartbeat=bool(event.get('hb')))
+                if clients.stale() != stale:
+                    stale = not stale
+                    if stale:
+                        self.log(f"⚠️  Keine Client-Meldung seit {time.time() - clients.last_seen:.0f} s "
+                                 f"(Heartbeat {self.client_heartbeat:g} s)", "WARNING")
                     else:
-                        self.log(f"📝 ESP32: {line}", "INFO")
-                
-                time.sleep(0.1)
+                        self.log("📶 Client-Meldungen wieder da", "INFO")
+                if event:
+                    suffix = ""
+                    if event['type'] in ('signal', 'clients'):
+                        # Duplikate und verspätete Pakete trotzdem zeigen - hier geht es ums Debuggen
+                        self.link_stats.observe(event, received)
+                        if self.link_stats.last_latency is not None:
+                            suffix = f" [+{self.link_stats.last_latency * 1000:.1f} ms]"
+                        if self.link_stats.last_status != NEW:
+                            suffix += f" [{self.link_stats.last_status}]"
+                        if 'ev' in event:
+                            # GIGA im Event-Modus: Zahl ist der Eingang, nicht die Seite
+                            signal = self.input_map.resolve(event['value'], event['ev'])
+                            edge = "gedrückt" if event['ev'] == PRESS else "losgelassen"
+                            suffix += (f" [{self.input_map.name(event['value'])} {edge} -> "
+                                       f"{f'Signal {signal}' if signal is not None else 'keine Aktion'}]")
+                    self.log_event(event, suffix)
                 
         except KeyboardInterrupt:
             self.log("Monitoring beendet", "INFO")
+            if self.link_stats.active:
+                self.log(f"📶 Funkstrecke: {self.link_stats.format_stats()}", "INFO")
         finally:
             if self.serial_connection:
                 self.serial_connection.close()
@@ -233,11 +357,51 @@ def main():
     parser = argparse.ArgumentParser(description="Bertrandt ESP32 CLI Tool")
     parser.add_argument("--esp32-port", default="/dev/ttyUSB0", help="ESP32 Serial Port")
     parser.add_argument("--giga-port", default="/dev/ttyACM0", help="Arduino GIGA Port")
-    parser.add_argument("--action", choices=["monitor", "flash-esp32", "flash-giga", "flash-both", "scan"], 
+    parser.add_argument("--action", choices=["monitor", "flash-esp32", "flash-giga", "flash-both", "scan", "fleet", "stalls", "broker", "listen", "profile"], 
                        default="monitor", help="Aktion ausführen")
+    parser.add_argument("--workers", type=int, default=4, help="Parallele Flash-Vorgänge (fleet)")
+    parser.add_argument("--report", default=None, help="Pfad für Provisionierungs-Report (fleet)")
+    parser.add_argument("--smoke-timeout", type=float, default=15, help="Sekunden für Serial-Smoke-Test (fleet)")
+    parser.add_argument("--socket", default=None, help="Unix-Socket des Brokers (broker/listen, Standard im Temp-Ordner)")
+    parser.add_argument("--udp-port", type=int, default=None, help="GIGA UDP-Pakete zusätzlich empfangen, z.B. 4210 (broker)")
+    parser.add_argument("--input-map", default=None, help="GIGA-Eingang -> Signal im Event-Modus, z.B. \"1=3,4:release=1\" (broker/monitor)")
+    parser.add_argument("--stall-log", default=None, help="UI-Stall Log der GUI (stalls, Standard wie die GUI)")
+    parser.add_argument("--last", type=int, default=5, help="Anzahl angezeigter Stalls mit Stack (stalls)")
+    parser.add_argument("--pid", type=int, default=None, help="PID der GUI (profile, sonst automatisch gesucht)")
+    client_series.add_arguments(parser)
+    metrics.add_arguments(parser)
+    log_setup.add_arguments(parser)
     
     args = parser.parse_args()
+    log_setup.setup_from_args(args)
+    metrics_exporter = metrics.start_from_args(args)
     
+    # Lang laufende Aktionen (broker, monitor, fleet) lassen sich ebenfalls per SIGUSR1 profilen
+    import sampling_profiler
+    profiler = sampling_profiler.SamplingProfiler()
+    sampling_profiler.install_signal_handler(lambda: toggle_profiler(profiler))
+    try:
+        run_action(args)
+    finally:
+        if metrics_exporter:
+            metrics_exporter.stop()
+        if profiler.running:
+            profiler.stop()
+            profiler.write()
+
+
+def toggle_profiler(profiler):
+    """SIGUSR1 im CLI-Prozess: Profiler starten bzw. stoppen und schreiben"""
+    path = profiler.toggle()
+    log = log_setup.get_logger('cli')
+    if path:
+        log.info("🔥 Profil geschrieben: %s", path)
+    else:
+        log.info("🔥 Profiler gestartet")
+
+
+def run_action(args):
+    """Gewählte Aktion ausführen"""
     cli = BertrandtCLI(args.esp32_port)
     
     print("🚀 Bertrandt ESP32 CLI Tool")
@@ -261,7 +425,26 @@ def main():
                 time.sleep(2)
                 cli.flash_esp32(args.esp32_port)
     
+    elif args.action == "fleet":
+        if cli.check_arduino_cli():
+            ok = cli.provision_fleet(args.workers, args.report, args.smoke_timeout)
+            sys.exit(0 if ok else 1)
+    
+    elif args.action == "stalls":
+        cli.show_stalls(args.stall_log, args.last)
+    
+    elif args.action == "broker":
+        cli.run_broker(args.socket, args.udp_port, InputMap.from_spec(args.input_map))
+    
+    elif args.action == "profile":
+        sys.exit(0 if cli.toggle_gui_profiler(args.pid) else 1)
+    
+    elif args.action == "listen":
+        cli.listen_broker(args.socket)
+    
     elif args.action == "monitor":
+        cli.input_map = InputMap.from_spec(args.input_map)
+        cli.client_heartbeat = args.client_heartbeat
         cli.monitor_signals()
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Import-Zeit der Einstiegsmodule (python -X importtime)
+Vergleicht optional mit einem älteren Git-Stand (--baseline <ref>)
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+
+# (Ordner relativ zu active_project, Modul)
+ENTRY_MODULES = [
+    ('Python_GUI', 'Bertrandt_GUI'),
+    ('.', 'cli_monitor'),
+    ('Python_GUI', 'kiosk_renderer'),
+]
+
+# Schwere Abhängigkeiten, die erst bei Bedarf geladen werden sollen
+HEAVY_MODULES = ['PIL.Image', 'PIL.ImageTk', 'serial', 'subprocess', 'asyncio', 'multiprocessing']
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def measure(project_dir, directory, module):
+    """(Gesamtzeit ms, {Modul: kumulierte ms}) eines Imports in frischem Prozess"""
+    code = f"import sys; sys.path.insert(0, {os.path.join(project_dir, directory)!r}); import {module}"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, cwd=os.path.join(project_dir, directory))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    cumulative = {}
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative[match.group(4)] = int(match.group(2)) / 1000
+        # Nur oberste Ebene (ohne Einrückung) summieren
+        if len(match.group(3)) == 1:
+            total_us += int(match.group(2))
+    return total_us / 1000, cumulative
+
+
+def bench(project_dir, rounds):
+    results = {}
+    for directory, module in ENTRY_MODULES:
+        if not os.path.exists(os.path.join(project_dir, directory, module + '.py')):
+            continue
+        runs = [measure(project_dir, directory, module) for _ in range(rounds)]
+        results[module] = (statistics.median(total for total, _ in runs), runs[-1][1])
+    return results
+
+
+def export_ref(ref, target):
+    """active_project eines Git-Stands in einen temporären Ordner entpacken"""
+    archive = subprocess.run(['git', 'archive', '--format=tar', ref, '.'],
+                             capture_output=True, check=True, cwd=PROJECT_DIR)
+    archive_path = os.path.join(target, 'ref.tar')
+    with open(archive_path, 'wb') as f:
+        f.write(archive.stdout)
+    with tarfile.open(archive_path) as tar:
+        tar.extractall(target)
+    return target
+
+
+def print_results(label, results):
+    print(f"\n{label}")
+    print(f"{'Modul':<16} {'Import ms':>10}   schwere Module beim Start")
+    for module, (total, cumulative) in results.items():
+        loaded = [name for name in HEAVY_MODULES if name in cumulative]
+        print(f"{module:<16} {total:>10.1f}   {', '.join(loaded) or '-'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bertrandt Import-Zeit Benchmark')
+    parser.add_argument('--rounds', type=int, default=7, help='Messungen pro Modul (Median)')
+    parser.add_argument('--baseline', default=None, help='Git-Stand zum Vergleich, z.B. HEAD~1')
+    args = parser.parse_args()
+
+    current = bench(PROJECT_DIR, args.rounds)
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline = bench(export_ref(args.baseline, temp_dir), args.rounds)
+        print_results(f"Vorher ({args.baseline})", baseline)
+    print_results("Aktuell", current)
+
+    if args.baseline:
+        print()
+        for module, (total, _) in current.items():
+            if module in baseline:
+                before = baseline[module][0]
+                print(f"{module:<16} {before:>8.1f} ms -> {total:>8.1f} ms ({(total - before) / before * 100:+.0f} %)")
+
+
+if __name__ == "__main__":
+    main()
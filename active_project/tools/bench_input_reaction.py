@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Reaktionszeit Taster -> Seitenwechsel-Event in der GUI ohne Hardware
+Eingangs-Simulator (Prellen, Störimpulse, Entprellung wie im GIGA-Sketch) -> UDP -> ESP32-Emulator
+-> Serial -> read_serial_data der GUI mit Eingangs-Zuordnung -> data_queue
+"""
+
+import argparse
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", "Python_GUI"))
+
+import serial
+
+from esp32_emulator import ESP32Emulator
+from gui_ingest import SignalIngestMixin
+from input_map import InputMap
+from input_simulator import DEFAULT_INPUTS, LEADING, TRAILING, InputSimulator
+from link_stats import LinkStats
+from load_generator import UdpSink
+
+# Alter GIGA-Sketch: Seiten 1..10 im 2-s-Takt - Wartezeit auf eine bestimmte Seite
+CYCLE_PAGES = 10
+CYCLE_INTERVAL = 2.0
+
+
+class SerialReader(SignalIngestMixin):
+    """Nur der Serial-Teil der GUI - read_serial_data unverändert"""
+
+    def __init__(self, port, input_map):
+        self.serial_connection = serial.Serial(port, 115200, timeout=1)
+        self.data_queue = queue.Queue()
+        self.running = True
+        self.link_stats = LinkStats('serial')
+        self.input_map = input_map
+
+
+def bench(debounce, presses, rate, glitch_ratio, seed):
+    emulator = ESP32Emulator(udp_port=0, client_interval=3600)
+    port = emulator.start()
+    reader = SerialReader(port, InputMap())
+    thread = threading.Thread(target=reader.read_serial_data, name='serial-reader', daemon=True)
+    thread.start()
+
+    arrivals = []
+
+    def consume():
+        while reader.running:
+            try:
+                data_type, _, _ = reader.data_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            # 'Clients: N' beim Start des Emulators gehört zu keinem Paket
+            if data_type == 'signal':
+                arrivals.append(time.perf_counter())
+    consumer = threading.Thread(target=consume, name='bench-consumer', daemon=True)
+    consumer.start()
+
+    sink = UdpSink(*emulator.udp_address, ack=True)
+    inputs = [dict(config, debounce=debounce) for config in DEFAULT_INPUTS]
+    simulator = InputSimulator(sink, inputs, seed=seed)
+    simulator.visitors(presses / rate * 60, rate, glitch_ratio, start=time.perf_counter() + 0.2)
+    try:
+        simulator.run(until_idle=True)
+        expected = sum(1 for report in simulator.reports if report['active'])
+        deadline = time.perf_counter() + 2.0
+        while len(arrivals) < expected and time.perf_counter() < deadline:
+            time.sleep(0.05)
+    finally:
+        reader.running = False
+        thread.join(timeout=2)
+        consumer.join(timeout=1)
+        reader.serial_connection.close()
+        sink.close()
+        emulator.stop()
+
+    # Loslassen löst ohne Zuordnung nichts aus - n-tes Event gehört zur n-ten Drück-Meldung
+    pressed = [report for report in simulator.reports if report['active']]
+    reactions = [arrived - report['pressed_at'] for report, arrived in zip(pressed, arrivals)
+                 if report['pressed_at'] is not None]
+    return reactions, simulator.summary(), expected - len(arrivals)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bertrandt Reaktionszeit-Benchmark (Eingänge im Event-Modus)')
+    parser.add_argument('--presses', type=int, default=100, help='Betätigungen je Durchlauf')
+    parser.add_argument('--rate', type=float, default=240, help='Betätigungen pro Minute')
+    parser.add_argument('--glitches', type=float, default=0.1, help='Anteil Störimpulse')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'Entprellung':>12} {'Betätigt':>9} {'Störung':>8} {'gemeldet':>9} {'falsch':>7} {'fehlt':>6} "
+          f"{'Ø ms':>7} {'Median':>7} {'p95':>7} {'max':>7}")
+    for debounce in (LEADING, TRAILING):
+        reactions, summary, missing = bench(debounce, args.presses, args.rate, args.glitches, args.seed)
+        ms = sorted(value * 1000 for value in reactions) or [0.0]
+        p95 = ms[max(0, int(len(ms) * 0.95) - 1)]
+        print(f"{debounce:>12} {summary['presses']:>9} {summary['glitches']:>8} {summary['reported']:>9} "
+              f"{summary['false_triggers']:>7} {missing:>6} {statistics.mean(ms):>7.1f} "
+              f"{statistics.median(ms):>7.1f} {p95:>7.1f} {ms[-1]:>7.1f}")
+    cycle = CYCLE_PAGES * CYCLE_INTERVAL
+    print(f"{'Zyklus 2 s':>12}  (alter Sketch) Wartezeit auf eine bestimmte Seite Ø {cycle / 2 * 1000:.0f} ms, "
+          f"max {cycle * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Seitenwechsel-Zeit der GUI-Renderer (widgets vs. canvas)
+Misst load_content_page inkl. Layout/Zeichnen (update_idletasks) - benötigt ein Display
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", "Python_GUI"))
+
+from Bertrandt_GUI import BertrandtGUI, RENDERERS
+
+
+def bench_renderer(renderer, rounds):
+    """Alle 10 Seiten rounds-mal durchschalten, Zeit pro Wechsel in ms"""
+    # Nicht existierender Port -> Dev Mode ohne Hardware
+    app = BertrandtGUI(esp32_port='/dev/bertrandt-bench', renderer=renderer)
+    try:
+        app.root.update()
+        app.stop_auto_demo()
+
+        timings = []
+        page_ids = list(app.signal_definitions)
+        for _ in range(rounds):
+            for page_id in page_ids:
+                start = time.perf_counter()
+                app.load_content_page(page_id)
+                app.root.update_idletasks()
+                timings.append((time.perf_counter() - start) * 1000)
+        return timings
+    finally:
+        app.shutdown()
+        app.root.destroy()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bertrandt Renderer Benchmark')
+    parser.add_argument('--rounds', type=int, default=20, help='Durchläufe über alle Seiten')
+    parser.add_argument('--renderer', choices=RENDERERS, action='append',
+                        help='Nur bestimmte Renderer messen (mehrfach möglich)')
+    args = parser.parse_args()
+
+    print(f"{'Renderer':<10} {'Wechsel':>8} {'Ø ms':>8} {'Median':>8} {'p95':>8} {'max':>8}")
+    for renderer in args.renderer or RENDERERS:
+        timings = sorted(bench_renderer(renderer, args.rounds))
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f"{renderer:<10} {len(timings):>8} {statistics.mean(timings):>8.2f} "
+              f"{statistics.median(timings):>8.2f} {p95:>8.2f} {timings[-1]:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: UDP-Paket -> ESP32 (Emulator) -> Serial -> data_queue der GUI
+Läuft ohne Hardware und ohne Display: read_serial_data der GUI liest vom pty des Emulators,
+gemessen wird die Zeit vom Senden des UDP-Pakets bis zum Event in der Queue. Zusätzlich die
+Link-Latenz aus den rx-Zeitstempeln der Firmware (--legacy: alte Firmware mit delay(50)).
+"""
+
+import argparse
+import os
+import queue
+import socket
+import statistics
+import sys
+import threading
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, "..", "Python_GUI"))
+
+import serial
+
+from esp32_emulator import LEGACY_LOOP_DELAY_MS, ESP32Emulator
+from gui_ingest import SignalIngestMixin
+from input_map import InputMap
+from link_stats import LinkStats
+
+
+class SerialReader(SignalIngestMixin):
+    """Nur der Serial-Teil der GUI - read_serial_data unverändert"""
+
+    def __init__(self, port):
+        self.serial_connection = serial.Serial(port, 115200, timeout=1)
+        self.data_queue = queue.Queue()
+        self.running = True
+        self.link_stats = LinkStats('serial')
+        self.input_map = InputMap()
+
+
+def bench(rate, count, legacy, baud):
+    emulator = ESP32Emulator(udp_port=0, client_interval=3600, legacy=legacy, baud=baud)
+    port = emulator.start()
+    reader = SerialReader(port)
+    thread = threading.Thread(target=reader.read_serial_data, name='serial-reader', daemon=True)
+    thread.start()
+
+    # Eigener Konsument, damit das Takten der Sendeschleife nicht in die Latenz eingeht
+    arrivals = []
+
+    def consume():
+        while reader.running:
+            try:
+                data_type, _, _ = reader.data_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            # 'Clients: N' beim Start des Emulators gehört zu keinem Paket
+            if data_type == 'signal':
+                arrivals.append(time.perf_counter())
+    consumer = threading.Thread(target=consume, name='bench-consumer', daemon=True)
+    consumer.start()
+
+    sent = []
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    started = time.perf_counter()
+    try:
+        for index in range(count):
+            # Gleichmäßig takten, fällige Pakete aber nicht auslassen
+            delay = started + index / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            sent.append(time.perf_counter())
+            sock.sendto(str(index % 10 + 1).encode(), emulator.udp_address)
+
+        # Nachzügler abholen (Pakete warten evtl. noch im Socket-Puffer des Emulators)
+        backlog = count * LEGACY_LOOP_DELAY_MS / 1000 if legacy else 0
+        deadline = time.perf_counter() + max(2.0, backlog + 1)
+        while len(arrivals) < count and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        duration = (arrivals[-1] if arrivals else time.perf_counter()) - started
+    finally:
+        reader.running = False
+        thread.join(timeout=2)
+        consumer.join(timeout=1)
+        reader.serial_connection.close()
+        emulator.stop()
+        sock.close()
+    # UDP über localhost und Serial halten die Reihenfolge - n-tes Event gehört zum n-ten Paket
+    latencies = [arrived - sent_at for sent_at, arrived in zip(sent, arrivals)]
+    return latencies, count - len(arrivals), duration, reader.link_stats.latency.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bertrandt Serial End-to-End Benchmark (ESP32-Emulator)')
+    parser.add_argument('--rate', type=float, action='append', help='Pakete pro Sekunde (mehrfach möglich)')
+    parser.add_argument('--count', type=int, default=200, help='Pakete je Rate')
+    parser.add_argument('--legacy', action='store_true', help='Alte Firmware: delay(50), ein Paket je loop()')
+    parser.add_argument('--baud', type=int, default=115200, help='UART-Zeit nachbilden (0 = aus)')
+    args = parser.parse_args()
+
+    print(f"{'Rate/s':>8} {'Events':>7} {'fehlt':>6} {'Ø ms':>8} {'Median':>8} {'p95':>8} {'max':>8} {'Events/s':>9} {'Link p95':>9}")
+    for rate in args.rate or [5, 20, 100]:
+        latencies, missing, duration, link = bench(rate, args.count, args.legacy, args.baud or None)
+        ms = sorted(value * 1000 for value in latencies) or [0.0]
+        p95 = ms[max(0, int(len(ms) * 0.95) - 1)]
+        print(f"{rate:>8.0f} {len(latencies):>7} {missing:>6} {statistics.mean(ms):>8.1f} "
+              f"{statistics.median(ms):>8.1f} {p95:>8.1f} {ms[-1]:>8.1f} {len(latencies) / duration:>9.1f} "
+              f"{link['p95_ms'] if link['count'] else '-':>9}")
+
+
+if __name__ == "__main__":
+    main()